@@ -0,0 +1,24 @@
+<?php
+// Serve bundle dari assets/dist (dibuat oleh assets/build_assets.py).
+// Nama file mengandung hash isi, jadi boleh di-cache selamanya oleh browser.
+$file = $_GET['f'] ?? '';
+if (!preg_match('/^app\.([0-9a-f]{12})\.(css|js)$/', $file, $match)
+    || !is_file($path = __DIR__ . '/assets/dist/' . $file)) {
+    http_response_code(404);
+    exit;
+}
+
+$etag = '"' . $match[1] . '"';
+header('Cache-Control: public, max-age=31536000, immutable');
+header('ETag: ' . $etag);
+header('Content-Type: ' . ($match[2] === 'css' ? 'text/css' : 'application/javascript') . '; charset=utf-8');
+
+if (trim($_SERVER['HTTP_IF_NONE_MATCH'] ?? '') === $etag) {
+    http_response_code(304);
+    exit;
+}
+
+if (extension_loaded('zlib')) {
+    ob_start('ob_gzhandler');
+}
+readfile($path);
@@ -0,0 +1,187 @@
+"""
+build_assets.py - Bundle asset statis (jQuery, Bootstrap, DataTables, style.css)
+
+Vendor file di-download sekali ke assets/vendor/ (versi sama dengan tag CDN
+sebelumnya) dan diverifikasi terhadap checksum di assets/vendor.lock.json
+(format SRI, mis. sha384-...). File tanpa checksum atau dengan isi berbeda
+membuat build gagal, tidak pernah di-bundle diam-diam. Hasilnya digabung dan
+di-minify menjadi assets/dist/app.<hash>.css dan app.<hash>.js. manifest.json
+dibaca oleh style_script() di functions.php, file-nya di-serve oleh asset.php
+dengan Cache-Control immutable + ETag.
+
+Usage:
+    python assets/build_assets.py            # download vendor yang belum ada, verifikasi, build
+    python assets/build_assets.py --offline  # hanya pakai assets/vendor/ yang sudah ada
+    python assets/build_assets.py --pin      # catat checksum vendor saat ini ke vendor.lock.json
+"""
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+import sys
+import urllib.error
+import urllib.request
+
+ASSETS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(ASSETS_DIR)
+VENDOR_DIR = os.path.join(ASSETS_DIR, 'vendor')
+DIST_DIR = os.path.join(ASSETS_DIR, 'dist')
+MANIFEST_PATH = os.path.join(DIST_DIR, 'manifest.json')
+LOCK_PATH = os.path.join(ASSETS_DIR, 'vendor.lock.json')
+
+# Panjang hash di nama file (cukup untuk cache busting)
+HASH_LENGTH = 12
+
+# Urutan sama dengan tag CDN sebelumnya: jQuery sebelum plugin, bootstrap sebelum DataTables
+VENDOR_FILES = [
+    ('bootstrap.min.css', 'https://cdn.jsdelivr.net/npm/bootstrap@4.6.0/dist/css/bootstrap.min.css'),
+    ('dataTables.bootstrap4.min.css', 'https://cdn.datatables.net/1.10.20/css/dataTables.bootstrap4.min.css'),
+    ('jquery-3.5.1.min.js', 'https://code.jquery.com/jquery-3.5.1.min.js'),
+    ('bootstrap.bundle.min.js', 'https://cdn.jsdelivr.net/npm/bootstrap@4.6.0/dist/js/bootstrap.bundle.min.js'),
+    ('jquery.dataTables.min.js', 'https://cdn.datatables.net/1.10.20/js/jquery.dataTables.min.js'),
+    ('dataTables.bootstrap4.min.js', 'https://cdn.datatables.net/1.10.20/js/dataTables.bootstrap4.min.js'),
+]
+# CSS aplikasi sendiri, di-minify; ditaruh paling depan seperti <link> style.css
+# sebelumnya (sebelum bootstrap), supaya cascade tidak berubah
+APP_CSS = [os.path.join(ROOT_DIR, 'style.css')]
+
+# Algoritma checksum untuk --pin (sama dengan atribut integrity di tag <script>/<link>)
+PIN_ALGORITHM = 'sha384'
+
+_SOURCE_MAP = re.compile(r'/\*# sourceMappingURL=[^*]*\*/|//# sourceMappingURL=\S*')
+
+
+class IntegrityError(Exception):
+    """Vendor file tidak cocok dengan (atau belum punya) checksum di vendor.lock.json"""
+
+
+def integrity(content, algorithm=PIN_ALGORITHM):
+    """Checksum format SRI: '<algoritma>-<base64 digest>'"""
+    digest = hashlib.new(algorithm, content).digest()
+    return f"{algorithm}-{base64.b64encode(digest).decode('ascii')}"
+
+
+def load_lock():
+    if not os.path.exists(LOCK_PATH):
+        return {}
+    with open(LOCK_PATH) as f:
+        return json.load(f)
+
+
+def verify(name, content, lock):
+    """Raise IntegrityError jika content bukan versi yang di-pin untuk name"""
+    expected = lock.get(name)
+    if not expected:
+        raise IntegrityError(f"{name} belum di-pin di {os.path.basename(LOCK_PATH)} "
+                             "(jalankan --pin sekali, review, lalu commit)")
+    algorithm = expected.split('-', 1)[0]
+    actual = integrity(content, algorithm)
+    if actual != expected:
+        raise IntegrityError(f"{name}: checksum {actual} tidak cocok dengan pin {expected}")
+
+
+def fetch_vendor(offline=False, check=True):
+    """Download vendor file yang belum ada di assets/vendor/ lalu verifikasi checksum-nya"""
+    os.makedirs(VENDOR_DIR, exist_ok=True)
+    lock = load_lock()
+    for name, url in VENDOR_FILES:
+        path = os.path.join(VENDOR_DIR, name)
+        missing = not os.path.exists(path)
+        if missing and offline:
+            raise FileNotFoundError(f"{path} tidak ada (jalankan tanpa --offline sekali)")
+        if missing:
+            print(f"  Download {url}")
+            with urllib.request.urlopen(url, timeout=30) as response:
+                content = response.read()
+        else:
+            with open(path, 'rb') as f:
+                content = f.read()
+        if check:
+            # Diverifikasi sebelum ditulis: file yang salah tidak tertinggal di vendor/
+            verify(name, content, lock)
+        if missing:
+            with open(path, 'wb') as f:
+                f.write(content)
+
+
+def pin_vendor(offline=False):
+    """Tulis checksum vendor file saat ini ke vendor.lock.json; return dict lock"""
+    fetch_vendor(offline, check=False)
+    lock = {}
+    for name, _ in VENDOR_FILES:
+        with open(os.path.join(VENDOR_DIR, name), 'rb') as f:
+            lock[name] = integrity(f.read())
+        print(f"  ✓ {name}: {lock[name]}")
+    with open(LOCK_PATH, 'w') as f:
+        json.dump(lock, f, indent=2)
+        f.write('\n')
+    return lock
+
+
+def minify_css(css):
+    """Minify sederhana: buang komentar dan whitespace di sekitar token CSS"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+def _read(path):
+    with open(path, encoding='utf-8') as f:
+        # Source map tidak ikut di-bundle, hapus referensinya supaya tidak 404
+        return _SOURCE_MAP.sub('', f.read()).strip()
+
+
+def _bundle(kind):
+    parts = [_read(os.path.join(VENDOR_DIR, name)) for name, _ in VENDOR_FILES if name.endswith('.' + kind)]
+    if kind == 'css':
+        parts = [minify_css(_read(path)) for path in APP_CSS] + parts
+        return '\n'.join(parts) + '\n'
+    # ';' menjaga file yang tidak diakhiri titik koma tidak tergabung dengan file berikutnya
+    return ';\n'.join(parts) + ';\n'
+
+
+def build(offline=False):
+    """Build bundle dan tulis manifest; return dict manifest"""
+    fetch_vendor(offline)
+    os.makedirs(DIST_DIR, exist_ok=True)
+
+    manifest = {}
+    for kind in ('css', 'js'):
+        content = _bundle(kind).encode('utf-8')
+        digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+        name = f"app.{digest}.{kind}"
+        with open(os.path.join(DIST_DIR, name), 'wb') as f:
+            f.write(content)
+        manifest[kind] = name
+        print(f"  ✓ {name} ({len(content) / 1024:.1f} KB)")
+
+    # Hapus bundle lama supaya dist/ tidak menumpuk
+    for name in os.listdir(DIST_DIR):
+        if name.startswith('app.') and name not in manifest.values():
+            os.remove(os.path.join(DIST_DIR, name))
+
+    with open(MANIFEST_PATH, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build bundle asset statis DamnCRUD")
+    parser.add_argument('--offline', action='store_true', help="Jangan download vendor file")
+    parser.add_argument('--pin', action='store_true',
+                        help="Catat checksum vendor file saat ini ke vendor.lock.json (tanpa build)")
+    args = parser.parse_args()
+
+    print("Pinning vendor files..." if args.pin else "Building static assets...")
+    try:
+        if args.pin:
+            pin_vendor(args.offline)
+        else:
+            build(args.offline)
+    except (OSError, urllib.error.URLError, IntegrityError) as e:
+        print(f"✗ Build gagal: {e}")
+        sys.exit(1)
+    print(f"✓ Lock: {LOCK_PATH}" if args.pin else f"✓ Manifest: {MANIFEST_PATH}")
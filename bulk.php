@@ -0,0 +1,92 @@
+<?php
+include 'functions.php';
+session_start();
+header('Content-Type: application/json');
+if (!isset($_SESSION['user'])) {
+    http_response_code(401);
+    echo json_encode(['error' => 'Not logged in']);
+    exit;
+}
+
+// Bulk delete/update contacts terpilih: satu statement WHERE id IN (...) dalam
+// satu transaksi, hasil JSON ringkas supaya tabel cukup di-draw ulang (tanpa reload).
+// POST action=delete|update, ids=1,2,3 (atau ids[]=...), untuk update: phone dan/atau title
+$max_ids = 50000;  // placeholder MySQL maksimal 65535 per statement
+$bulk_fields = ['phone', 'title'];
+
+function bulk_error($status, $message){
+    http_response_code($status);
+    echo json_encode(['error' => $message]);
+    exit;
+}
+
+if ($_SERVER['REQUEST_METHOD'] !== 'POST') {
+    bulk_error(405, 'POST only');
+}
+$input = $_POST;
+if (strpos($_SERVER['CONTENT_TYPE'] ?? '', 'application/json') === 0) {
+    $input = json_decode(file_get_contents('php://input'), true) ?: [];
+}
+
+$action = $input['action'] ?? '';
+$ids = $input['ids'] ?? [];
+$ids = is_array($ids) ? $ids : explode(',', (string) $ids);
+$ids = array_values(array_unique(array_filter(array_map('intval', $ids), function ($id) {
+    return $id > 0;
+})));
+if (!$ids) {
+    bulk_error(400, 'No ids');
+}
+if (count($ids) > $max_ids) {
+    bulk_error(400, 'Too many ids (max ' . $max_ids . ')');
+}
+
+$placeholders = implode(', ', array_fill(0, count($ids), '?'));
+if ($action === 'delete') {
+    $sql = "DELETE FROM contacts WHERE id IN ($placeholders)";
+    $params = $ids;
+} elseif ($action === 'update') {
+    $set = [];
+    $params = [];
+    foreach ($bulk_fields as $field) {
+        if (isset($input[$field]) && trim($input[$field]) !== '') {
+            if (mb_strlen(trim($input[$field])) > 255) {
+                bulk_error(400, $field . ' lebih dari 255 karakter');
+            }
+            $set[] = "$field = ?";
+            $params[] = trim($input[$field]);
+        }
+    }
+    if (!$set) {
+        bulk_error(400, 'Nothing to update (' . implode(', ', $bulk_fields) . ')');
+    }
+    $sql = 'UPDATE contacts SET ' . implode(', ', $set) . " WHERE id IN ($placeholders)";
+    $params = array_merge($params, $ids);
+} else {
+    bulk_error(400, 'Unknown action');
+}
+
+$started = microtime(true);
+$pdo = pdo_connect();
+$pdo->setAttribute(PDO::ATTR_ERRMODE, PDO::ERRMODE_EXCEPTION);
+$pdo->beginTransaction();
+try {
+    $stmt = $pdo->prepare($sql);
+    $stmt->execute($params);
+    // Untuk update: jumlah row yang benar-benar berubah (nilai sama tidak dihitung MySQL)
+    $affected = $stmt->rowCount();
+    $pdo->commit();
+} catch (PDOException $exception) {
+    $pdo->rollBack();
+    bulk_error(500, 'Database error');
+}
+if ($affected) {
+    contacts_changed($pdo);
+}
+
+echo json_encode([
+    'action' => $action,
+    'requested' => count($ids),
+    'affected' => $affected,
+    'ms' => round((microtime(true) - $started) * 1000, 1),
+]);
@@ -0,0 +1,106 @@
+<?php
+include 'functions.php';
+session_start();
+header('Content-Type: application/json');
+if (!isset($_SESSION['user'])) {
+    http_response_code(401);
+    echo json_encode(['error' => 'Not logged in']);
+    exit;
+}
+
+// DataTables server-side processing: paging, ordering, global search, range created
+$columns = ['id', 'name', 'email', 'phone', 'title', 'created'];
+$draw = (int) ($_GET['draw'] ?? 0);
+$start = max(0, (int) ($_GET['start'] ?? 0));
+$length = (int) ($_GET['length'] ?? 10);
+if ($length < 1 || $length > 1000) {
+    $length = $length == -1 ? 1000 : 10;
+}
+$order_column = $columns[(int) ($_GET['order'][0]['column'] ?? 0)] ?? 'id';
+$order_dir = strtolower($_GET['order'][0]['dir'] ?? 'asc') === 'desc' ? 'DESC' : 'ASC';
+$search = trim($_GET['search']['value'] ?? '');
+$created_from = trim($_GET['created_from'] ?? '');
+$created_to = trim($_GET['created_to'] ?? '');
+
+$pdo = pdo_connect();
+// Response hanya bergantung pada parameter request dan isi contacts; counter draw
+// DataTables dan cache-buster _ jQuery berubah setiap request tanpa mengubah data
+$vary = $_GET;
+unset($vary['draw'], $vary['_']);
+conditional_get($pdo, json_encode($vary));
+
+list($filter, $filter_params) = contacts_filter($pdo, $search, $created_from, $created_to);
+$filter_key = md5($search . '|' . $created_from . '|' . $created_to);
+
+$count = function ($where, $params) use ($pdo) {
+    $stmt = $pdo->prepare('SELECT COUNT(*) FROM contacts' . ($where ? ' WHERE ' . $where : ''));
+    $stmt->execute($params);
+    return (int) $stmt->fetchColumn();
+};
+$total = cache_remember($pdo, 'contacts_total', 10, function () use ($count) {
+    return $count('', []);
+});
+$filtered = $filter === '' ? $total : cache_remember($pdo, 'contacts_filtered:' . $filter_key, 10, function () use ($count, $filter, $filter_params) {
+    return $count($filter, $filter_params);
+});
+
+// Keyset pagination: jika halaman sebelumnya sudah diambil dengan urutan dan
+// search yang sama, lanjutkan dari baris terakhirnya daripada OFFSET besar.
+// Batas halaman hanya valid untuk versi contacts (database) yang sama
+$generation = contacts_generation($pdo);
+$keyset_key = md5($generation . '|' . $order_column . '|' . $order_dir . '|' . $filter_key);
+$boundary = $start > 0 && $generation !== null ? ($_SESSION['dt_keyset'][$keyset_key][$start] ?? null) : null;
+
+$where = $filter ? [$filter] : [];
+$params = $filter_params;
+if ($boundary) {
+    $cmp = $order_dir === 'ASC' ? '>' : '<';
+    if ($order_column === 'id') {
+        $where[] = "id $cmp ?";
+        $params[] = $boundary['id'];
+    } else {
+        $where[] = "($order_column $cmp ? OR ($order_column = ? AND id $cmp ?))";
+        array_push($params, $boundary['value'], $boundary['value'], $boundary['id']);
+    }
+}
+
+$sql = 'SELECT id, name, email, phone, title, created FROM contacts'
+    . ($where ? ' WHERE ' . implode(' AND ', $where) : '')
+    . " ORDER BY $order_column $order_dir" . ($order_column !== 'id' ? ", id $order_dir" : '')
+    . ' LIMIT ' . $length . ($boundary ? '' : ' OFFSET ' . $start);
+$stmt = $pdo->prepare($sql);
+$stmt->execute($params);
+$contacts = $stmt->fetchAll(PDO::FETCH_ASSOC);
+
+if ($contacts && $generation !== null) {
+    $last = end($contacts);
+    $keysets = $_SESSION['dt_keyset'][$keyset_key] ?? [];
+    $keysets[$start + $length] = ['value' => $last[$order_column], 'id' => $last['id']];
+    // Simpan hanya beberapa batas halaman terakhir per kombinasi urutan/search
+    $_SESSION['dt_keyset'] = [$keyset_key => array_slice($keysets, -20, null, true)]
+        + array_slice($_SESSION['dt_keyset'] ?? [], 0, 10, true);
+}
+session_write_close();
+
+$data = [];
+foreach ($contacts as $contact) {
+    $data[] = [
+        $contact['id'],
+        $contact['name'],
+        $contact['email'],
+        $contact['phone'],
+        $contact['title'],
+        $contact['created'],
+        '<input type="checkbox" class="select-contact mr-1" value="' . $contact['id'] . '" aria-label="Select"> '
+        . '<a type="button" class="btn btn-sm btn-outline btn-success" href="update.php?id=' . $contact['id'] . '" class="edit">edit</a> '
+        . '<a type="button" class="btn btn-sm btn-outline btn-danger" href="delete.php?id=' . $contact['id'] . '" class="trash" onclick="return confirm(\'Damn, what r u doin\\\'? Are you sure?\');">delete</a>',
+    ];
+}
+
+// draw hanya dikembalikan jika dikirim: dashboard tidak mengirimnya supaya response
+// (juga dari 304) tidak ditolak DataTables sebagai draw lama
+echo json_encode(($draw ? ['draw' => $draw] : []) + [
+    'recordsTotal' => $total,
+    'recordsFiltered' => $filtered,
+    'data' => $data,
+]);
@@ -15,6 +15,7 @@ if (!isset($_SESSION['user'])) {
         // Insert new record into the contacts table
         $stmt = $pdo->prepare('INSERT INTO contacts VALUES (?, ?, ?, ?, ?, ?)');
         $stmt->execute([$id, $name, $email, $phone, $title, $created]);
+        contacts_changed($pdo);
         header("location:index.php");
     }
     ?>
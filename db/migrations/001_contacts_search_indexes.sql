@@ -0,0 +1,14 @@
+-- --------------------------------------------------------
+-- Migration 001: index untuk search, ordering, dan filter created
+-- --------------------------------------------------------
+
+-- Global search DataTables (MATCH ... AGAINST di contacts_data.php)
+ALTER TABLE `contacts` ADD FULLTEXT INDEX `ft_contacts_search` (`name`, `email`, `phone`, `title`);
+
+-- Ordering + keyset pagination per kolom (InnoDB menambahkan id ke setiap secondary index)
+ALTER TABLE `contacts`
+  ADD INDEX `idx_contacts_name` (`name`),
+  ADD INDEX `idx_contacts_email` (`email`),
+  ADD INDEX `idx_contacts_phone` (`phone`),
+  ADD INDEX `idx_contacts_title` (`title`),
+  ADD INDEX `idx_contacts_created` (`created`);
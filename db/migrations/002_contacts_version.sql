@@ -0,0 +1,16 @@
+-- --------------------------------------------------------
+-- Migration 002: versi tabel contacts untuk conditional GET (ETag/304)
+-- --------------------------------------------------------
+
+-- Satu row (id = 1); version dinaikkan sekali per write oleh writer, bukan trigger per row:
+-- contacts_changed() di functions.php (create, update, delete, bulk, import) dan
+-- bump_contacts_version() di tests/contact_repository.py. Write lain di luar aplikasi
+-- (mysql CLI, script) harus menjalankan UPDATE yang sama supaya ETag dan cache count berubah:
+--   UPDATE contacts_version SET version = version + 1, updated = current_timestamp(6) WHERE id = 1;
+CREATE TABLE IF NOT EXISTS `contacts_version` (
+  `id` tinyint(1) NOT NULL PRIMARY KEY,
+  `version` bigint(20) UNSIGNED NOT NULL DEFAULT 0,
+  `updated` timestamp(6) NOT NULL DEFAULT current_timestamp(6)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8;
+
+INSERT INTO `contacts_version` (`id`, `version`, `updated`) VALUES (1, 1, current_timestamp(6));
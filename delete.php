@@ -9,6 +9,7 @@ if (!isset($_SESSION['user'])) {
     if (isset($_GET['id'])) {
         $stmt = $pdo->prepare('DELETE FROM contacts WHERE id = ?');
         $stmt->execute([$_GET['id']]);
+        contacts_changed($pdo);
         header("location:index.php");
     } else {
         die ('No ID specified!');
@@ -0,0 +1,72 @@
+<?php
+include 'functions.php';
+session_start();
+if (!isset($_SESSION['user'])) {
+    http_response_code(401);
+    header('Content-Type: text/plain');
+    echo 'Not logged in';
+    exit;
+}
+
+// Export seluruh contacts (urut id) sebagai CSV atau NDJSON, di-stream per chunk.
+// Query unbuffered: baris dibaca dari MySQL satu per satu, memory tetap kecil
+// berapapun ukuran tabel. after_id melanjutkan export yang terputus (keyset).
+$format = ($_GET['format'] ?? 'csv') === 'ndjson' ? 'ndjson' : 'csv';
+$after_id = max(0, (int) ($_GET['after_id'] ?? 0));
+$search = trim($_GET['search'] ?? '');
+$created_from = trim($_GET['created_from'] ?? '');
+$created_to = trim($_GET['created_to'] ?? '');
+
+$pdo = pdo_connect();
+conditional_get($pdo, json_encode($_GET));
+// Filter dihitung sebelum query unbuffered (bisa menjalankan query lain di koneksi yang sama)
+list($filter, $params) = contacts_filter($pdo, $search, $created_from, $created_to);
+// Export bisa lama: jangan kunci session untuk request lain dari user yang sama
+session_write_close();
+
+$where = ['id > ?'];
+array_unshift($params, $after_id);
+if ($filter) {
+    $where[] = $filter;
+}
+
+$pdo->setAttribute(PDO::MYSQL_ATTR_USE_BUFFERED_QUERY, false);
+$stmt = $pdo->prepare('SELECT id, name, email, phone, title, created FROM contacts WHERE '
+    . implode(' AND ', $where) . ' ORDER BY id');
+$stmt->execute($params);
+
+set_time_limit(0);
+ini_set('zlib.output_compression', '0');
+while (ob_get_level() > 0) {
+    ob_end_clean();
+}
+header('Content-Type: ' . ($format === 'csv' ? 'text/csv' : 'application/x-ndjson') . '; charset=utf-8');
+header('Content-Disposition: attachment; filename="contacts.' . $format . '"');
+header('X-Accel-Buffering: no');
+
+// Output dikumpulkan per ~64 KB lalu dikirim; flush() setiap 1000 baris
+ob_start(null, 65536);
+$out = fopen('php://output', 'w');
+if ($format === 'csv') {
+    fputcsv($out, ['id', 'name', 'email', 'phone', 'title', 'created']);
+}
+$rows = 0;
+while ($contact = $stmt->fetch(PDO::FETCH_ASSOC)) {
+    if ($format === 'csv') {
+        fputcsv($out, $contact);
+    } else {
+        $contact['id'] = (int) $contact['id'];
+        fwrite($out, json_encode($contact, JSON_UNESCAPED_UNICODE | JSON_UNESCAPED_SLASHES) . "\n");
+    }
+    if (++$rows % 1000 === 0) {
+        ob_flush();
+        flush();
+        if (connection_aborted()) {
+            break;
+        }
+    }
+}
+$stmt->closeCursor();
+fclose($out);
+ob_end_flush();
+flush();
@@ -1,23 +1,346 @@
 <?php
 
+function env_or($name, $default){
+    // Konfigurasi dari environment server (SetEnv Apache, atau env php -S di test suite)
+    $value = getenv($name);
+    return $value === false ? $default : $value;
+}
+
 function pdo_connect(){
-    $DATABASE_HOST = 'localhost';
-    $DATABASE_USER = 'root';
-    $DATABASE_PASS = '';  // XAMPP default: empty password
-    $DATABASE_NAME = 'damncrud';  // Database dari damncrud.sql
+    $DATABASE_HOST = env_or('DAMNCRUD_DB_HOST', 'localhost');
+    $DATABASE_PORT = env_or('DAMNCRUD_DB_PORT', '3306');
+    $DATABASE_USER = env_or('DAMNCRUD_DB_USER', 'root');
+    $DATABASE_PASS = env_or('DAMNCRUD_DB_PASS', '');  // XAMPP default: empty password
+    $DATABASE_NAME = database_name();  // Database dari damncrud.sql
     try {
-    	return new PDO('mysql:host=' . $DATABASE_HOST . ';dbname=' . $DATABASE_NAME, $DATABASE_USER, $DATABASE_PASS);
+    	return new PDO('mysql:host=' . $DATABASE_HOST . ';port=' . $DATABASE_PORT . ';dbname=' . $DATABASE_NAME, $DATABASE_USER, $DATABASE_PASS);
     } catch (PDOException $exception) {
     	die ('Failed to connect to database!');
     }
 }
 
+function database_name(){
+    // Test suite (APP_SERVER=php): setiap pytest-xdist worker menjalankan php -S sendiri
+    // dengan DAMNCRUD_DB_NAME database worker (damncrud_gw0, ...)
+    return env_or('DAMNCRUD_DB_NAME', 'damncrud');
+}
+
+function cache_remember($pdo, $key, $ttl, $compute){
+    // Cache kecil untuk hasil query mahal (COUNT); APCu jika ada, fallback ke session.
+    // Key memakai versi contacts dari database, jadi write dari session/proses lain juga
+    // membuat cache basi; tanpa versi (migration belum jalan) tidak di-cache
+    $generation = contacts_generation($pdo);
+    if ($generation === null) {
+        return $compute();
+    }
+    $key = database_name() . ':' . $generation . ':' . $key;
+    if (function_exists('apcu_fetch')) {
+        $value = apcu_fetch($key, $found);
+        if (!$found) {
+            $value = $compute();
+            apcu_store($key, $value, $ttl);
+        }
+        return $value;
+    }
+    if (isset($_SESSION['cache'][$key]) && $_SESSION['cache'][$key][0] > time()) {
+        return $_SESSION['cache'][$key][1];
+    }
+    $value = $compute();
+    $_SESSION['cache'] = [$key => [time() + $ttl, $value]] + ($_SESSION['cache'] ?? []);
+    $_SESSION['cache'] = array_slice($_SESSION['cache'], 0, 50, true);
+    return $value;
+}
+
+function contacts_generation($pdo, $forget = false){
+    // Versi contacts (contacts_version) sekali per request, sama untuk semua session dan
+    // proses PHP; null jika migration 002 belum dijalankan
+    static $generations = [];
+    $key = database_name();
+    if ($forget) {
+        unset($generations[$key]);
+        return null;
+    }
+    if (!array_key_exists($key, $generations)) {
+        $version = contacts_version($pdo);
+        $generations[$key] = $version ? $version['version'] : null;
+    }
+    return $generations[$key];
+}
+
+function contacts_changed($pdo){
+    // Dipanggil sekali setelah insert/update/delete (bukan per row): naikkan versi
+    // contacts untuk ETag dan cache count, lalu lupakan nilai yang sudah dibaca
+    try {
+        $pdo->exec('UPDATE contacts_version SET version = version + 1, updated = current_timestamp(6) WHERE id = 1');
+    } catch (PDOException $exception) {
+        // Migration 002 belum dijalankan: tidak ada versi yang perlu dinaikkan
+    }
+    contacts_generation($pdo, true);
+}
+
+function contacts_version($pdo){
+    // Versi tabel contacts (db/migrations/002_contacts_version.sql, dinaikkan oleh
+    // contacts_changed() setiap write); null jika migration belum dijalankan
+    try {
+        $stmt = $pdo->query('SELECT version, updated, FLOOR(UNIX_TIMESTAMP(updated)),
+            FLOOR(UNIX_TIMESTAMP(updated)) < UNIX_TIMESTAMP() FROM contacts_version WHERE id = 1');
+        $row = $stmt ? $stmt->fetch(PDO::FETCH_NUM) : false;
+    } catch (PDOException $exception) {
+        $row = false;
+    }
+    if (!$row) {
+        return null;
+    }
+    return ['version' => (int) $row[0], 'updated' => $row[1], 'modified' => (int) $row[2], 'settled' => (bool) $row[3]];
+}
+
+function conditional_get($pdo, $vary = ''){
+    // ETag/Last-Modified dari versi contacts (+ $vary: user, parameter request);
+    // jawab 304 dan berhenti jika client sudah punya versi yang sama
+    $version = contacts_version($pdo);
+    if (!$version) {
+        return;
+    }
+    $etag = '"' . md5(database_name() . '|' . $version['version'] . '|' . $version['updated'] . '|' . $vary) . '"';
+    // Ganti header nocache dari session_start() supaya browser menyimpan dan me-revalidate
+    header_remove('Pragma');
+    header_remove('Expires');
+    header('Cache-Control: private, no-cache');
+    header('ETag: ' . $etag);
+    // Last-Modified hanya jika detik perubahan terakhir sudah lewat; write berikutnya
+    // pasti di detik yang lebih baru, jadi If-Modified-Since tidak bisa basi
+    if ($version['settled']) {
+        header('Last-Modified: ' . gmdate('D, d M Y H:i:s', $version['modified']) . ' GMT');
+    }
+
+    if (isset($_SERVER['HTTP_IF_NONE_MATCH'])) {
+        $tags = array_map(function ($tag) {
+            return preg_replace('/^W\//', '', trim($tag));
+        }, explode(',', $_SERVER['HTTP_IF_NONE_MATCH']));
+        $not_modified = in_array($etag, $tags) || in_array('*', $tags);
+    } else {
+        $since = strtotime($_SERVER['HTTP_IF_MODIFIED_SINCE'] ?? '');
+        $not_modified = $since && $version['settled'] && $version['modified'] <= $since;
+    }
+    if ($not_modified) {
+        http_response_code(304);
+        exit;
+    }
+}
+
+function contacts_fulltext($pdo){
+    // FULLTEXT index dari db/migrations/001_contacts_search_indexes.sql beserta aturan
+    // tokenizer server (ukuran token, stopword); null jika index belum ada
+    return cache_remember($pdo, 'contacts_fulltext', 300, function () use ($pdo) {
+        $stmt = $pdo->prepare("SELECT COUNT(*) FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = 'contacts' AND index_type = 'FULLTEXT'");
+        $stmt->execute();
+        if ($stmt->fetchColumn() == 0) {
+            return null;
+        }
+        $settings = $pdo->query('SELECT @@innodb_ft_min_token_size, @@innodb_ft_max_token_size,
+            @@innodb_ft_enable_stopword, @@innodb_ft_user_stopword_table, @@innodb_ft_server_stopword_table')->fetch(PDO::FETCH_NUM);
+        $stopwords = [];
+        if ($settings[2]) {
+            // Tabel stopword custom ditulis "db/tabel"; tanpa itu InnoDB memakai daftar default
+            $table = $settings[3] ?: $settings[4];
+            $sql = $table
+                ? 'SELECT value FROM `' . str_replace(['`', '/'], ['``', '`.`'], $table) . '`'
+                : 'SELECT value FROM information_schema.INNODB_FT_DEFAULT_STOPWORD';
+            $stopwords = array_map('mb_strtolower', $pdo->query($sql)->fetchAll(PDO::FETCH_COLUMN));
+        }
+        return ['min' => (int) $settings[0], 'max' => (int) $settings[1], 'stopwords' => $stopwords];
+    });
+}
+
+function fulltext_terms($search, $fulltext){
+    // Hanya token yang di search sudah diawali pemisah kata (spasi, '.', '@', ...): setiap
+    // baris yang cocok dengan LIKE pasti punya kata berawalan token itu, jadi '+token*'
+    // tidak membuang hasil. Token di awal search bisa berada di tengah kata ("ohn"), setelah
+    // wildcard LIKE (%, \) juga begitu, dan token yang bisa jadi awal stopword atau di luar
+    // ukuran token tidak ada di index; semuanya diserahkan ke LIKE
+    preg_match_all("/(?<=[^\\p{L}\\p{N}_'%\\\\])[\\p{L}\\p{N}_]+/u", mb_strtolower($search), $matches);
+    $terms = [];
+    foreach (array_unique($matches[0]) as $token) {
+        $length = mb_strlen($token);
+        if ($length < $fulltext['min'] || $length > $fulltext['max']) {
+            continue;
+        }
+        foreach ($fulltext['stopwords'] as $stopword) {
+            if (strpos($stopword, $token) === 0) {
+                continue 2;
+            }
+        }
+        $terms[] = '+' . $token . '*';
+    }
+    return implode(' ', $terms);
+}
+
+function contacts_filter($pdo, $search, $created_from = '', $created_to = ''){
+    // WHERE untuk global search dan range created; return [sql, params]
+    $where = [];
+    $params = [];
+    if ($search !== '') {
+        $like = '%' . $search . '%';
+        $condition = '(name LIKE ? OR email LIKE ? OR phone LIKE ? OR title LIKE ?)';
+        $condition_params = [$like, $like, $like, $like];
+        $fulltext = contacts_fulltext($pdo);
+        $terms = $fulltext ? fulltext_terms($search, $fulltext) : '';
+        if ($terms !== '') {
+            // LIKE tetap satu-satunya penentu hasil (substring); FULLTEXT hanya mempersempit
+            // kandidat lewat index
+            $condition = '(MATCH(name, email, phone, title) AGAINST (? IN BOOLEAN MODE) AND ' . $condition . ')';
+            array_unshift($condition_params, $terms);
+        }
+        if (ctype_digit($search)) {
+            $condition = '(' . $condition . ' OR id = ?)';
+            $condition_params[] = (int) $search;
+        }
+        $where[] = $condition;
+        $params = $condition_params;
+    }
+    if (preg_match('/^\d{4}-\d{2}-\d{2}$/', $created_from)) {
+        $where[] = 'created >= ?';
+        $params[] = $created_from . ' 00:00:00';
+    }
+    if (preg_match('/^\d{4}-\d{2}-\d{2}$/', $created_to)) {
+        $where[] = 'created < DATE_ADD(?, INTERVAL 1 DAY)';
+        $params[] = $created_to;
+    }
+    return [implode(' AND ', $where), $params];
+}
+
+function contact_import_row($cells, $columns){
+    // Satu baris CSV -> [name, email, phone, title, created] atau pesan error (string)
+    $contact = ['name' => '', 'email' => '', 'phone' => '', 'title' => '', 'created' => ''];
+    foreach ($columns as $index => $column) {
+        if ($column !== null && isset($cells[$index])) {
+            $contact[$column] = trim($cells[$index]);
+        }
+    }
+    if ($contact['name'] === '') {
+        return 'name kosong';
+    }
+    if (!filter_var($contact['email'], FILTER_VALIDATE_EMAIL)) {
+        return 'email tidak valid: ' . mb_substr($contact['email'], 0, 50);
+    }
+    foreach (['name', 'email', 'phone', 'title'] as $column) {
+        if (mb_strlen($contact[$column]) > 255) {
+            return $column . ' lebih dari 255 karakter';
+        }
+    }
+    if ($contact['created'] === '') {
+        $contact['created'] = date('Y-m-d H:i:s');
+    } else {
+        if (preg_match('/^\d{4}-\d{2}-\d{2}$/', $contact['created'])) {
+            $contact['created'] .= ' 00:00:00';
+        }
+        $created = DateTime::createFromFormat('Y-m-d H:i:s', $contact['created']);
+        if (!$created || $created->format('Y-m-d H:i:s') !== $contact['created']) {
+            return 'created tidak valid: ' . mb_substr($contact['created'], 0, 30);
+        }
+    }
+    return array_values($contact);
+}
+
+function import_contacts($pdo, $handle, $batch_size = 1000, $max_errors = 20){
+    // Import CSV dari stream $handle (dibaca per baris): baris valid di-INSERT
+    // multi-row per $batch_size dalam satu transaksi per batch.
+    // Header opsional (name,email,phone,title[,created], kolom lain seperti id diabaikan).
+    $report = ['accepted' => 0, 'rejected' => 0, 'batches' => 0, 'batch_size' => $batch_size, 'errors' => []];
+    $reject = function ($line, $error, $rows = 1) use (&$report, $max_errors) {
+        $report['rejected'] += $rows;
+        if (count($report['errors']) < $max_errors) {
+            $report['errors'][] = ['line' => $line, 'error' => $error];
+        }
+    };
+
+    $statements = [];
+    $batch = [];
+    $batch_line = 0;
+    $flush = function () use ($pdo, &$batch, &$batch_line, &$statements, &$report, $reject) {
+        $size = count($batch);
+        if (!$size) {
+            return;
+        }
+        if (!isset($statements[$size])) {
+            $statements[$size] = $pdo->prepare('INSERT INTO contacts (name, email, phone, title, created) VALUES '
+                . implode(', ', array_fill(0, $size, '(?, ?, ?, ?, ?)')));
+        }
+        $pdo->beginTransaction();
+        try {
+            $statements[$size]->execute(array_merge(...$batch));
+            $pdo->commit();
+            $report['accepted'] += $size;
+        } catch (PDOException $exception) {
+            $pdo->rollBack();
+            $reject($batch_line, 'batch ditolak database: ' . $exception->getMessage(), $size);
+        }
+        $report['batches']++;
+        $batch = [];
+    };
+
+    $started = microtime(true);
+    $columns = ['name', 'email', 'phone', 'title', 'created'];
+    $line = 0;
+    while (($cells = fgetcsv($handle, 0, ',', '"', '\\')) !== false) {
+        $line++;
+        if ($cells === [null]) {
+            continue;  // baris kosong
+        }
+        if ($line === 1) {
+            $cells[0] = preg_replace('/^\xEF\xBB\xBF/', '', $cells[0]);  // UTF-8 BOM
+            $header = array_map('strtolower', array_map('trim', $cells));
+            if (in_array('name', $header) && in_array('email', $header)) {
+                $columns = array_map(function ($column) {
+                    return in_array($column, ['name', 'email', 'phone', 'title', 'created']) ? $column : null;
+                }, $header);
+                continue;
+            }
+        }
+        $contact = contact_import_row($cells, $columns);
+        if (is_string($contact)) {
+            $reject($line, $contact);
+            continue;
+        }
+        if (!$batch) {
+            $batch_line = $line;
+        }
+        $batch[] = $contact;
+        if (count($batch) >= $batch_size) {
+            $flush();
+        }
+    }
+    $flush();
+
+    $report['seconds'] = round(microtime(true) - $started, 3);
+    $report['rows_per_sec'] = $report['seconds'] > 0 ? round($report['accepted'] / $report['seconds']) : $report['accepted'];
+    return $report;
+}
+
+function asset_manifest(){
+    // Bundle dari assets/build_assets.py; null jika belum di-build
+    static $manifest = false;
+    if ($manifest === false) {
+        $path = __DIR__ . '/assets/dist/manifest.json';
+        $manifest = is_file($path) ? json_decode(file_get_contents($path), true) : null;
+    }
+    return $manifest;
+}
+
 function style_script(){
+    $manifest = asset_manifest();
+    if ($manifest) {
+        return '
+    <link rel="stylesheet" href="asset.php?f=' . $manifest['css'] . '">
+    <script src="asset.php?f=' . $manifest['js'] . '"></script>';
+    }
+    // Fallback CDN jika bundle lokal belum di-build
     return '
     <link rel="stylesheet" href="style.css">
     <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@4.6.0/dist/css/bootstrap.min.css">
     <link rel="stylesheet" href="https://cdn.datatables.net/1.10.20/css/dataTables.bootstrap4.min.css">
-    <script src="https://code.jquery.com/jquery-3.5.1.slim.min.js"></script>
+    <script src="https://code.jquery.com/jquery-3.5.1.min.js"></script>
     <script src="https://cdn.jsdelivr.net/npm/bootstrap@4.6.0/dist/js/bootstrap.bundle.min.js"></script>   
     <script src="https://cdn.datatables.net/1.10.20/js/jquery.dataTables.min.js"></script>
     <script src="https://cdn.datatables.net/1.10.20/js/dataTables.bootstrap4.min.js"></script>';
@@ -0,0 +1,120 @@
+<?php
+include 'functions.php';
+session_start();
+if (!isset($_SESSION['user'])) {
+    header("location: login.php");
+} else {
+    // Bulk import CSV: upload form (multipart, field "file") atau body text/csv langsung.
+    // Accept: application/json -> laporan dalam JSON (dipakai tests/import_client.py)
+    $default_batch_size = 1000;
+    $max_batch_size = 5000;  // 5 placeholder per baris, batas MySQL 65535
+    $wants_json = strpos($_SERVER['HTTP_ACCEPT'] ?? '', 'application/json') !== false;
+    $report = null;
+    $error = null;
+
+    if ($_SERVER['REQUEST_METHOD'] === 'POST') {
+        $batch_size = (int) ($_POST['batch_size'] ?? $_GET['batch_size'] ?? $default_batch_size);
+        $batch_size = max(1, min($max_batch_size, $batch_size ?: $default_batch_size));
+        $handle = null;
+        if (isset($_FILES['file'])) {
+            if ($_FILES['file']['error'] === UPLOAD_ERR_OK) {
+                $handle = fopen($_FILES['file']['tmp_name'], 'r');
+            } elseif (in_array($_FILES['file']['error'], [UPLOAD_ERR_INI_SIZE, UPLOAD_ERR_FORM_SIZE])) {
+                $error = 'File terlalu besar (upload_max_filesize / post_max_size)';
+            } else {
+                $error = 'Upload gagal (kode ' . $_FILES['file']['error'] . ')';
+            }
+        } elseif (strpos($_SERVER['CONTENT_TYPE'] ?? '', 'text/csv') === 0) {
+            $handle = fopen('php://input', 'r');
+        } else {
+            $error = 'Tidak ada file CSV';
+        }
+
+        if ($handle) {
+            set_time_limit(0);
+            $pdo = pdo_connect();
+            $pdo->setAttribute(PDO::ATTR_ERRMODE, PDO::ERRMODE_EXCEPTION);
+            $report = import_contacts($pdo, $handle, $batch_size);
+            fclose($handle);
+            if ($report['accepted']) {
+                contacts_changed($pdo);
+            }
+        }
+
+        if ($wants_json) {
+            header('Content-Type: application/json');
+            if ($error) {
+                http_response_code(400);
+                echo json_encode(['error' => $error]);
+            } else {
+                echo json_encode($report);
+            }
+            exit;
+        }
+    }
+    ?>
+    <!DOCTYPE html>
+    <html lang="en">
+
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <meta http-equiv="X-UA-Compatible" content="ie=edge">
+        <?= style_script() ?>
+        <title>Import contacts</title>
+    </head>
+
+    <body>
+        <div class="container" style="margin-top:50px">
+            <div class="row">
+                <div class="col-md-7 col-sm-12 col-xs-12">
+                    <div class="card">
+                        <div class="card-body">
+                            <h5 class="card-title">Import contacts (CSV)</h5>
+                            <?php if ($error): ?>
+                                <div class="alert alert-danger" id="import-error"><?= htmlspecialchars($error) ?></div>
+                            <?php endif; ?>
+                            <?php if ($report): ?>
+                                <div class="alert alert-info" id="import-report">
+                                    Accepted: <span id="accepted"><?= $report['accepted'] ?></span>,
+                                    rejected: <span id="rejected"><?= $report['rejected'] ?></span>
+                                    (<?= $report['batches'] ?> batch, <?= $report['seconds'] ?> s,
+                                    <?= $report['rows_per_sec'] ?> rows/s)
+                                </div>
+                                <?php if ($report['errors']): ?>
+                                    <table class="table table-sm" id="import-errors">
+                                        <thead><tr><th>Line</th><th>Error</th></tr></thead>
+                                        <tbody>
+                                        <?php foreach ($report['errors'] as $row_error): ?>
+                                            <tr><td><?= $row_error['line'] ?></td><td><?= htmlspecialchars($row_error['error']) ?></td></tr>
+                                        <?php endforeach; ?>
+                                        </tbody>
+                                    </table>
+                                <?php endif; ?>
+                            <?php endif; ?>
+                            <p class="text-muted small">Kolom: name, email, phone, title, created (opsional, YYYY-MM-DD [HH:MM:SS]).
+                                Baris header opsional; file dari Export CSV bisa langsung diimport.</p>
+                            <form action="import.php" method="post" enctype="multipart/form-data">
+                                <input class="form-control-file" type="file" name="file" id="file" accept=".csv,text/csv" required><br>
+                                <label for="batch_size" class="small">Batch size</label>
+                                <input class="form-control form-control-sm" type="number" name="batch_size" id="batch_size"
+                                       min="1" max="<?= $max_batch_size ?>" value="<?= $default_batch_size ?>"><br>
+                                <input class="btn btn-primary btn-sm" type="submit" value="Import">
+                                <a href="index.php" type="button" class="btn btn-warning btn-sm">Cancel</a>
+                            </form>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </div>
+
+        <div class="text-center">
+        <p class="mt-5 mb-3 text-muted">Your Damn Exercise &copy; 2023</p>
+        </div>
+    </body>
+
+    </html>
+<?php
+
+}
+?>
@@ -4,10 +4,6 @@ session_start();
 if (!isset($_SESSION['user'])) {
     header("location: login.php");
 } else {
-    $pdo = pdo_connect();
-    $stmt = $pdo->prepare('SELECT * FROM contacts');
-    $stmt->execute();
-    $contacts = $stmt->fetchAll(PDO::FETCH_ASSOC);
 ?>
     <!DOCTYPE html>
     <html lang="en">
@@ -19,7 +15,80 @@ if (!isset($_SESSION['user'])) {
         <?= style_script() ?>
         <script>
             $(document).ready(function() {
-                $('#employee').DataTable();
+                // Data diambil per halaman dari contacts_data.php (server-side processing)
+                var table = $('#employee').DataTable({
+                    serverSide: true,
+                    processing: true,
+                    ajax: {
+                        url: 'contacts_data.php',
+                        // URL sama untuk halaman/search yang sama (tanpa counter draw dan
+                        // cache-buster _), jadi browser me-revalidate dan dapat 304
+                        cache: true,
+                        data: function(d) {
+                            delete d.draw;
+                            d.created_from = $('#created_from').val();
+                            d.created_to = $('#created_to').val();
+                        }
+                    },
+                    columnDefs: [
+                        { targets: -1, orderable: false, searchable: false, className: 'actions' }
+                    ],
+                    initComplete: function() {
+                        // Dibaca oleh tests/page_metrics.py (waktu DataTables siap)
+                        if (window.performance && performance.mark) {
+                            performance.mark('datatable-init');
+                        }
+                    }
+                });
+                $('#created_from, #created_to').on('change', function() {
+                    table.draw();
+                });
+
+                // Multi-select lintas halaman; bulk action lewat bulk.php lalu draw ulang di tempat
+                var selected = {};
+                function updateSelection() {
+                    var count = Object.keys(selected).length;
+                    $('#selected-count').text(count);
+                    $('.bulk-action').prop('disabled', count === 0);
+                }
+                $('#employee').on('change', '.select-contact', function() {
+                    if (this.checked) {
+                        selected[this.value] = true;
+                    } else {
+                        delete selected[this.value];
+                    }
+                    updateSelection();
+                });
+                $('#select-page').on('change', function() {
+                    $('#employee .select-contact').prop('checked', this.checked).trigger('change');
+                });
+                table.on('draw', function() {
+                    $('#employee .select-contact').each(function() {
+                        this.checked = !!selected[this.value];
+                    });
+                    $('#select-page').prop('checked', false);
+                });
+                function bulk(data) {
+                    data.ids = Object.keys(selected).join(',');
+                    $('.bulk-action').prop('disabled', true);
+                    $.post('bulk.php', data, null, 'json').done(function(result) {
+                        $('#bulk-result').removeClass('text-danger')
+                            .text(result.action + ': ' + result.affected + ' / ' + result.requested + ' contacts');
+                        selected = {};
+                        table.draw(false);
+                    }).fail(function(xhr) {
+                        $('#bulk-result').addClass('text-danger')
+                            .text((xhr.responseJSON && xhr.responseJSON.error) || 'Bulk action failed');
+                    }).always(updateSelection);
+                }
+                $('#bulk-delete').on('click', function() {
+                    if (confirm('Damn, delete ' + Object.keys(selected).length + ' contacts? Are you sure?')) {
+                        bulk({action: 'delete'});
+                    }
+                });
+                $('#bulk-update').on('click', function() {
+                    bulk({action: 'update', title: $('#bulk-title').val(), phone: $('#bulk-phone').val()});
+                });
             });
         </script>
 
@@ -32,6 +101,19 @@ if (!isset($_SESSION['user'])) {
             <?php include "menu.php"; ?>
             <div class="row">
                 <div class="col">
+                    <div class="form-inline mb-2">
+                        <label for="created_from" class="mr-2">Created</label>
+                        <input type="date" id="created_from" class="form-control form-control-sm mr-2">
+                        <input type="date" id="created_to" class="form-control form-control-sm">
+                    </div>
+                    <div class="form-inline mb-2" id="bulk-actions">
+                        <span class="mr-2"><span id="selected-count">0</span> selected</span>
+                        <button type="button" class="btn btn-sm btn-danger bulk-action mr-2" id="bulk-delete" disabled>Delete selected</button>
+                        <input type="text" id="bulk-title" class="form-control form-control-sm mr-2" placeholder="New title">
+                        <input type="text" id="bulk-phone" class="form-control form-control-sm mr-2" placeholder="New phone">
+                        <button type="button" class="btn btn-sm btn-primary bulk-action mr-2" id="bulk-update" disabled>Update selected</button>
+                        <span id="bulk-result" class="small"></span>
+                    </div>
                     <table class="table table-striped" id="employee">
                         <thead>
                             <tr>
@@ -41,24 +123,10 @@ if (!isset($_SESSION['user'])) {
                                 <th>Phone</th>
                                 <th>Title</th>
                                 <th>Created</th>
-                                <th></th>
+                                <th><input type="checkbox" id="select-page" aria-label="Select page"></th>
                             </tr>
                         </thead>
                         <tbody>
-                            <?php foreach ($contacts as $contact) : ?>
-                                <tr>
-                                    <td><?= $contact['id'] ?></td>
-                                    <td><?= $contact['name'] ?></td>
-                                    <td><?= $contact['email'] ?></td>
-                                    <td><?= $contact['phone'] ?></td>
-                                    <td><?= $contact['title'] ?></td>
-                                    <td><?= $contact['created'] ?></td>
-                                    <td class="actions">
-                                        <a type="button" class="btn btn-sm btn-outline btn-success" href="update.php?id=<?= $contact['id'] ?>" class="edit">edit</a>
-                                        <a type="button" class="btn btn-sm btn-outline btn-danger" href="delete.php?id=<?= $contact['id'] ?>" class="trash" onclick="return confirm('Damn, what r u doin\'? Are you sure?');">delete</a>
-                                    </td>
-                                </tr>
-                            <?php endforeach; ?>
                         </tbody>
                         <tfoot>
                             <tr>
@@ -1,6 +1,8 @@
 <div class="row">
     <div class="col">
         <a type="button" class="btn btn-success create-contact" href="create.php">Add New Contact</a>
+        <a type="button" class="btn btn-outline-secondary" href="export.php?format=csv">Export CSV</a>
+        <a type="button" class="btn btn-outline-secondary" href="import.php">Import CSV</a>
         <div class="action float-right">
         <a type="button" class="btn btn-primary" href="profil.php">Profil</a> 
         <a type="button" class="btn btn-warning" href="vpage.php">VPage</a> 
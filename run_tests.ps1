@@ -23,6 +23,8 @@ function Show-Help {
     Write-Host "  update       - Run UPDATE operation tests" -ForegroundColor $Green
     Write-Host "  delete       - Run DELETE operation tests" -ForegroundColor $Green
     Write-Host "  integration  - Run integration tests" -ForegroundColor $Green
+    Write-Host "  http         - Run browser-free HTTP tests (fast tier)" -ForegroundColor $Green
+    Write-Host "  ui           - Run browser (Selenium) tests only" -ForegroundColor $Green
     Write-Host "  report       - Run tests and generate HTML report" -ForegroundColor $Green
     Write-Host "  markers      - Show all available markers" -ForegroundColor $Green
     Write-Host "  collect      - Collect tests without execution" -ForegroundColor $Green
@@ -50,6 +52,9 @@ function Run-Tests {
     
     Check-Pytest
     
+    # Mode parallel (-n) butuh php -S per worker dengan database worker sendiri
+    if (-not $env:APP_SERVER) { $env:APP_SERVER = "php" }
+    
     $separator = "==========================================" 
     Write-Host $separator -ForegroundColor $Green
     Write-Host "DamnCRUD Functional Testing" -ForegroundColor $Green
@@ -89,6 +94,14 @@ function Run-Tests {
             Write-Host "Running only integration tests..." -ForegroundColor $Green
             pytest tests/ -v -m integration -n auto
         }
+        "http" {
+            Write-Host "Running browser-free HTTP tests..." -ForegroundColor $Green
+            pytest tests/ -v -m http -n auto
+        }
+        "ui" {
+            Write-Host "Running browser (Selenium) tests only..." -ForegroundColor $Green
+            pytest tests/ -v -m "not http" -n auto
+        }
         "report" {
             Write-Host "Running tests and generating HTML report..." -ForegroundColor $Green
             pytest tests/ -v --html=tests/reports/report.html --self-contained-html --tb=short -n auto
@@ -19,6 +19,9 @@ if ! command -v pytest &> /dev/null; then
     pip install -r requirements.txt
 fi
 
+# Mode parallel (-n) butuh php -S per worker dengan database worker sendiri
+export APP_SERVER="${APP_SERVER:-php}"
+
 # Parse arguments
 case "${1}" in
     "all")
@@ -53,6 +56,14 @@ case "${1}" in
         echo -e "${GREEN}Running only integration tests...${NC}"
         pytest tests/ -v -m integration -n auto
         ;;
+    "http")
+        echo -e "${GREEN}Running browser-free HTTP tests...${NC}"
+        pytest tests/ -v -m http -n auto
+        ;;
+    "ui")
+        echo -e "${GREEN}Running browser (Selenium) tests only...${NC}"
+        pytest tests/ -v -m "not http" -n auto
+        ;;
     "report")
         echo -e "${GREEN}Running tests and generating HTML report...${NC}"
         pytest tests/ -v --html=tests/reports/report.html --self-contained-html --tb=short -n auto
@@ -78,6 +89,8 @@ case "${1}" in
         echo "  update       - Run UPDATE operation tests"
         echo "  delete       - Run DELETE operation tests"
         echo "  integration  - Run integration tests"
+        echo "  http         - Run browser-free HTTP tests (fast tier)"
+        echo "  ui           - Run browser (Selenium) tests only"
         echo "  report       - Run tests and generate HTML report"
         echo "  markers      - Show all available markers"
         echo "  collect      - Collect tests without execution"
@@ -0,0 +1,117 @@
+"""
+auth_cache.py - Cache session login (PHPSESSID) untuk authenticated_browser
+
+Login dilakukan sekali per worker lewat HTTP POST biasa ke login.php,
+lalu cookie session di-inject ke setiap driver. Jika session ditolak
+(redirect ke login.php), cache di-invalidate dan login diulang otomatis.
+"""
+import http.cookiejar
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+
+SESSION_COOKIE = 'PHPSESSID'
+HTTP_TIMEOUT = 10
+
+
+def inject_cookie(driver, base_url, name, value):
+    """Set cookie untuk host aplikasi tanpa perlu membuka halaman dulu"""
+    host = urllib.parse.urlparse(base_url).hostname
+    try:
+        driver.execute_cdp_cmd('Network.setCookie', {
+            'name': name,
+            'value': value,
+            'domain': host,
+            'path': '/',
+        })
+    except AttributeError:
+        # Driver non-Chromium: add_cookie butuh halaman di domain yang sama
+        if urllib.parse.urlparse(driver.current_url).hostname != host:
+            driver.get(f"{base_url}/login.php")
+        driver.add_cookie({'name': name, 'value': value, 'path': '/'})
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    """Jangan follow redirect supaya Location header bisa dicek"""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+class AuthenticationError(Exception):
+    """Login via HTTP gagal mendapatkan session yang valid"""
+
+
+class AuthCache:
+    """Simpan satu PHPSESSID yang valid per worker"""
+
+    def __init__(self, base_url, username, password):
+        self.base_url = base_url.rstrip('/')
+        self.username = username
+        self.password = password
+        self.session_id = None
+        self._lock = threading.Lock()
+        self.stats = {'http_logins': 0, 'injections': 0, 'reauth': 0}
+
+    def _opener(self, jar):
+        return urllib.request.build_opener(
+            _NoRedirect, urllib.request.HTTPCookieProcessor(jar)
+        )
+
+    def _fetch_session(self):
+        """POST kredensial ke login.php dan ambil PHPSESSID dari cookie jar"""
+        jar = http.cookiejar.CookieJar()
+        data = urllib.parse.urlencode({
+            'username': self.username,
+            'password': self.password,
+        }).encode()
+        request = urllib.request.Request(f"{self.base_url}/login.php", data=data)
+        try:
+            self._opener(jar).open(request, timeout=HTTP_TIMEOUT)
+        except urllib.error.HTTPError as e:
+            # 302 ke index.php berarti login berhasil
+            if e.code not in (301, 302, 303) or 'index.php' not in (e.headers.get('Location') or ''):
+                raise AuthenticationError(f"Login ditolak (HTTP {e.code})")
+        else:
+            raise AuthenticationError("Login tidak redirect ke index.php (kredensial salah?)")
+
+        for cookie in jar:
+            if cookie.name == SESSION_COOKIE:
+                self.stats['http_logins'] += 1
+                return cookie.value
+        raise AuthenticationError(f"Cookie {SESSION_COOKIE} tidak ditemukan")
+
+    def get_session(self):
+        """Ambil PHPSESSID dari cache, login via HTTP jika belum ada (atau sudah di-invalidate)"""
+        with self._lock:
+            if self.session_id is None:
+                self.session_id = self._fetch_session()
+            return self.session_id
+
+    def cookie_header(self):
+        """Header Cookie (session) untuk request HTTP langsung"""
+        return f"{SESSION_COOKIE}={self.get_session()}"
+
+    def invalidate(self):
+        """Buang session yang ditolak server; get_session() berikutnya login ulang"""
+        with self._lock:
+            if self.session_id is not None:
+                self.stats['reauth'] += 1
+            self.session_id = None
+
+    def authenticate(self, driver):
+        """
+        Inject session ke driver lalu buka index.php.
+        Re-authenticate sekali jika session ditolak.
+        """
+        for attempt in range(2):
+            if attempt:
+                self.invalidate()
+            session_id = self.get_session()
+            inject_cookie(driver, self.base_url, SESSION_COOKIE, session_id)
+            self.stats['injections'] += 1
+            driver.get(f"{self.base_url}/index.php")
+            if 'login.php' not in driver.current_url:
+                return driver
+        raise AuthenticationError("Session ditolak oleh index.php setelah re-authenticate")
@@ -0,0 +1,129 @@
+"""
+bench_search.py - Benchmark latency query search/filter contacts
+dengan dan tanpa index dari db/migrations
+
+Database benchmark terpisah (damncrud_bench) di-load dari damncrud.sql,
+diisi contacts sintetis, diukur tanpa index, lalu migration diterapkan
+dan diukur ulang.
+
+Usage:
+    python tests/bench_search.py --rows 1000000 --repeat 5 --output bench_search.json
+"""
+import argparse
+import json
+import statistics
+import time
+
+from contacts_generator import bulk_load, make_contact
+from db_pool import close_pool, get_pool
+from setup_db import DB_HOST, DB_USER, DB_PASSWORD, DB_NAME, apply_migrations, load_sql_file
+
+BENCH_DB_NAME = f"{DB_NAME}_bench"
+
+_LIKE = "(name LIKE %s OR email LIKE %s OR phone LIKE %s OR title LIKE %s)"
+
+
+def bench_queries(rows, fulltext):
+    """
+    Query yang sama bentuknya dengan contacts_data.php: (nama, sql, params).
+    Tanpa FULLTEXT index, search di aplikasi hanya LIKE (contacts_filter() melewati MATCH),
+    jadi search_app dibandingkan dengan query yang benar-benar dikirim di kedua kondisi
+    """
+    name, email, _, title, created = make_contact(rows // 2)
+    like = f"%{email}%"
+    # Token setelah pemisah kata (last name + index), sama seperti fulltext_terms()
+    terms = f"+{email.split('.')[1].split('@')[0]}*"
+    day = created[:10]
+    if fulltext:
+        search_app = (f"SELECT COUNT(*) FROM contacts WHERE MATCH(name, email, phone, title) "
+                      f"AGAINST (%s IN BOOLEAN MODE) AND {_LIKE}", (terms,) + (like,) * 4)
+    else:
+        search_app = (f"SELECT COUNT(*) FROM contacts WHERE {_LIKE}", (like,) * 4)
+    return [
+        ('search_like', f"SELECT COUNT(*) FROM contacts WHERE {_LIKE}", (like,) * 4),
+        ('search_app',) + search_app,
+        ('email_exact', "SELECT id FROM contacts WHERE email = %s", (email,)),
+        ('order_name_first_page', "SELECT * FROM contacts ORDER BY name, id LIMIT 10", ()),
+        ('order_name_keyset',
+         "SELECT * FROM contacts WHERE (name > %s OR (name = %s AND id > %s)) "
+         "ORDER BY name, id LIMIT 10", (name, name, rows // 2)),
+        ('order_title_desc', "SELECT * FROM contacts ORDER BY title DESC, id DESC LIMIT 10", ()),
+        ('created_range_count',
+         "SELECT COUNT(*) FROM contacts WHERE created >= %s AND created < DATE_ADD(%s, INTERVAL 1 DAY)",
+         (f"{day} 00:00:00", day)),
+    ]
+
+
+def measure(connection, queries, repeat):
+    """Median latency (ms) per query"""
+    results = {}
+    cursor = connection.cursor()
+    try:
+        for name, sql, params in queries:
+            samples = []
+            for _ in range(repeat):
+                began = time.monotonic()
+                cursor.execute(sql, params)
+                cursor.fetchall()
+                samples.append((time.monotonic() - began) * 1000)
+            results[name] = statistics.median(samples)
+    finally:
+        cursor.close()
+    return results
+
+
+def run(rows, repeat, keep=False):
+    server = get_pool(DB_HOST, DB_USER, DB_PASSWORD).get_connection()
+    try:
+        load_sql_file(server, BENCH_DB_NAME)
+        connection = get_pool(DB_HOST, DB_USER, DB_PASSWORD, BENCH_DB_NAME).get_connection()
+        try:
+            load = bulk_load(connection, rows)
+            without = measure(connection, bench_queries(rows, fulltext=False), repeat)
+            migrations = apply_migrations(server, BENCH_DB_NAME)
+            with_indexes = measure(connection, bench_queries(rows, fulltext=True), repeat)
+        finally:
+            connection.close()
+            close_pool(DB_HOST, DB_USER, BENCH_DB_NAME)
+        if not keep:
+            cursor = server.cursor()
+            cursor.execute(f"DROP DATABASE IF EXISTS `{BENCH_DB_NAME}`")
+            cursor.close()
+    finally:
+        server.close()
+
+    return {
+        'rows': rows,
+        'repeat': repeat,
+        'load_rows_per_sec': round(load.rows_per_sec),
+        'migrations': migrations,
+        'queries': {
+            name: {'without_indexes_ms': without[name], 'with_indexes_ms': with_indexes[name]}
+            for name in without
+        },
+    }
+
+
+def print_report(report):
+    print(f"\nSearch benchmark: {report['rows']:,} contacts, median of {report['repeat']} runs")
+    print(f"{'query':<24}{'no index (ms)':>16}{'indexed (ms)':>16}{'speedup':>10}")
+    for name, result in report['queries'].items():
+        before, after = result['without_indexes_ms'], result['with_indexes_ms']
+        speedup = f"{before / after:.1f}x" if after else '-'
+        print(f"{name:<24}{before:>16.2f}{after:>16.2f}{speedup:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark search contacts dengan/tanpa index")
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help="Simpan hasil sebagai JSON")
+    parser.add_argument('--keep', action='store_true', help="Jangan drop database benchmark")
+    args = parser.parse_args()
+
+    report = run(args.rows, args.repeat, args.keep)
+    print_report(report)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nHasil disimpan di {args.output}")
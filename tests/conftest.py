@@ -1,6 +1,10 @@
 """
 conftest.py - Pytest fixtures untuk setup dan teardown test environment
 """
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
 import pytest
 import mysql.connector
 from selenium import webdriver
@@ -8,53 +12,118 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import time
+from selenium.webdriver.support.event_firing_webdriver import EventFiringWebDriver
+import glob
 import os
 
-# Detect if running in GitHub Actions
-IS_GITHUB_ACTIONS = os.getenv('GITHUB_ACTIONS', 'false').lower() == 'true'
+from auth_cache import SESSION_COOKIE, AuthCache
+from contact_repository import ContactRepository, bump_contacts_version
+from contacts_generator import bulk_load
+from db_pool import DEFAULT_PORT, close_pool, get_pool
+from db_reset import ResetEngine
+from driver_pool import DriverPool
+from duration_scheduler import DurationSchedulePlugin
+from http_client import HttpClient
+from mysql_server import MysqlServer
+from network_shaping import apply_network, clear_network, network_options
+from page_metrics import RAW_DIR, PageMetrics, PageMetricsListener, merge_reports
+from php_server import PhpServer, free_port
+from settings import ADMIN_PASSWORD, ADMIN_USERNAME, DEFAULT_BASE_URL, IS_GITHUB_ACTIONS
+from setup_db import apply_migrations, load_sql_file
+from waits import WAIT_LOG, wait_for_redirect_to_index
+from worker_db import (
+    clone_database,
+    drop_database,
+    ensure_template,
+    template_database_name,
+    worker_database_name,
+)
+
+# EPHEMERAL_MYSQL=1: fixture mysql_server menjalankan mysqld sendiri di tmpfs per worker
+EPHEMERAL_MYSQL = os.getenv('EPHEMERAL_MYSQL', '0') == '1'
 
 # Database Configuration
-DB_HOST = '127.0.0.1' if IS_GITHUB_ACTIONS else 'localhost'  # GitHub Actions uses 127.0.0.1
+if EPHEMERAL_MYSQL:
+    # Port dipilih saat conftest di-import, jadi setiap xdist worker punya server sendiri
+    DB_HOST = '127.0.0.1'
+    DB_PORT = free_port()
+else:
+    DB_HOST = '127.0.0.1' if IS_GITHUB_ACTIONS else 'localhost'  # GitHub Actions uses 127.0.0.1
+    DB_PORT = DEFAULT_PORT
 DB_USER = 'root'
 DB_PASSWORD = ''  # XAMPP default: empty password
-DB_NAME = 'damncrud'  # Match with damncrud.sql
+BASE_DB_NAME = 'damncrud'  # Match with damncrud.sql
+
+# Setiap xdist worker (gw0, gw1, ...) memakai database sendiri, mis. damncrud_gw0
+WORKER_ID = os.getenv('PYTEST_XDIST_WORKER', 'master')
+DB_NAME = worker_database_name(BASE_DB_NAME, WORKER_ID)
+TEMPLATE_DB_NAME = template_database_name(BASE_DB_NAME)
+IS_ISOLATED_DB = DB_NAME != BASE_DB_NAME
+
+# Tabel yang di-track oleh ResetEngine dan data test standar untuk contacts
+RESET_TABLES = ('contacts', 'users')
+TEST_CONTACTS = [
+    ('John Doe', 'john.doe@email.com', '08123456789', 'Software Engineer', '2023-01-15 10:00:00'),
+    ('Jane Smith', 'jane.smith@email.com', '08987654321', 'Product Manager', '2023-01-16 11:00:00'),
+    ('Bob Johnson', 'bob.johnson@email.com', '08111111111', 'QA Engineer', '2023-01-17 12:00:00'),
+]
+
+# Jumlah contacts sintetis default untuk fixture synthetic_contacts (scale tests)
+SYNTHETIC_ROWS = int(os.getenv('SYNTHETIC_ROWS', '10000'))
 
 # Application Configuration
-APP_HOST = '127.0.0.1' if IS_GITHUB_ACTIONS else 'localhost'
-BASE_URL = f'http://{APP_HOST}/DamnCRUD'
-ADMIN_USERNAME = 'admin'
-ADMIN_PASSWORD = 'nimda666!'
+# APP_SERVER=apache: satu Apache bersama di /DamnCRUD (XAMPP)
+# APP_SERVER=php: fixture app_server menjalankan php -S per worker di port bebas
+APP_SERVER = os.getenv('APP_SERVER', 'apache')
+if APP_SERVER == 'php':
+    # Dipilih saat conftest di-import, jadi setiap xdist worker punya port sendiri
+    APP_PORT = free_port()
+    BASE_URL = f'http://127.0.0.1:{APP_PORT}'
+else:
+    APP_PORT = None
+    BASE_URL = DEFAULT_BASE_URL
 
 # Selenium Configuration
 IMPLICIT_WAIT = 10
 HEADLESS = IS_GITHUB_ACTIONS  # Automatically enable headless mode in GitHub Actions
 
+# Navigation Timing per page load, opt-in (PAGE_METRICS=1), CDP metrics opsional
+PAGE_METRICS = os.getenv('PAGE_METRICS', '0') == '1'
+PAGE_METRICS_CDP = os.getenv('PAGE_METRICS_CDP', '0') == '1'
+
+# ASSET_BUNDLE=1: halaman wajib memakai bundle lokal assets/dist (default di CI);
+# tanpa bundle test_bundle_is_cacheable gagal, bukan skip
+ASSET_BUNDLE = os.getenv('ASSET_BUNDLE', '1' if IS_GITHUB_ACTIONS else '0') == '1'
+
+# Disk cache HTTP Chrome (--disk-cache-dir) per worker yang bertahan antar driver/run,
+# mis. tests/.chrome_disk_cache. Bukan server asset lokal: asset yang tidak bisa di-cache
+# tetap di-request; asset aplikasi sendiri sudah lokal lewat bundle assets/dist
+CHROME_DISK_CACHE_DIR = os.getenv('CHROME_DISK_CACHE_DIR', '')
+
 print(f"[Pytest Config] Running in GitHub Actions: {IS_GITHUB_ACTIONS}")
-print(f"[Pytest Config] Database Host: {DB_HOST}")
-print(f"[Pytest Config] Base URL: {BASE_URL}")
+print(f"[Pytest Config] Database Host: {DB_HOST}:{DB_PORT}{' (ephemeral)' if EPHEMERAL_MYSQL else ''}")
+print(f"[Pytest Config] Database Name: {DB_NAME}")
+print(f"[Pytest Config] Base URL: {BASE_URL} ({APP_SERVER})")
 print(f"[Pytest Config] Headless Mode: {HEADLESS}")
 
 
+def get_server_connection():
+    """Pinjam connection ke MySQL server tanpa memilih database (dari pool)"""
+    return get_pool(DB_HOST, DB_USER, DB_PASSWORD, port=DB_PORT).get_connection()
+
+
 def get_db_connection():
-    """Create database connection"""
+    """Pinjam database connection dari pool; close() mengembalikannya ke pool"""
     try:
-        connection = mysql.connector.connect(
-            host=DB_HOST,
-            user=DB_USER,
-            password=DB_PASSWORD,
-            database=DB_NAME
-        )
-        return connection
+        return get_pool(DB_HOST, DB_USER, DB_PASSWORD, DB_NAME, port=DB_PORT).get_connection()
     except mysql.connector.Error as err:
         print(f"Database connection error: {err}")
         return None
 
 
-@pytest.fixture(scope="function")
-def browser():
+def create_chrome_driver():
     """
-    Fixture untuk initialize dan teardown Chrome WebDriver
+    Launch Chrome WebDriver baru dengan konfigurasi environment saat ini
     """
     chrome_options = Options()
 
@@ -65,6 +134,10 @@ def browser():
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-blink-features=AutomationControlled")
 
+    if CHROME_DISK_CACHE_DIR:
+        # Response yang boleh di-cache bertahan setelah driver di-recycle (sesuai header cache)
+        chrome_options.add_argument(f"--disk-cache-dir={os.path.abspath(os.path.join(CHROME_DISK_CACHE_DIR, WORKER_ID))}")
+
     # ===== FIX UNTUK GITHUB ACTIONS =====
     if IS_GITHUB_ACTIONS:
         chrome_options.binary_location = "/usr/bin/chromium-browser"
@@ -80,9 +153,60 @@ def browser():
     if not HEADLESS:
         driver.maximize_window()
 
-    yield driver
+    return driver
+
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    """
+    Fixture untuk pool Chrome WebDriver yang hangat (satu pool per xdist worker)
+    """
+    pool = DriverPool(create_chrome_driver, implicit_wait=IMPLICIT_WAIT)
+
+    yield pool
 
-    driver.quit()
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def page_metrics():
+    """
+    Fixture untuk Navigation Timing semua page load di worker ini
+    """
+    metrics = PageMetrics(cdp=PAGE_METRICS_CDP)
+
+    yield metrics
+
+    metrics.save(WORKER_ID)
+
+
+@pytest.fixture(scope="function")
+def browser(request, driver_pool, page_metrics):
+    """
+    Fixture untuk meminjam Chrome WebDriver dari pool dan reset setelah test.
+    Blokir URL / throttling dari env BLOCK_URLS, NETWORK_PROFILE atau
+    marker @pytest.mark.network(block=[...], profile='slow-3g').
+    """
+    driver = driver_pool.acquire()
+
+    block, profile = network_options(request.node.get_closest_marker('network'))
+    shaped = apply_network(driver, block, profile)
+    page_metrics.network_profile = profile
+
+    if PAGE_METRICS:
+        yield EventFiringWebDriver(driver, PageMetricsListener(page_metrics))
+        # Halaman terakhir (mis. DataTables yang selesai setelah find terakhir)
+        page_metrics.capture(driver)
+        page_metrics.forget(driver)
+    else:
+        yield driver
+
+    if shaped:
+        try:
+            clear_network(driver)
+        except Exception:
+            pass  # Driver rusak akan di-recycle oleh pool
+    driver_pool.release(driver)
 
 @pytest.fixture(scope="function")
 def db_connection():
@@ -98,75 +222,194 @@ def db_connection():
         connection.close()
 
 
-@pytest.fixture(autouse=True)
-def reset_database():
+@pytest.fixture(scope="session")
+def contact_repository(db_pool):
     """
-    Fixture untuk reset database sebelum setiap test
-    Dengan locking untuk prevent race condition di parallel execution
+    Fixture untuk ContactRepository (satu koneksi autocommit per worker):
+    seeding batch dan assertion langsung ke database
     """
-    import time
-    import os
-    
-    # Lock file untuk prevent concurrent database resets
-    lock_file = os.path.join(os.path.dirname(__file__), '.db_lock')
-    
-    # Wait untuk lock (dengan timeout)
-    max_wait = 10
-    wait_time = 0
-    while os.path.exists(lock_file) and wait_time < max_wait:
-        time.sleep(0.5)
-        wait_time += 0.5
-    
-    # Create lock
-    try:
-        with open(lock_file, 'w') as f:
-            f.write('locked')
-    except:
-        pass
-    
+    repository = ContactRepository(get_db_connection)
+
+    yield repository
+
+    repository.close()
+
+
+@pytest.fixture(scope="session")
+def mysql_server():
+    """
+    Fixture untuk MySQL/MariaDB sekali pakai jika EPHEMERAL_MYSQL=1: data directory
+    di tmpfs, damncrud.sql (+ migration) di-load sekali, server dan datanya dibuang di akhir.
+    """
+    if not EPHEMERAL_MYSQL:
+        yield None
+        return
+    if APP_SERVER != 'php':
+        # Apache bersama tidak tahu port server sekali pakai milik worker ini
+        pytest.fail("EPHEMERAL_MYSQL=1 membutuhkan APP_SERVER=php (php -S per worker)", pytrace=False)
+
+    server = MysqlServer(DB_PORT, host=DB_HOST)
     try:
-        # Reset database - delete semua data dari contacts table
-        connection = get_db_connection()
-        if connection:
-            cursor = connection.cursor()
+        with PHASE_TIMINGS.timed('mysql.initialize'):
+            server.initialize()
+        with PHASE_TIMINGS.timed('mysql.start'):
+            server.start().wait_ready()
+        if not IS_ISOLATED_DB:
+            # Dengan xdist dump di-load oleh ensure_template (fixture worker_database)
+            connection = get_server_connection()
             try:
-                # Reset auto increment dan clear data
-                cursor.execute("DELETE FROM contacts")
-                
-                # Insert test data
-                insert_query = """
-                INSERT INTO contacts (name, email, phone, title, created) 
-                VALUES (%s, %s, %s, %s, %s)
-                """
-                test_data = [
-                    ('John Doe', 'john.doe@email.com', '08123456789', 'Software Engineer', '2023-01-15 10:00:00'),
-                    ('Jane Smith', 'jane.smith@email.com', '08987654321', 'Product Manager', '2023-01-16 11:00:00'),
-                    ('Bob Johnson', 'bob.johnson@email.com', '08111111111', 'QA Engineer', '2023-01-17 12:00:00'),
-                ]
-                
-                for data in test_data:
-                    cursor.execute(insert_query, data)
-                
-                connection.commit()
-            except Exception as e:
-                print(f"Error resetting database: {e}")
-                connection.rollback()
+                with PHASE_TIMINGS.timed('mysql.load'):
+                    load_sql_file(connection, BASE_DB_NAME)
+                    apply_migrations(connection, BASE_DB_NAME)
             finally:
-                cursor.close()
                 connection.close()
-        
-        time.sleep(0.5)  # Extra buffer time
+        print(f"\n[MySQL] {WORKER_ID}: {'MariaDB' if server.is_mariadb else 'MySQL'} "
+              f"di {DB_HOST}:{DB_PORT}, data {server.datadir}")
+        yield server
     finally:
-        # Release lock
-        try:
-            if os.path.exists(lock_file):
-                os.remove(lock_file)
-        except:
-            pass
+        for database in (None, BASE_DB_NAME, DB_NAME):
+            close_pool(DB_HOST, DB_USER, database, port=DB_PORT)
+        server.stop()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_database(mysql_server):
+    """
+    Fixture untuk database terisolasi per xdist worker.
+    Template dibangun sekali dari damncrud.sql, lalu di-clone untuk worker ini.
+    """
+    if not IS_ISOLATED_DB:
+        yield DB_NAME
+        return
+    if APP_SERVER != 'php':
+        # Satu Apache untuk semua worker hanya melayani database dari SetEnv-nya
+        pytest.fail("pytest -n (xdist) membutuhkan APP_SERVER=php: setiap worker menjalankan "
+                    "php -S dengan DAMNCRUD_DB_NAME database worker", pytrace=False)
+
+    connection = get_server_connection()
+    try:
+        timings = {}
+        ensure_template(connection, TEMPLATE_DB_NAME, timings=timings)
+        PHASE_TIMINGS.record('db_template.lock_wait', timings['lock_wait'])
+        PHASE_TIMINGS.record('db_template.build', timings['build'])
+        with PHASE_TIMINGS.timed('db_clone'):
+            clone_database(connection, TEMPLATE_DB_NAME, DB_NAME)
+    finally:
+        connection.close()
+
+    yield DB_NAME
+
+    # Tutup koneksi ke database worker sebelum di-drop
+    close_pool(DB_HOST, DB_USER, DB_NAME, port=DB_PORT)
+    connection = get_server_connection()
+    try:
+        drop_database(connection, DB_NAME)
+    finally:
+        connection.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def app_server(worker_database):
+    """
+    Fixture untuk aplikasi per worker jika APP_SERVER=php: php -S di BASE_URL
+    dengan database worker dari environment. Log di tests/reports/php_server/.
+    """
+    if APP_SERVER != 'php':
+        yield BASE_URL
+        return
+
+    server = PhpServer(APP_PORT, env={
+        'DAMNCRUD_DB_HOST': DB_HOST,
+        'DAMNCRUD_DB_PORT': str(DB_PORT),
+        'DAMNCRUD_DB_USER': DB_USER,
+        'DAMNCRUD_DB_PASS': DB_PASSWORD,
+        'DAMNCRUD_DB_NAME': worker_database,
+    }, log_path=os.path.join(os.path.dirname(__file__), 'reports', 'php_server', f"{WORKER_ID}.log"))
+    server.start()
+    try:
+        server.wait_ready()
+        print(f"\n[AppServer] {WORKER_ID}: php -S di {server.base_url}")
+        yield server.base_url
+    finally:
+        server.stop()
+
+
+@pytest.fixture(scope="session")
+def db_pool(worker_database):
+    """
+    Fixture untuk pool koneksi database worker (stats dicetak di akhir session)
+    """
+    pool = get_pool(DB_HOST, DB_USER, DB_PASSWORD, DB_NAME, port=DB_PORT)
+
+    yield pool
+
+    print(f"\n[DBPool] {DB_NAME}: {pool.stats}")
+    pool.close_all()
+
+
+def _contacts_restored(cursor, dirty):
+    # Restore contacts juga write: naikkan versi supaya ETag/cache count PHP tidak basi
+    if 'contacts' in dirty:
+        bump_contacts_version(cursor)
+
+
+@pytest.fixture(scope="session")
+def reset_engine(db_pool):
+    """
+    Fixture untuk ResetEngine: seed data test sekali lalu snapshot sebagai baseline
+    """
+    repository = ContactRepository(get_db_connection)
+    repository.replace_all(TEST_CONTACTS)
+    repository.close()
+
+    engine = ResetEngine(get_db_connection, RESET_TABLES, on_restore=_contacts_restored)
+    engine.snapshot()
+
+    yield engine
+
+    engine.close()
+    stats = engine.stats
+    if stats['resets']:
+        print(f"\n[ResetEngine] {stats['resets']} resets, {stats['clean']} clean, "
+              f"{stats['restored_tables']} table restores, "
+              f"avg {stats['total_ms'] / stats['resets']:.2f} ms")
+
+
+@pytest.fixture(autouse=True)
+def reset_database(request, reset_engine):
+    """
+    Fixture untuk reset database sebelum setiap test
+    Hanya tabel yang berubah sejak baseline yang di-restore
+    """
+    elapsed_ms, dirty = reset_engine.reset()
+    PHASE_TIMINGS.record('db_reset.checksum', reset_engine.last_timings['checksum'])
+    PHASE_TIMINGS.record('db_reset.restore', reset_engine.last_timings['restore'])
+    request.node.user_properties.append(("db_reset_ms", round(elapsed_ms, 3)))
+    request.node.user_properties.append(("db_reset_tables", ",".join(dirty) or "-"))
     
     yield
+
+
+@pytest.fixture
+def synthetic_contacts(request, reset_database):
+    """
+    Fixture untuk bulk load contacts sintetis (jumlah via indirect parametrize)
+
+    @pytest.mark.parametrize("synthetic_contacts", [100000], indirect=True)
+    """
+    count = getattr(request, "param", SYNTHETIC_ROWS)
+    connection = get_db_connection()
+    try:
+        report = bulk_load(connection, count)
+        cursor = connection.cursor()
+        bump_contacts_version(cursor)
+        connection.commit()
+        cursor.close()
+    finally:
+        connection.close()
+    request.node.user_properties.append(("synthetic_rows_per_sec", round(report.rows_per_sec)))
     
-    # Cleanup after test jika diperlukan
+    yield report
 
 
 class LoginHelper:
@@ -175,29 +418,212 @@ class LoginHelper:
     @staticmethod
     def login(driver, username=ADMIN_USERNAME, password=ADMIN_PASSWORD):
         """Login dengan kredensial yang diberikan"""
-        driver.get(f"{BASE_URL}/login.php")
+        with PHASE_TIMINGS.timed('login'):
+            driver.get(f"{BASE_URL}/login.php")
         
-        username_field = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located(("id", "inputUsername"))
-        )
-        password_field = driver.find_element("id", "inputPassword")
-        submit_button = driver.find_element("xpath", "//button[@type='submit']")
+            username_field = WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located(("id", "inputUsername"))
+            )
+            password_field = driver.find_element("id", "inputPassword")
+            submit_button = driver.find_element("xpath", "//button[@type='submit']")
         
-        username_field.send_keys(username)
-        password_field.send_keys(password)
-        submit_button.click()
+            username_field.send_keys(username)
+            password_field.send_keys(password)
+            submit_button.click()
         
-        # Wait for redirect to dashboard
-        WebDriverWait(driver, 10).until(
-            EC.url_contains("/index.php")
-        )
-        time.sleep(1)
+            # Wait for redirect to dashboard
+            wait_for_redirect_to_index(driver)
+
+
+@pytest.fixture(scope="session")
+def auth_cache():
+    """
+    Fixture untuk cache session login (satu login HTTP per worker)
+    """
+    cache = AuthCache(BASE_URL, ADMIN_USERNAME, ADMIN_PASSWORD)
+
+    yield cache
+
+    print(f"[AuthCache] Stats: {cache.stats}")
 
 
 @pytest.fixture
-def authenticated_browser(browser):
+def authenticated_browser(browser, auth_cache):
     """
-    Fixture untuk browser yang sudah login
+    Fixture untuk browser yang sudah login (inject PHPSESSID dari cache)
     """
-    LoginHelper.login(browser)
+    with PHASE_TIMINGS.timed('login'):
+        auth_cache.authenticate(browser)
     yield browser
+
+
+@pytest.fixture
+def http_client():
+    """
+    Fixture untuk client HTTP tanpa browser (cookie jar sendiri per test)
+    """
+    yield HttpClient(BASE_URL)
+
+
+@pytest.fixture
+def authenticated_http(http_client, auth_cache):
+    """
+    Fixture untuk client HTTP yang sudah login (PHPSESSID dari auth_cache)
+    """
+    with PHASE_TIMINGS.timed('login'):
+        http_client.set_cookie(SESSION_COOKIE, auth_cache.get_session())
+        if 'login.php' in http_client.get('index.php').url:
+            auth_cache.invalidate()
+            http_client.set_cookie(SESSION_COOKIE, auth_cache.get_session())
+    yield http_client
+
+
+# ===== Phase timing plugin =====
+
+# Jumlah baris di tabel ringkasan akhir session
+PHASE_TOP_N = int(os.getenv('PHASE_TOP_N', '15'))
+PHASE_PROPERTY_PREFIX = 'phase_'
+
+
+class PhaseTimings:
+    """
+    Durasi per fase (detik, monotonic clock) untuk test yang sedang berjalan:
+    setup:/teardown:<fixture>, login, db_reset.*, db_template.*, wait:<nama>.
+    Fase bisa tumpang tindih (mis. login di dalam setup:authenticated_browser).
+    """
+
+    def __init__(self):
+        self.current = None
+        self._wait_mark = 0
+        self._teardown_started = {}
+
+    def start_item(self):
+        self.current = defaultdict(float)
+        self._wait_mark = len(WAIT_LOG)
+
+    def record(self, phase, seconds):
+        if self.current is not None:
+            self.current[phase] += seconds
+
+    @contextmanager
+    def timed(self, phase):
+        began = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(phase, time.monotonic() - began)
+
+    def fixture_teardown_started(self, fixturedef):
+        self._teardown_started[id(fixturedef)] = time.monotonic()
+
+    def fixture_teardown_finished(self, fixturedef):
+        began = self._teardown_started.pop(id(fixturedef), None)
+        if began is not None:
+            self.record(f"teardown:{fixturedef.argname}", time.monotonic() - began)
+
+    def finish_item(self):
+        """Tambahkan explicit waits dari WAIT_LOG lalu return fase test ini"""
+        for record in WAIT_LOG[self._wait_mark:]:
+            self.record(f"wait:{record.name.split('[')[0]}", record.elapsed)
+        self._wait_mark = len(WAIT_LOG)
+        phases, self.current = dict(self.current or {}), None
+        return phases
+
+
+PHASE_TIMINGS = PhaseTimings()
+
+# Agregat dari report (di controller xdist juga, lewat user_properties)
+_PHASE_TOTALS = defaultdict(lambda: [0.0, 0, 0.0])  # fase -> [total ms, count, max ms]
+_TEST_TOTALS = defaultdict(float)  # nodeid -> durasi setup + call + teardown (detik)
+
+
+def format_phases(phases):
+    lines = [f"{name:<40}{seconds * 1000:>10.1f} ms"
+             for name, seconds in sorted(phases.items(), key=lambda item: -item[1])]
+    return '\n'.join(lines) or '(tidak ada fase tercatat)'
+
+
+class PhaseTimingPlugin:
+    """
+    Hook timing. Didaftarkan sebagai plugin global (bukan hook conftest biasa)
+    supaya pytest_fixture_setup juga terpanggil untuk fixture session-scope,
+    yang dijalankan lewat hook proxy Session di luar direktori tests/.
+    """
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        PHASE_TIMINGS.start_item()
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        began = time.monotonic()
+        yield
+        PHASE_TIMINGS.record(f"setup:{fixturedef.argname}", time.monotonic() - began)
+        # Finalizer dijalankan LIFO: ini berjalan tepat sebelum teardown fixture itu sendiri
+        fixturedef.addfinalizer(lambda: PHASE_TIMINGS.fixture_teardown_started(fixturedef))
+
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        PHASE_TIMINGS.fixture_teardown_finished(fixturedef)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        if call.when != 'teardown':
+            return
+        report = outcome.get_result()
+        phases = PHASE_TIMINGS.finish_item()
+        # user_properties -> <properties> di JUnit XML; section -> log di pytest-html
+        report.user_properties.extend(
+            (f"{PHASE_PROPERTY_PREFIX}{name}_ms", round(seconds * 1000, 1))
+            for name, seconds in sorted(phases.items())
+        )
+        report.sections.append(("Phase timings", format_phases(phases)))
+
+    def pytest_runtest_logreport(self, report):
+        _TEST_TOTALS[report.nodeid] += report.duration
+        if report.when != 'teardown':
+            return
+        for name, value in report.user_properties:
+            if name.startswith(PHASE_PROPERTY_PREFIX) and name.endswith('_ms'):
+                totals = _PHASE_TOTALS[name[len(PHASE_PROPERTY_PREFIX):-len('_ms')]]
+                totals[0] += value
+                totals[1] += 1
+                totals[2] = max(totals[2], value)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not _PHASE_TOTALS:
+            return
+        write = terminalreporter.write_line
+        terminalreporter.write_sep("=", "phase timings (top time consumers)")
+        write(f"{'phase':<40}{'total s':>10}{'count':>8}{'avg ms':>10}{'max ms':>10}")
+        ranked = sorted(_PHASE_TOTALS.items(), key=lambda item: -item[1][0])
+        for name, (total_ms, count, max_ms) in ranked[:PHASE_TOP_N]:
+            write(f"{name:<40}{total_ms / 1000:>10.2f}{count:>8}{total_ms / count:>10.1f}{max_ms:>10.1f}")
+
+        write("")
+        write(f"{'slowest tests':<70}{'total s':>10}")
+        for nodeid, seconds in sorted(_TEST_TOTALS.items(), key=lambda item: -item[1])[:PHASE_TOP_N]:
+            write(f"{nodeid[-70:]:<70}{seconds:>10.2f}")
+
+
+def pytest_sessionstart(session):
+    # Controller (atau run tanpa xdist): buang data page metrics dari run sebelumnya
+    if not hasattr(session.config, 'workerinput'):
+        for path in glob.glob(os.path.join(RAW_DIR, '*.json')):
+            os.remove(path)
+
+
+def pytest_sessionfinish(session):
+    # Worker sudah menulis datanya di teardown fixture page_metrics
+    if not hasattr(session.config, 'workerinput'):
+        summary = merge_reports()
+        if summary:
+            print(f"\n[PageMetrics] {len(summary)} halaman diringkas ke tests/reports/page_metrics.json")
+
+
+def pytest_configure(config):
+    if not config.pluginmanager.has_plugin('phase_timing'):
+        config.pluginmanager.register(PhaseTimingPlugin(), 'phase_timing')
+    if not config.pluginmanager.has_plugin('duration_schedule'):
+        config.pluginmanager.register(DurationSchedulePlugin(), 'duration_schedule')
@@ -0,0 +1,199 @@
+"""
+contact_repository.py - Akses data tabel contacts dan users untuk fixtures dan tests
+
+Seeding memakai executemany (mysql.connector menggabungkannya menjadi satu
+INSERT multi-row) dan assertion bisa membaca database langsung, tanpa
+me-render ulang index.php. Satu koneksi autocommit per repository supaya
+setiap query (termasuk polling wait_until) melihat data terbaru.
+"""
+from collections import namedtuple
+
+from mysql.connector import errorcode, errors
+
+from waits import DEFAULT_TIMEOUT, poll
+
+Contact = namedtuple('Contact', 'id name email phone title created')
+User = namedtuple('User', 'id_user username password')
+
+CONTACT_COLUMNS = Contact._fields
+# Kolom yang diisi saat insert: (name, email, phone, title) atau + created
+_INSERT_COLUMNS = {4: CONTACT_COLUMNS[1:5], 5: CONTACT_COLUMNS[1:6]}
+
+# Versi contacts untuk ETag dan cache count di PHP (migration 002); dinaikkan
+# sekali per write, sama seperti contacts_changed() di functions.php
+_BUMP_VERSION = ("UPDATE contacts_version SET version = version + 1, "
+                 "updated = current_timestamp(6) WHERE id = 1")
+
+
+def bump_contacts_version(cursor):
+    """Naikkan versi contacts setelah write di luar aplikasi (seed, reset, bulk load)"""
+    try:
+        cursor.execute(_BUMP_VERSION)
+    except errors.ProgrammingError as e:
+        if e.errno != errorcode.ER_NO_SUCH_TABLE:
+            raise
+
+
+class ContactRepository:
+    """Query contacts/users (parameterized) lewat satu koneksi"""
+
+    def __init__(self, connect):
+        # connect: callable yang mengembalikan koneksi ke database aplikasi (mis. dari pool)
+        self.connect = connect
+        self._connection = None
+
+    def _cursor(self):
+        if self._connection is None or not self._connection.is_connected():
+            self._connection = self.connect()
+            self._connection.autocommit = True
+        return self._connection.cursor(buffered=True)
+
+    def _fetch(self, query, params=(), one=False):
+        cursor = self._cursor()
+        try:
+            cursor.execute(query, params)
+            return cursor.fetchone() if one else cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def close(self):
+        if self._connection is not None and self._connection.is_connected():
+            self._connection.close()
+        self._connection = None
+
+    # ===== Tulis =====
+
+    def _insert_many(self, cursor, contacts):
+        columns = _INSERT_COLUMNS[len(contacts[0])]
+        cursor.executemany(
+            f"INSERT INTO contacts ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})",
+            [tuple(contact) for contact in contacts],
+        )
+
+    def insert_many(self, contacts):
+        """
+        Insert banyak contact sekaligus; setiap item (name, email, phone, title)
+        atau (name, email, phone, title, created). Return jumlah row.
+        """
+        contacts = list(contacts)
+        if not contacts:
+            return 0
+        cursor = self._cursor()
+        try:
+            self._insert_many(cursor, contacts)
+            bump_contacts_version(cursor)
+        finally:
+            cursor.close()
+        return len(contacts)
+
+    def replace_all(self, contacts, truncate=False):
+        """
+        Ganti seluruh isi contacts dengan data seed dalam satu transaksi.
+        truncate=True juga me-reset AUTO_INCREMENT (TRUNCATE tidak bisa di-rollback).
+        """
+        contacts = list(contacts)
+        cursor = self._cursor()
+        try:
+            if truncate:
+                cursor.execute("TRUNCATE TABLE contacts")
+            self._connection.start_transaction()
+            try:
+                if not truncate:
+                    cursor.execute("DELETE FROM contacts")
+                if contacts:
+                    self._insert_many(cursor, contacts)
+                bump_contacts_version(cursor)
+                self._connection.commit()
+            except Exception:
+                self._connection.rollback()
+                raise
+        finally:
+            cursor.close()
+        return len(contacts)
+
+    def ensure_user(self, username, password_hash):
+        """Tambahkan user jika username belum ada; return True jika di-insert"""
+        cursor = self._cursor()
+        try:
+            cursor.execute(
+                "INSERT INTO users (username, password) SELECT %s, %s FROM DUAL "
+                "WHERE NOT EXISTS (SELECT 1 FROM users WHERE username = %s)",
+                (username, password_hash, username),
+            )
+            return cursor.rowcount == 1
+        finally:
+            cursor.close()
+
+    # ===== Baca =====
+
+    def get(self, contact_id):
+        row = self._fetch(f"SELECT {', '.join(CONTACT_COLUMNS)} FROM contacts WHERE id = %s",
+                          (int(contact_id),), one=True)
+        return Contact(*row) if row else None
+
+    def get_by_email(self, email):
+        row = self._fetch(f"SELECT {', '.join(CONTACT_COLUMNS)} FROM contacts WHERE email = %s "
+                          "ORDER BY id LIMIT 1", (email,), one=True)
+        return Contact(*row) if row else None
+
+    def get_user(self, username):
+        row = self._fetch("SELECT id_user, username, password FROM users WHERE username = %s",
+                          (username,), one=True)
+        return User(*row) if row else None
+
+    def version(self):
+        """Versi tabel contacts (contacts_version, dinaikkan sekali per write)"""
+        row = self._fetch("SELECT version FROM contacts_version WHERE id = 1", one=True)
+        return row[0] if row else None
+
+    def count(self, **filters):
+        """
+        COUNT(*) contacts dengan filter kolom: count(), count(email='a@b.c'),
+        count(email__like='%@load.test'), count(id__in=[1, 2])
+        """
+        where, params = [], []
+        for key, value in filters.items():
+            column, _, operator = key.partition('__')
+            if column not in CONTACT_COLUMNS:
+                raise ValueError(f"Kolom contacts tidak dikenal: {column}")
+            if operator == 'like':
+                where.append(f"{column} LIKE %s")
+                params.append(value)
+            elif operator == 'in':
+                values = list(value) or [None]
+                where.append(f"{column} IN ({', '.join(['%s'] * len(values))})")
+                params.extend(values)
+            elif not operator:
+                where.append(f"{column} = %s")
+                params.append(value)
+            else:
+                raise ValueError(f"Operator tidak dikenal: {operator}")
+        query = "SELECT COUNT(*) FROM contacts" + (f" WHERE {' AND '.join(where)}" if where else '')
+        return self._fetch(query, params, one=True)[0]
+
+    # ===== Wait =====
+
+    def wait_until(self, check, name, timeout=DEFAULT_TIMEOUT):
+        """Poll check(repository) sampai truthy; return hasilnya (TimeoutException jika habis)"""
+        return poll(lambda: check(self), f'db[{name}]', timeout, ignored=(Exception,))
+
+    def wait_for_contact(self, id=None, email=None, timeout=DEFAULT_TIMEOUT, **fields):
+        """Tunggu contact (by id atau email) ada dengan nilai fields tertentu; return Contact"""
+        if (id is None) == (email is None):
+            raise ValueError("Berikan tepat satu dari id atau email")
+
+        def check(repository):
+            contact = repository.get(id) if id is not None else repository.get_by_email(email)
+            if contact and all(getattr(contact, key) == value for key, value in fields.items()):
+                return contact
+            return None
+
+        return self.wait_until(check, f"contact[{id if id is not None else email}]", timeout)
+
+    def wait_for_absent(self, id=None, email=None, timeout=DEFAULT_TIMEOUT):
+        """Tunggu sampai contact (by id atau email) tidak ada lagi"""
+        if (id is None) == (email is None):
+            raise ValueError("Berikan tepat satu dari id atau email")
+        filters = {'id': int(id)} if id is not None else {'email': email}
+        return self.wait_until(lambda repository: repository.count(**filters) == 0,
+                               f"absent[{id if id is not None else email}]", timeout)
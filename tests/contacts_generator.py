@@ -0,0 +1,121 @@
+"""
+contacts_generator.py - Generator data contacts sintetis untuk scale testing
+
+Setiap row diturunkan dari index-nya saja (bukan dari state RNG), jadi
+hasilnya deterministik dan range mana pun bisa di-generate terpisah.
+Bulk load memakai executemany per batch.
+
+Usage:
+    python tests/contacts_generator.py 100000
+"""
+import sys
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+DEFAULT_SEED = 42
+DEFAULT_BATCH_SIZE = 5000
+
+FIRST_NAMES = [
+    'John', 'Jane', 'David', 'Sarah', 'Michael', 'Emily', 'Daniel', 'Laura',
+    'James', 'Olivia', 'Robert', 'Sophia', 'William', 'Emma', 'Joseph', 'Ava',
+    'Budi', 'Siti', 'Agus', 'Dewi', 'Ahmad', 'Rina', 'Eko', 'Putri',
+    'Wayan', 'Ketut', 'Andi', 'Fitri', 'Hendra', 'Maya', 'Rizky', 'Ayu',
+]
+LAST_NAMES = [
+    'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Miller', 'Davis', 'Wilson',
+    'Anderson', 'Taylor', 'Thomas', 'Moore', 'Martin', 'Jackson', 'White', 'Harris',
+    'Santoso', 'Wijaya', 'Saputra', 'Hidayat', 'Nugroho', 'Kusuma', 'Pratama', 'Lestari',
+    'Setiawan', 'Gunawan', 'Halim', 'Susanto', 'Siregar', 'Nasution', 'Sitompul', 'Tanjung',
+]
+TITLES = [
+    'Employee', 'Manager', 'Supervisor', 'Assistant', 'Director', 'Security',
+    'Software Engineer', 'QA Engineer', 'Product Manager', 'DevOps Engineer',
+    'UI/UX Designer', 'Accountant', 'Sales', 'Marketing', 'HR Specialist', 'Intern',
+]
+EMAIL_DOMAINS = ['example.com', 'example.org', 'example.net', 'mail.test']
+
+CREATED_START = datetime(2019, 1, 1)
+# Rata-rata jarak antar contact; created naik seiring id seperti data asli
+CREATED_STEP_SECONDS = 37
+
+LoadReport = namedtuple('LoadReport', 'rows seconds rows_per_sec')
+
+
+def _mix(index, seed):
+    """Hash integer 32-bit murah (Knuth multiplicative + xorshift)"""
+    h = (index * 2654435761 + seed * 40503) & 0xFFFFFFFF
+    h ^= h >> 16
+    h = (h * 73244475) & 0xFFFFFFFF
+    h ^= h >> 16
+    return h
+
+
+def make_contact(index, seed=DEFAULT_SEED):
+    """Contact ke-index sebagai tuple (name, email, phone, title, created)"""
+    h = _mix(index, seed)
+    first = FIRST_NAMES[h % len(FIRST_NAMES)]
+    last = LAST_NAMES[(h >> 5) % len(LAST_NAMES)]
+    domain = EMAIL_DOMAINS[(h >> 10) % len(EMAIL_DOMAINS)]
+    title = TITLES[(h >> 12) % len(TITLES)]
+    # Index di email menjamin keunikan
+    email = f"{first.lower()}.{last.lower()}{index}@{domain}"
+    phone = f"08{(h % 9000000000) + 1000000000}"
+    created = CREATED_START + timedelta(seconds=index * CREATED_STEP_SECONDS + (h % CREATED_STEP_SECONDS))
+    return (f"{first} {last}", email, phone, title, created.strftime('%Y-%m-%d %H:%M:%S'))
+
+
+def generate_contacts(count, seed=DEFAULT_SEED, start=0):
+    """Yield count contacts mulai dari index start"""
+    for index in range(start, start + count):
+        yield make_contact(index, seed)
+
+
+def iter_batches(count, batch_size=DEFAULT_BATCH_SIZE, seed=DEFAULT_SEED, start=0):
+    """Yield list contacts per batch"""
+    for offset in range(start, start + count, batch_size):
+        size = min(batch_size, start + count - offset)
+        yield [make_contact(index, seed) for index in range(offset, offset + size)]
+
+
+_INSERT = "INSERT INTO contacts (name, email, phone, title, created) VALUES (%s, %s, %s, %s, %s)"
+
+
+def _load_executemany(connection, count, batch_size, seed, start):
+    cursor = connection.cursor()
+    try:
+        for batch in iter_batches(count, batch_size, seed, start):
+            # mysql.connector menggabungkan executemany INSERT menjadi satu statement multi-row
+            cursor.executemany(_INSERT, batch)
+            connection.commit()
+    finally:
+        cursor.close()
+
+
+def bulk_load(connection, count, batch_size=DEFAULT_BATCH_SIZE, seed=DEFAULT_SEED, start=0):
+    """Bulk insert count contacts sintetis ke tabel contacts dan laporkan throughput"""
+    began = time.monotonic()
+    _load_executemany(connection, count, batch_size, seed, start)
+    seconds = time.monotonic() - began
+    report = LoadReport(count, seconds, count / seconds if seconds > 0 else float('inf'))
+    print(f"[Generator] {count} contacts dalam {seconds:.2f}s "
+          f"({report.rows_per_sec:,.0f} rows/s)")
+    return report
+
+
+if __name__ == "__main__":
+    from setup_db import DB_HOST, DB_USER, DB_PASSWORD, DB_NAME
+    from db_pool import get_pool
+    from contact_repository import bump_contacts_version
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    connection = get_pool(DB_HOST, DB_USER, DB_PASSWORD, DB_NAME).get_connection()
+    try:
+        bulk_load(connection, rows)
+        # Write di luar aplikasi: naikkan versi supaya ETag/cache count PHP tidak basi
+        cursor = connection.cursor()
+        bump_contacts_version(cursor)
+        connection.commit()
+        cursor.close()
+    finally:
+        connection.close()
@@ -0,0 +1,177 @@
+"""
+db_pool.py - Pool koneksi MySQL yang dipakai bersama conftest.py dan setup_db.py
+
+Koneksi dicek (ping) saat checkout, session di-reset (termasuk autocommit)
+saat dikembalikan, dan counter checkouts/waits/reconnects tersedia di pool.stats.
+close() pada koneksi yang dipinjam mengembalikannya ke pool, jadi kode
+lama yang memanggil connection.close() tetap bekerja.
+"""
+import os
+import threading
+import time
+
+import mysql.connector
+from mysql.connector import Error
+
+POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+CHECKOUT_TIMEOUT = 30
+DEFAULT_PORT = 3306
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class PoolExhausted(Error):
+    """Tidak ada koneksi yang kembali ke pool dalam batas waktu"""
+
+
+class PooledConnection:
+    """Proxy koneksi mysql.connector; close() mengembalikan ke pool"""
+
+    def __init__(self, pool, connection):
+        self._pool = pool
+        self._connection = connection
+
+    def __getattr__(self, name):
+        if self._connection is None:
+            raise Error("Koneksi sudah dikembalikan ke pool")
+        return getattr(self._connection, name)
+
+    def __setattr__(self, name, value):
+        # Properti koneksi (mis. autocommit) harus diset di koneksi aslinya, bukan di proxy
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+        elif self._connection is None:
+            raise Error("Koneksi sudah dikembalikan ke pool")
+        else:
+            setattr(self._connection, name, value)
+
+    def is_connected(self):
+        return self._connection is not None and self._connection.is_connected()
+
+    def close(self):
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            self._pool.release(connection)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ConnectionPool:
+    """Pool koneksi untuk satu kombinasi host/user/database"""
+
+    def __init__(self, size=POOL_SIZE, **config):
+        self.size = max(1, size)
+        self.config = config
+        self._idle = []
+        self._open = 0
+        self._lock = threading.Condition()
+        self.stats = {'created': 0, 'checkouts': 0, 'waits': 0, 'reconnects': 0, 'resets': 0}
+
+    def _connect(self):
+        connection = mysql.connector.connect(**self.config)
+        self.stats['created'] += 1
+        return connection
+
+    def _healthy(self, connection):
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Error:
+            return False
+
+    def get_connection(self, timeout=CHECKOUT_TIMEOUT):
+        """Pinjam koneksi yang sehat; tunggu jika semua sedang dipakai"""
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            if not self._idle and self._open >= self.size:
+                self.stats['waits'] += 1
+            while not self._idle and self._open >= self.size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._lock.wait(remaining):
+                    if not self._idle and self._open >= self.size:
+                        raise PoolExhausted(f"Pool penuh ({self.size}) setelah {timeout}s")
+            connection = self._idle.pop() if self._idle else None
+            self._open += 1 if connection is None else 0
+            self.stats['checkouts'] += 1
+
+        try:
+            if connection is None:
+                connection = self._connect()
+            elif not self._healthy(connection):
+                self.stats['reconnects'] += 1
+                try:
+                    connection.close()
+                except Error:
+                    pass
+                connection = self._connect()
+        except Exception:
+            with self._lock:
+                self._open -= 1
+                self._lock.notify()
+            raise
+
+        return PooledConnection(self, connection)
+
+    def release(self, connection):
+        """Reset session lalu kembalikan koneksi ke pool (buang jika rusak)"""
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+            # COM_RESET_CONNECTION: hapus variabel session, temp table, lock
+            connection.reset_session()
+            # autocommit=True dari peminjam (ContactRepository, ResetEngine) tidak ikut di-reset
+            # ke default mysql.connector; peminjam berikutnya selalu mulai dengan autocommit off
+            connection.autocommit = False
+            self.stats['resets'] += 1
+        except Error:
+            try:
+                connection.close()
+            except Error:
+                pass
+            connection = None
+
+        with self._lock:
+            if connection is None:
+                self._open -= 1
+            else:
+                self._idle.append(connection)
+            self._lock.notify()
+
+    def close_all(self):
+        """Tutup semua koneksi idle"""
+        with self._lock:
+            for connection in self._idle:
+                try:
+                    connection.close()
+                except Error:
+                    pass
+            self._open -= len(self._idle)
+            self._idle = []
+
+
+def get_pool(host, user, password, database=None, size=POOL_SIZE, port=DEFAULT_PORT):
+    """Ambil pool bersama untuk konfigurasi ini (dibuat saat pertama dipakai)"""
+    key = (host, port, user, database)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            config = {'host': host, 'port': port, 'user': user, 'password': password}
+            if database:
+                config['database'] = database
+            pool = ConnectionPool(size=size, **config)
+            _pools[key] = pool
+        return pool
+
+
+def close_pool(host, user, database=None, port=DEFAULT_PORT):
+    """Tutup dan lupakan pool (mis. sebelum database-nya di-drop)"""
+    with _pools_lock:
+        pool = _pools.pop((host, port, user, database), None)
+    if pool is not None:
+        pool.close_all()
+    return pool
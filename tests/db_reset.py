@@ -0,0 +1,152 @@
+"""
+db_reset.py - Reset database cepat dengan dirty tracking
+
+Baseline isi tabel di-snapshot sekali. Sebelum setiap test, satu query
+menghitung row count + checksum semua tabel yang di-track; hanya tabel
+yang berubah yang di-restore (DELETE + satu INSERT multi-row per tabel).
+Jika tidak ada yang berubah, reset hanya berupa satu round trip.
+"""
+import time
+
+# Separator kolom untuk checksum (unit separator, tidak muncul di data biasa)
+_SEPARATOR = "0x1f"
+
+# Di atas jumlah row ini TRUNCATE jauh lebih cepat daripada DELETE (mis. setelah scale test)
+TRUNCATE_THRESHOLD = 10000
+
+
+class ResetError(Exception):
+    """Isi tabel setelah restore tidak sama dengan baseline"""
+
+
+class ResetEngine:
+    """Snapshot baseline dan restore hanya tabel yang kotor"""
+
+    def __init__(self, connect, tables, on_restore=None):
+        self.connect = connect
+        self.tables = list(tables)
+        # on_restore(cursor, dirty): dipanggil di transaksi restore sebelum commit
+        self.on_restore = on_restore
+        self._connection = None
+        self._columns = {}
+        self._baseline_rows = {}
+        self._baseline_marks = {}
+        self._checksum_query = None
+        self.stats = {'resets': 0, 'clean': 0, 'restored_tables': 0, 'total_ms': 0.0}
+        # Durasi (detik) bagian reset terakhir: query checksum vs SQL restore
+        self.last_timings = {}
+
+    @property
+    def has_baseline(self):
+        return bool(self._baseline_marks)
+
+    def _cursor(self):
+        if self._connection is None or not self._connection.is_connected():
+            self._connection = self.connect()
+            # Autocommit supaya setiap checksum melihat data terbaru (bukan snapshot transaksi lama)
+            self._connection.autocommit = True
+        return self._connection.cursor()
+
+    def _load_columns(self, cursor):
+        for table in self.tables:
+            cursor.execute(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = DATABASE() AND table_name = %s "
+                "ORDER BY ordinal_position",
+                (table,)
+            )
+            self._columns[table] = [row[0] for row in cursor.fetchall()]
+
+        parts = []
+        for table in self.tables:
+            fields = ', '.join(f"IFNULL(`{column}`, 0x00)" for column in self._columns[table])
+            parts.append(
+                f"SELECT '{table}', COUNT(*), "
+                f"IFNULL(BIT_XOR(CRC32(CONCAT_WS({_SEPARATOR}, {fields}))), 0) "
+                f"FROM `{table}`"
+            )
+        self._checksum_query = ' UNION ALL '.join(parts)
+
+    def _marks(self, cursor):
+        """(row count, checksum) per tabel dalam satu round trip"""
+        cursor.execute(self._checksum_query)
+        return {table: (count, checksum) for table, count, checksum in cursor.fetchall()}
+
+    def snapshot(self):
+        """Simpan isi tabel saat ini sebagai baseline"""
+        cursor = self._cursor()
+        try:
+            self._load_columns(cursor)
+            for table in self.tables:
+                columns = ', '.join(f"`{column}`" for column in self._columns[table])
+                cursor.execute(f"SELECT {columns} FROM `{table}`")
+                self._baseline_rows[table] = cursor.fetchall()
+            self._baseline_marks = self._marks(cursor)
+        finally:
+            cursor.close()
+
+    def _restore(self, cursor, table, truncated):
+        columns = self._columns[table]
+        if not truncated:
+            cursor.execute(f"DELETE FROM `{table}`")
+        rows = self._baseline_rows[table]
+        if rows:
+            # executemany untuk INSERT digabung menjadi satu statement multi-row
+            cursor.executemany(
+                f"INSERT INTO `{table}` ({', '.join(f'`{c}`' for c in columns)}) "
+                f"VALUES ({', '.join(['%s'] * len(columns))})",
+                rows
+            )
+
+    def reset(self):
+        """
+        Restore tabel yang berubah sejak baseline.
+        Return (elapsed_ms, daftar tabel yang di-restore).
+        """
+        start = time.monotonic()
+        restore_began = None
+        cursor = self._cursor()
+        try:
+            marks = self._marks(cursor)
+            dirty = [table for table in self.tables if marks.get(table) != self._baseline_marks.get(table)]
+            if dirty:
+                restore_began = time.monotonic()
+                # TRUNCATE melakukan commit implisit, jadi dijalankan sebelum transaksi
+                # restore (bukan di dalamnya); hasil akhirnya diverifikasi dengan checksum
+                truncated = {table for table in dirty if marks[table][0] > TRUNCATE_THRESHOLD}
+                for table in truncated:
+                    cursor.execute(f"TRUNCATE TABLE `{table}`")
+                self._connection.start_transaction()
+                try:
+                    for table in dirty:
+                        self._restore(cursor, table, table in truncated)
+                    if self.on_restore:
+                        self.on_restore(cursor, dirty)
+                    self._connection.commit()
+                except Exception:
+                    self._connection.rollback()
+                    raise
+                if truncated:
+                    restored = self._marks(cursor)
+                    mismatched = [table for table in dirty if restored.get(table) != self._baseline_marks.get(table)]
+                    if mismatched:
+                        raise ResetError(f"Restore tidak sama dengan baseline: {', '.join(mismatched)}")
+        finally:
+            cursor.close()
+
+        finished = time.monotonic()
+        elapsed_ms = (finished - start) * 1000
+        self.last_timings = {
+            'checksum': (restore_began or finished) - start,
+            'restore': finished - restore_began if restore_began else 0.0,
+        }
+        self.stats['resets'] += 1
+        self.stats['clean'] += 0 if dirty else 1
+        self.stats['restored_tables'] += len(dirty)
+        self.stats['total_ms'] += elapsed_ms
+        return elapsed_ms, dirty
+
+    def close(self):
+        if self._connection is not None and self._connection.is_connected():
+            self._connection.close()
+        self._connection = None
@@ -0,0 +1,121 @@
+"""
+driver_pool.py - Pool WebDriver yang tetap hangat selama satu session pytest
+
+Setiap xdist worker adalah process terpisah, jadi pool ini otomatis
+per-worker. Driver dipinjamkan ke test, di-reset saat dikembalikan
+(cookies, storage, about:blank), dan diganti baru jika ternyata rusak.
+"""
+import os
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+# Jumlah driver per worker (default 1, cukup untuk test yang berjalan serial per worker)
+POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', '1'))
+
+BLANK_PAGE = 'about:blank'
+
+
+class DriverPool:
+    """Pool sederhana untuk WebDriver instances"""
+
+    def __init__(self, factory, size=POOL_SIZE, implicit_wait=None):
+        self.factory = factory
+        self.size = max(1, size)
+        self.implicit_wait = implicit_wait
+        self._idle = []
+        self._all = []
+        self._lock = threading.Condition()
+        self.stats = {'created': 0, 'reused': 0, 'recycled': 0}
+
+    def _create(self):
+        driver = self.factory()
+        self._all.append(driver)
+        self.stats['created'] += 1
+        return driver
+
+    def _discard(self, driver):
+        if driver in self._all:
+            self._all.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def is_alive(driver):
+        """Cek apakah driver masih bisa menerima command"""
+        try:
+            driver.current_url
+            return len(driver.window_handles) > 0
+        except Exception:
+            return False
+
+    def acquire(self):
+        """Pinjam driver dari pool, buat baru jika belum penuh"""
+        with self._lock:
+            while True:
+                while self._idle:
+                    driver = self._idle.pop()
+                    if self.is_alive(driver):
+                        self.stats['reused'] += 1
+                        return driver
+                    self.stats['recycled'] += 1
+                    self._discard(driver)
+                if len(self._all) < self.size:
+                    return self._create()
+                self._lock.wait()
+
+    def release(self, driver):
+        """Kembalikan driver ke pool setelah di-reset; driver rusak dibuang"""
+        try:
+            self.reset(driver)
+        except Exception as e:
+            print(f"[DriverPool] Driver rusak, recycle: {str(e)[:100]}")
+            with self._lock:
+                self.stats['recycled'] += 1
+                self._discard(driver)
+                self._lock.notify()
+            return
+
+        with self._lock:
+            self._idle.append(driver)
+            self._lock.notify()
+
+    def reset(self, driver):
+        """Bersihkan state browser supaya test berikutnya mulai dari nol"""
+        # Tutup window tambahan yang mungkin dibuka oleh test
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Storage hanya bisa di-clear dari origin halaman yang sedang dibuka
+        if driver.current_url.startswith('http'):
+            try:
+                driver.execute_script(
+                    "window.localStorage.clear(); window.sessionStorage.clear();"
+                )
+            except WebDriverException:
+                pass
+
+        try:
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        except (AttributeError, WebDriverException):
+            driver.delete_all_cookies()
+
+        driver.get(BLANK_PAGE)
+        if self.implicit_wait is not None:
+            driver.implicitly_wait(self.implicit_wait)
+
+        if not self.is_alive(driver):
+            raise WebDriverException("Driver tidak merespon setelah reset")
+
+    def close(self):
+        """Quit semua driver di pool"""
+        with self._lock:
+            for driver in list(self._all):
+                self._discard(driver)
+            self._idle = []
+        print(f"[DriverPool] Closed. Stats: {self.stats}")
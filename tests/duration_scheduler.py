@@ -0,0 +1,263 @@
+"""
+duration_scheduler.py - Pembagian test ke xdist worker berdasarkan durasi
+
+Controller mencatat durasi setiap test (setup + call + teardown) ke file
+history lokal (tests/.test_durations.json). Run berikutnya dengan `-n N`
+memakai DurationScheduling: test diurutkan dari yang paling lama dan setiap
+test diberikan ke worker dengan total estimasi terkecil (longest processing
+time first). Worker yang antriannya habis lebih dulu mengambil test terpendek
+dari antrian worker lain, sehingga estimasi yang meleset tetap seimbang.
+
+Opsional DURATION_GROUP_FIXTURES=synthetic_contacts,driver_pool: test yang
+memakai fixture (dan parameter) yang sama dijadwalkan sebagai satu unit di
+worker yang sama.
+"""
+import heapq
+import json
+import os
+import statistics
+from collections import defaultdict
+
+import pytest
+
+try:
+    from xdist.scheduler import LoadScheduling
+except ImportError:  # pytest-xdist tidak terpasang: history tetap dicatat
+    LoadScheduling = object
+
+HISTORY_PATH = os.getenv('TEST_DURATIONS_FILE',
+                         os.path.join(os.path.dirname(__file__), '.test_durations.json'))
+DURATION_SCHEDULE = os.getenv('DURATION_SCHEDULE', '1') == '1'
+DURATION_GROUP_FIXTURES = tuple(name.strip() for name in os.getenv('DURATION_GROUP_FIXTURES', '').split(',')
+                                if name.strip())
+
+# Bobot run terbaru pada rata-rata bergerak durasi di history
+HISTORY_WEIGHT = 0.5
+# Estimasi test tanpa history jika history kosong sama sekali (detik)
+DEFAULT_ESTIMATE = 1.0
+
+
+def load_history(path=HISTORY_PATH):
+    """{nodeid: {'duration': detik, 'fixtures': [...], 'runs': n}}"""
+    try:
+        with open(path) as f:
+            return json.load(f).get('tests', {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_history(history, durations, fixtures, path=HISTORY_PATH):
+    """Gabungkan durasi run ini ke history (rata-rata bergerak) lalu tulis ke path"""
+    for nodeid, seconds in durations.items():
+        entry = history.setdefault(nodeid, {'duration': seconds, 'runs': 0})
+        if entry['runs']:
+            entry['duration'] = HISTORY_WEIGHT * seconds + (1 - HISTORY_WEIGHT) * entry['duration']
+        else:
+            entry['duration'] = seconds
+        entry['duration'] = round(entry['duration'], 4)
+        entry['runs'] += 1
+        if nodeid in fixtures:
+            entry['fixtures'] = fixtures[nodeid]
+    with open(path, 'w') as f:
+        json.dump({'tests': history}, f, indent=1, sort_keys=True)
+    return path
+
+
+def fixture_keys(item):
+    """Fixture yang dipakai test, dengan parameter indirect: ['browser', 'synthetic_contacts=10000']"""
+    params = getattr(getattr(item, 'callspec', None), 'params', {})
+    return [f"{name}={params[name]}" if name in params else name for name in item.fixturenames]
+
+
+def group_key(fixtures, group_fixtures):
+    """Kunci grup dari fixture mahal yang dipakai test; () jika tidak termasuk grup"""
+    return tuple(sorted(key for key in fixtures if key.split('=', 1)[0] in group_fixtures))
+
+
+def build_units(collection, history, group_fixtures=()):
+    """
+    Unit penjadwalan [estimasi detik, [index test]]: satu test per unit, atau
+    semua test dengan kunci grup yang sama. Test tanpa history memakai median.
+    """
+    known = [history[nodeid]['duration'] for nodeid in collection if nodeid in history]
+    default = statistics.median(known) if known else DEFAULT_ESTIMATE
+
+    units = []
+    groups = {}
+    for index, nodeid in enumerate(collection):
+        entry = history.get(nodeid, {})
+        estimate = entry.get('duration', default)
+        key = group_key(entry.get('fixtures', ()), group_fixtures)
+        if not key:
+            units.append([estimate, [index]])
+            continue
+        if key not in groups:
+            groups[key] = [0.0, []]
+            units.append(groups[key])
+        groups[key][0] += estimate
+        groups[key][1].append(index)
+    return units
+
+
+def lpt_assign(units, bins):
+    """
+    Longest processing time first: unit terurut dari estimasi terbesar, masing-
+    masing ke bin dengan total terkecil. Return [[total, [unit, ...]], ...]
+    dengan unit di setiap bin tetap terurut dari yang terlama.
+    """
+    result = [[0.0, []] for _ in range(bins)]
+    heap = [(0.0, number) for number in range(bins)]
+    for unit in sorted(units, key=lambda unit: (-unit[0], unit[1][0])):
+        load, number = heapq.heappop(heap)
+        result[number][0] += unit[0]
+        result[number][1].append(unit)
+        heapq.heappush(heap, (result[number][0], number))
+    return result
+
+
+class DurationScheduling(LoadScheduling):
+    """
+    Scheduler xdist dengan antrian per worker hasil LPT. Interface sama dengan
+    LoadScheduling; worker selalu diberi 2 test pending karena test baru
+    dijalankan setelah worker tahu test berikutnya (atau menerima shutdown).
+    """
+
+    def __init__(self, config, log=None, history=None, group_fixtures=()):
+        super().__init__(config, log)
+        self.history = history or {}
+        self.group_fixtures = group_fixtures
+        self.queues = {}  # node -> [[estimasi, [index]], ...] terlama dulu
+        self.unassigned = []  # unit dari worker yang mati
+        self.plan = {}  # gateway id -> estimasi total detik
+
+    @property
+    def tests_finished(self):
+        if not self.collection_is_completed or self._has_queued():
+            return False
+        return all(len(pending) < 2 for pending in self.node2pending.values())
+
+    @property
+    def has_pending(self):
+        return self._has_queued() or any(self.node2pending.values())
+
+    def _has_queued(self):
+        return bool(self.unassigned) or any(self.queues.values())
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = list(self.node2collection.values())[0]
+        units = build_units(self.collection, self.history, self.group_fixtures)
+        for node, (load, assigned) in zip(self.nodes, lpt_assign(units, len(self.nodes))):
+            self.queues[node] = assigned
+            self.plan[node.gateway.id] = load
+        for node in self.nodes:
+            self.check_schedule(node)
+
+    def _steal(self, node):
+        """Ambil unit terpendek dari antrian dengan sisa estimasi terbesar"""
+        if self.unassigned:
+            return self.unassigned.pop(0)
+        victims = [(sum(unit[0] for unit in queue), other) for other, queue in self.queues.items()
+                   if other is not node and queue]
+        if not victims:
+            return None
+        _, victim = max(victims, key=lambda victim: victim[0])
+        return self.queues[victim].pop()
+
+    def check_schedule(self, node, duration=0):
+        if node.shutting_down:
+            return
+
+        queue = self.queues.setdefault(node, [])
+        pending = self.node2pending[node]
+        indices = []
+        while len(pending) + len(indices) < 2:
+            unit = queue.pop(0) if queue else self._steal(node)
+            if unit is None:
+                break
+            indices.extend(unit[1])
+        if indices:
+            pending.extend(indices)
+            node.send_runtest_some(indices)
+        if not queue and not self._has_queued():
+            node.shutdown()
+
+        self.log("num units waiting:", sum(len(queue) for queue in self.queues.values()))
+
+    def mark_test_pending(self, item):
+        self.unassigned.insert(0, [0.0, [self.collection.index(item)]])
+        for node in self.node2pending:
+            self.check_schedule(node)
+
+    def remove_node(self, node):
+        pending = self.node2pending.pop(node)
+        self.unassigned.extend(self.queues.pop(node, []))
+        if not pending:
+            return None
+
+        crashitem = self.collection[pending.pop(0)]
+        self.unassigned.extend([0.0, [index]] for index in pending)
+        for other in self.node2pending:
+            self.check_schedule(other)
+        return crashitem
+
+
+class DurationSchedulePlugin:
+    """
+    Catat durasi per test di controller (report dari semua worker) dan pasang
+    DurationScheduling jika history tersedia. Didaftarkan di conftest.
+    """
+
+    def __init__(self, path=HISTORY_PATH):
+        self.path = path
+        self.history = load_history(path)
+        self.durations = defaultdict(float)
+        self.fixtures = {}
+        self.worker_totals = defaultdict(float)
+        self.scheduler = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        if call.when == 'teardown':
+            # Atribut tambahan ikut diserialisasi ke controller oleh xdist
+            outcome.get_result().schedule_fixtures = fixture_keys(item)
+
+    def pytest_runtest_logreport(self, report):
+        self.durations[report.nodeid] += report.duration
+        if report.when == 'teardown' and hasattr(report, 'schedule_fixtures'):
+            self.fixtures[report.nodeid] = report.schedule_fixtures
+        node = getattr(report, 'node', None)
+        if node is not None:
+            self.worker_totals[node.gateway.id] += report.duration
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        # Hanya menggantikan --dist load (default -n); mode lain dan run pertama tanpa history tetap bawaan xdist
+        if not DURATION_SCHEDULE or not self.history or config.getvalue('dist') != 'load':
+            return None
+        self.scheduler = DurationScheduling(config, log, self.history, DURATION_GROUP_FIXTURES)
+        return self.scheduler
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(session.config, 'workerinput') or not self.durations:
+            return
+        save_history(self.history, self.durations, self.fixtures, self.path)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.scheduler is None or not self.scheduler.plan:
+            return
+        terminalreporter.write_sep("=", "duration scheduling (LPT)")
+        terminalreporter.write_line(f"{'worker':<10}{'estimated s':>14}{'actual s':>12}")
+        for worker, estimate in sorted(self.scheduler.plan.items()):
+            terminalreporter.write_line(f"{worker:<10}{estimate:>14.2f}{self.worker_totals.get(worker, 0.0):>12.2f}")
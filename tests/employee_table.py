@@ -0,0 +1,154 @@
+"""
+employee_table.py - Page object untuk tabel #employee di index.php
+
+Seluruh tabel diambil dalam satu execute_script (bukan find_elements per
+row lalu .text per cell), dikembalikan sebagai Row terstruktur dengan
+lookup ber-index berdasarkan id, name atau email.
+
+- visible(): row yang sedang dirender di DOM (halaman DataTables saat ini)
+- all_rows(): seluruh data set lewat ajax DataTables (search, filter dan
+  urutan yang sama dengan tabel), semua halaman diambil di dalam browser
+"""
+from collections import namedtuple
+
+from waits import TABLE_SELECTOR
+
+# contacts_data.php membatasi length maksimal 1000 per request
+API_PAGE_SIZE = 1000
+
+Row = namedtuple('Row', 'id name email phone title created edit_url delete_url')
+
+_VISIBLE_JS = """
+var table = document.querySelector(arguments[0]);
+if (!table) { return null; }
+var headers = Array.prototype.map.call(table.querySelectorAll('thead th'), function (th) {
+    return th.textContent.trim();
+});
+var rows = [];
+var trs = table.tBodies.length ? table.tBodies[0].rows : [];
+for (var i = 0; i < trs.length; i++) {
+    // Row "No data available" DataTables hanya punya satu cell (colspan)
+    if (trs[i].cells.length < 2) { continue; }
+    rows.push({
+        cells: Array.prototype.map.call(trs[i].cells, function (td) { return td.textContent.trim(); }),
+        links: Array.prototype.map.call(trs[i].querySelectorAll('a[href]'), function (a) { return a.href; })
+    });
+}
+return {headers: headers, rows: rows, total: rows.length};
+"""
+
+_ALL_ROWS_JS = """
+var sel = arguments[0], pageSize = arguments[1], done = arguments[arguments.length - 1];
+if (!window.jQuery || !jQuery.fn.dataTable || !jQuery.fn.dataTable.isDataTable(sel)) {
+    done(null);
+    return;
+}
+var api = jQuery(sel).DataTable();
+var headers = api.columns().header().toArray().map(function (th) { return th.textContent.trim(); });
+var params = jQuery.extend(true, {}, api.ajax.params() || {});
+var rows = [];
+function toRow(data) {
+    var holder = document.createElement('div');
+    var cells = [], links = [];
+    for (var i = 0; i < data.length; i++) {
+        holder.innerHTML = String(data[i] === null ? '' : data[i]);
+        cells.push(holder.textContent.trim());
+        holder.querySelectorAll('a[href]').forEach(function (a) { links.push(a.href); });
+    }
+    return {cells: cells, links: links};
+}
+function page(start) {
+    params.start = start;
+    params.length = pageSize;
+    jQuery.ajax({url: api.ajax.url(), data: params, dataType: 'json'}).done(function (json) {
+        rows = rows.concat(json.data.map(toRow));
+        if (json.data.length === pageSize && rows.length < json.recordsFiltered) {
+            page(start + pageSize);
+        } else {
+            done({headers: headers, rows: rows, total: json.recordsFiltered});
+        }
+    }).fail(function (xhr) {
+        done({error: xhr.status});
+    });
+}
+page(0);
+"""
+
+
+def _link(links, page):
+    return next((link for link in links if page in link), None)
+
+
+def _to_row(raw):
+    cells = raw['cells'] + [''] * (6 - len(raw['cells']))
+    return Row(int(cells[0]), cells[1], cells[2], cells[3], cells[4], cells[5],
+               _link(raw['links'], 'update.php'), _link(raw['links'], 'delete.php'))
+
+
+class TableSnapshot:
+    """Header dan rows #employee pada satu waktu, dengan index per id/name/email"""
+
+    def __init__(self, headers, rows, total=None):
+        self.headers = headers
+        self.rows = rows
+        # recordsFiltered dari server (all_rows) atau jumlah row di DOM (visible)
+        self.total = len(rows) if total is None else total
+        self._index = {'id': {}, 'name': {}, 'email': {}}
+        for row in rows:
+            for key, index in self._index.items():
+                index.setdefault(str(getattr(row, key)), []).append(row)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    @staticmethod
+    def _lookup(id=None, name=None, email=None):
+        given = [(key, value) for key, value in (('id', id), ('name', name), ('email', email))
+                 if value is not None]
+        if len(given) != 1:
+            raise ValueError("Berikan tepat satu dari id, name atau email")
+        return given[0]
+
+    def find_all(self, id=None, name=None, email=None):
+        """Semua row dengan id/name/email tersebut (name bisa duplikat)"""
+        key, value = self._lookup(id, name, email)
+        return list(self._index[key].get(str(value), []))
+
+    def get(self, id=None, name=None, email=None):
+        """Row pertama dengan id/name/email tersebut, atau None"""
+        rows = self.find_all(id=id, name=name, email=email)
+        return rows[0] if rows else None
+
+
+class EmployeeTable:
+    """Page object #employee; setiap method = satu round trip WebDriver"""
+
+    def __init__(self, driver, selector=TABLE_SELECTOR):
+        self.driver = driver
+        self.selector = selector
+
+    @staticmethod
+    def _snapshot(result):
+        return TableSnapshot(result['headers'], [_to_row(raw) for raw in result['rows']], result['total'])
+
+    def visible(self):
+        """Row yang sedang dirender di DOM"""
+        result = self.driver.execute_script(_VISIBLE_JS, self.selector)
+        if result is None:
+            raise AssertionError(f"Tabel {self.selector} tidak ada di {self.driver.current_url}")
+        return self._snapshot(result)
+
+    def all_rows(self, page_size=API_PAGE_SIZE):
+        """
+        Seluruh data set DataTables (semua halaman, search/filter yang aktif)
+        lewat ajax di dalam browser; fallback ke visible() tanpa DataTables.
+        """
+        result = self.driver.execute_async_script(_ALL_ROWS_JS, self.selector, page_size)
+        if result is None:
+            return self.visible()
+        if 'error' in result:
+            raise AssertionError(f"Ajax DataTables gagal dengan status {result['error']}")
+        return self._snapshot(result)
@@ -0,0 +1,151 @@
+"""
+export_client.py - Client streaming untuk export.php (CSV / NDJSON)
+
+Response dibaca per baris langsung dari socket, jadi memory client tetap
+kecil berapapun jumlah contacts. Jika koneksi terputus di tengah export,
+request diulang dengan after_id = id terakhir yang sudah diterima
+(keyset resume), sehingga tidak ada baris yang hilang atau terduplikasi.
+
+    python tests/export_client.py --format ndjson --output contacts.ndjson
+"""
+import argparse
+import csv
+import http.client
+import json
+import socket
+import sys
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from contact_repository import CONTACT_COLUMNS, Contact
+
+HTTP_TIMEOUT = 30
+MAX_RESUMES = 3
+FORMATS = ('csv', 'ndjson')
+
+
+class ExportError(Exception):
+    """export.php menolak request atau stream tidak bisa dilanjutkan"""
+
+
+class TruncatedExport(ExportError):
+    """Stream berhenti di tengah baris (koneksi terputus)"""
+
+
+class ExportClient:
+    """Stream contacts dari export.php sebagai Contact (created berupa string)"""
+
+    def __init__(self, base_url, cookie_header=None, timeout=HTTP_TIMEOUT, max_resumes=MAX_RESUMES):
+        self.base_url = base_url.rstrip('/')
+        self.cookie_header = cookie_header
+        self.timeout = timeout
+        self.max_resumes = max_resumes
+        self.stats = {'requests': 0, 'resumes': 0, 'rows': 0, 'bytes': 0}
+
+    def url(self, format='csv', after_id=0, **filters):
+        query = {'format': format, 'after_id': after_id}
+        query.update((key, value) for key, value in filters.items() if value)
+        return f"{self.base_url}/export.php?{urllib.parse.urlencode(query)}"
+
+    def _open(self, url):
+        request = urllib.request.Request(url)
+        if self.cookie_header:
+            request.add_header('Cookie', self.cookie_header)
+        self.stats['requests'] += 1
+        try:
+            response = urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            raise ExportError(f"export.php status {e.code}: {e.read()[:200]!r}")
+        if urllib.parse.urlparse(response.url).path.endswith('login.php'):
+            response.close()
+            raise ExportError("export.php redirect ke login.php (session tidak valid)")
+        return response
+
+    def _lines(self, response):
+        """Baris lengkap (decoded); baris terakhir tanpa newline berarti stream terpotong"""
+        for raw in response:
+            self.stats['bytes'] += len(raw)
+            if not raw.endswith(b'\n'):
+                raise TruncatedExport(f"Baris terakhir terpotong: {raw[:80]!r}")
+            yield raw.decode('utf-8')
+
+    def _parse(self, lines, format):
+        if format == 'ndjson':
+            for line in lines:
+                yield Contact(**json.loads(line))
+            return
+        reader = csv.reader(lines)
+        header = next(reader, None)
+        if header is not None and tuple(header) != CONTACT_COLUMNS:
+            raise ExportError(f"Header CSV tidak dikenal: {header}")
+        for row in reader:
+            yield Contact(int(row[0]), *row[1:])
+
+    def stream(self, format='csv', after_id=0, search='', created_from='', created_to=''):
+        """
+        Yield Contact urut id untuk filter yang diberikan (sama seperti tabel:
+        search, created_from/created_to 'YYYY-MM-DD'), mulai setelah after_id
+        """
+        if format not in FORMATS:
+            raise ValueError(f"Format tidak dikenal: {format}")
+        last_id = after_id
+        resumes = 0
+        while True:
+            received = False
+            response = self._open(self.url(format, last_id, search=search,
+                                           created_from=created_from, created_to=created_to))
+            try:
+                for contact in self._parse(self._lines(response), format):
+                    received = True
+                    last_id = contact.id
+                    self.stats['rows'] += 1
+                    yield contact
+                return
+            except (TruncatedExport, http.client.IncompleteRead, ConnectionError, socket.timeout) as e:
+                # Lanjutkan dari id terakhir; batas percobaan di-reset jika ada progres
+                resumes = 0 if received else resumes + 1
+                if resumes > self.max_resumes:
+                    raise ExportError(f"Export berhenti setelah id {last_id}: {e}") from e
+                self.stats['resumes'] += 1
+            finally:
+                response.close()
+
+    def download(self, path_or_file, format='csv', **filters):
+        """Tulis export ke file (path atau file object teks); return jumlah baris"""
+        if isinstance(path_or_file, str):
+            with open(path_or_file, 'w', newline='', encoding='utf-8') as f:
+                return self.download(f, format, **filters)
+        writer = csv.writer(path_or_file) if format == 'csv' else None
+        if writer:
+            writer.writerow(CONTACT_COLUMNS)
+        rows = 0
+        for contact in self.stream(format, **filters):
+            if writer:
+                writer.writerow(contact)
+            else:
+                path_or_file.write(json.dumps(contact._asdict(), ensure_ascii=False) + '\n')
+            rows += 1
+        return rows
+
+
+if __name__ == '__main__':
+    from auth_cache import AuthCache
+    from settings import ADMIN_PASSWORD, ADMIN_USERNAME, DEFAULT_BASE_URL
+
+    parser = argparse.ArgumentParser(description="Export contacts DamnCRUD (streaming)")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--format', choices=FORMATS, default='csv')
+    parser.add_argument('--after-id', type=int, default=0, help="Lanjutkan setelah id ini")
+    parser.add_argument('--search', default='')
+    parser.add_argument('--created-from', default='', help="YYYY-MM-DD")
+    parser.add_argument('--created-to', default='', help="YYYY-MM-DD")
+    parser.add_argument('--output', help="File tujuan (default stdout)")
+    args = parser.parse_args()
+
+    auth = AuthCache(args.base_url, ADMIN_USERNAME, ADMIN_PASSWORD)
+    client = ExportClient(args.base_url, auth.cookie_header())
+    filters = dict(after_id=args.after_id, search=args.search,
+                   created_from=args.created_from, created_to=args.created_to)
+    rows = client.download(args.output or sys.stdout, args.format, **filters)
+    print(f"✓ {rows} contacts diexport ({client.stats})", file=sys.stderr)
@@ -0,0 +1,239 @@
+"""
+http_client.py - Client HTTP tanpa browser untuk test CRUD
+
+Cookie jar sendiri, parsing form dan tabel HTML dengan html.parser
+(tanpa dependency tambahan). Dipakai oleh test tier `http` yang
+menjalankan login/create/update/delete langsung ke endpoint PHP.
+"""
+import http.cookiejar
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import namedtuple
+from html.parser import HTMLParser
+
+HTTP_TIMEOUT = 10
+
+Response = namedtuple('Response', 'status url text headers')
+Form = namedtuple('Form', 'action method fields')
+Table = namedtuple('Table', 'headers rows')
+
+
+class FormParser(HTMLParser):
+    """Kumpulkan semua <form> beserta nilai default input/textarea/select"""
+
+    def __init__(self):
+        super().__init__()
+        self.forms = []
+        self._textarea = None
+        self._select = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'form':
+            self.forms.append(Form(attrs.get('action') or '', (attrs.get('method') or 'get').lower(), {}))
+        elif not self.forms or not attrs.get('name'):
+            return
+        elif tag == 'input':
+            if attrs.get('type') in ('submit', 'button', 'reset', 'image'):
+                return
+            if attrs.get('type') in ('checkbox', 'radio') and 'checked' not in attrs:
+                return
+            self.forms[-1].fields[attrs['name']] = attrs.get('value') or ''
+        elif tag == 'textarea':
+            self._textarea = attrs['name']
+            self.forms[-1].fields[self._textarea] = ''
+        elif tag == 'select':
+            self._select = attrs['name']
+        elif tag == 'option' and self._select:
+            fields = self.forms[-1].fields
+            if self._select not in fields or 'selected' in attrs:
+                fields[self._select] = attrs.get('value', '')
+
+    def handle_data(self, data):
+        if self._textarea:
+            self.forms[-1].fields[self._textarea] += data
+
+    def handle_endtag(self, tag):
+        if tag == 'textarea':
+            self._textarea = None
+        elif tag == 'select':
+            self._select = None
+
+
+class TableParser(HTMLParser):
+    """Ambil header dan isi (teks per cell) dari <table id=...>"""
+
+    def __init__(self, table_id):
+        super().__init__()
+        self.table_id = table_id
+        self.headers = []
+        self.rows = []
+        self._depth = 0
+        self._section = None
+        self._row = None
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'table':
+            if self._depth or dict(attrs).get('id') == self.table_id:
+                self._depth += 1
+            return
+        if not self._depth:
+            return
+        if tag in ('thead', 'tbody', 'tfoot'):
+            self._section = tag
+        elif tag == 'tr':
+            self._row = []
+        elif tag in ('td', 'th') and self._row is not None:
+            self._cell = []
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def handle_endtag(self, tag):
+        if not self._depth:
+            return
+        if tag == 'table':
+            self._depth -= 1
+        elif tag in ('td', 'th') and self._cell is not None:
+            self._row.append(' '.join(''.join(self._cell).split()))
+            self._cell = None
+        elif tag == 'tr' and self._row is not None:
+            if self._section == 'thead':
+                self.headers = self._row
+            elif self._section != 'tfoot' and self._row:
+                self.rows.append(self._row)
+            self._row = None
+
+
+def parse_forms(html):
+    parser = FormParser()
+    parser.feed(html)
+    return parser.forms
+
+
+def parse_table(html, table_id):
+    parser = TableParser(table_id)
+    parser.feed(html)
+    return Table(parser.headers, parser.rows)
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    """Kembalikan response redirect apa adanya (status 302 + Location)"""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+class HttpClient:
+    """
+    Session HTTP ke aplikasi dengan cookie jar sendiri.
+    Redirect di-follow kecuali follow_redirects=False (mis. untuk load test).
+    """
+
+    def __init__(self, base_url, follow_redirects=True):
+        self.base_url = base_url.rstrip('/')
+        self.host = urllib.parse.urlparse(self.base_url).hostname
+        self.jar = http.cookiejar.CookieJar()
+        handlers = [urllib.request.HTTPCookieProcessor(self.jar)]
+        if not follow_redirects:
+            handlers.append(_NoRedirect)
+        self._opener = urllib.request.build_opener(*handlers)
+        self.stats = {'requests': 0}
+
+    def set_cookie(self, name, value):
+        """Tambahkan cookie untuk host aplikasi (mis. PHPSESSID dari AuthCache)"""
+        self.jar.set_cookie(http.cookiejar.Cookie(
+            0, name, value, None, False, self.host, False, False, '/', True,
+            False, None, False, None, None, {},
+        ))
+
+    def url(self, path):
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def request(self, path, data=None, headers=None):
+        """GET (atau POST jika data diberikan); return Response setelah redirect"""
+        body = urllib.parse.urlencode(data).encode() if data is not None else None
+        request = urllib.request.Request(self.url(path), data=body, headers=headers or {})
+        self.stats['requests'] += 1
+        try:
+            with self._opener.open(request, timeout=HTTP_TIMEOUT) as response:
+                return Response(response.status, response.url,
+                                response.read().decode('utf-8', 'replace'), response.headers)
+        except urllib.error.HTTPError as e:
+            return Response(e.code, e.url, e.read().decode('utf-8', 'replace'), e.headers)
+
+    def get(self, path, headers=None):
+        """GET dengan header tambahan opsional (mis. If-None-Match)"""
+        return self.request(path, headers=headers)
+
+    def post(self, path, data):
+        return self.request(path, data)
+
+    def submit_form(self, path, values=None, index=0):
+        """
+        Buka halaman path, ambil form ke-index, timpa field dengan values
+        lalu submit ke action form (relatif terhadap halaman)
+        """
+        page = self.get(path)
+        forms = parse_forms(page.text)
+        if len(forms) <= index:
+            raise AssertionError(f"Form #{index} tidak ditemukan di {path}")
+        form = forms[index]
+        fields = dict(form.fields, **(values or {}))
+        target = urllib.parse.urljoin(page.url, form.action or page.url)
+        target = target[len(self.base_url):] if target.startswith(self.base_url) else target
+        if form.method == 'post':
+            return self.post(target, fields)
+        separator = '&' if '?' in target else '?'
+        return self.get(target + separator + urllib.parse.urlencode(fields))
+
+    def login(self, username, password):
+        """Login lewat form login.php; return True jika redirect ke index.php"""
+        response = self.submit_form('login.php', {'username': username, 'password': password})
+        redirected = response.status in (301, 302, 303)
+        location = (response.headers.get('Location') or '') if redirected else response.url
+        return urllib.parse.urlparse(location).path.endswith('index.php')
+
+    def contacts_data(self, **params):
+        """Request JSON contacts_data.php (server-side processing DataTables)"""
+        query = {'draw': 1, 'start': 0, 'length': 1000}
+        query.update(params)
+        response = self.get('contacts_data.php?' + urllib.parse.urlencode(query))
+        if response.status != 200:
+            raise AssertionError(f"contacts_data.php status {response.status}")
+        return json.loads(response.text)
+
+    def bulk(self, action, ids, **fields):
+        """
+        POST bulk.php (action 'delete' atau 'update' dengan phone/title);
+        return (status, JSON hasil)
+        """
+        data = dict(fields, action=action, ids=','.join(str(contact_id) for contact_id in ids))
+        response = self.post('bulk.php', data)
+        return response.status, json.loads(response.text)
+
+    def employee_table(self, search=''):
+        """
+        Tabel #employee seperti yang dilihat user: header dari index.php,
+        rows dari contacts_data.php (sumber data DataTables server-side)
+        """
+        page = self.get('index.php')
+        table = parse_table(page.text, 'employee')
+        if not table.headers:
+            raise AssertionError(f"Tabel #employee tidak ada di {page.url}")
+        data = self.contacts_data(**{'search[value]': search})
+        rows = [[str(cell) for cell in row[:-1]] for row in data['data']]
+        return Table(table.headers, table.rows + rows)
+
+    def find_contact(self, email):
+        """Row tabel (dict per header) untuk email tertentu, atau None"""
+        table = self.employee_table(search=email)
+        for row in table.rows:
+            contact = dict(zip(table.headers, row))
+            if contact.get('Email') == email:
+                return contact
+        return None
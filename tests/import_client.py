@@ -0,0 +1,101 @@
+"""
+import_client.py - Client bulk import contacts lewat import.php
+
+CSV dikirim sebagai body text/csv (tanpa multipart) dan dibaca server per
+baris. File di disk di-stream apa adanya; rows dari generator ditulis dulu
+ke file sementara supaya Content-Length diketahui.
+
+    python tests/import_client.py contacts.csv --batch-size 2000
+"""
+import argparse
+import csv
+import json
+import os
+import tempfile
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import namedtuple
+
+HTTP_TIMEOUT = 600
+DEFAULT_BATCH_SIZE = 1000
+IMPORT_COLUMNS = ('name', 'email', 'phone', 'title', 'created')
+
+# Laporan dari import.php + elapsed (detik round trip di sisi client)
+ImportReport = namedtuple('ImportReport', 'accepted rejected batches batch_size errors seconds rows_per_sec elapsed')
+
+
+class ImportFailed(Exception):
+    """import.php menolak request (login, tanpa file, upload terlalu besar)"""
+
+
+def write_csv(rows, f, header=True):
+    """Tulis rows (name, email, phone, title[, created]) sebagai CSV; return jumlah baris"""
+    writer = csv.writer(f)
+    if header:
+        writer.writerow(IMPORT_COLUMNS)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+class ImportClient:
+    """POST CSV ke import.php dan kembalikan ImportReport"""
+
+    def __init__(self, base_url, cookie_header=None, timeout=HTTP_TIMEOUT):
+        self.base_url = base_url.rstrip('/')
+        self.cookie_header = cookie_header
+        self.timeout = timeout
+
+    def upload(self, path, batch_size=DEFAULT_BATCH_SIZE):
+        """Stream file CSV di path sebagai body request"""
+        url = f"{self.base_url}/import.php?{urllib.parse.urlencode({'batch_size': batch_size})}"
+        with open(path, 'rb') as f:
+            request = urllib.request.Request(url, data=f, method='POST', headers={
+                'Content-Type': 'text/csv; charset=utf-8',
+                'Content-Length': str(os.fstat(f.fileno()).st_size),
+                'Accept': 'application/json',
+            })
+            if self.cookie_header:
+                request.add_header('Cookie', self.cookie_header)
+            began = time.monotonic()
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    if urllib.parse.urlparse(response.url).path.endswith('login.php'):
+                        raise ImportFailed("import.php redirect ke login.php (session tidak valid)")
+                    body = json.loads(response.read())
+            except urllib.error.HTTPError as e:
+                raise ImportFailed(f"import.php status {e.code}: {e.read()[:200]!r}")
+        return ImportReport(elapsed=round(time.monotonic() - began, 3),
+                            **{field: body[field] for field in ImportReport._fields[:-1]})
+
+    def import_rows(self, rows, batch_size=DEFAULT_BATCH_SIZE, header=True):
+        """Import rows (name, email, phone, title[, created]) lewat file CSV sementara"""
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', newline='', encoding='utf-8',
+                                         delete=False) as f:
+            write_csv(rows, f, header)
+        try:
+            return self.upload(f.name, batch_size)
+        finally:
+            os.unlink(f.name)
+
+
+if __name__ == '__main__':
+    from auth_cache import AuthCache
+    from settings import ADMIN_PASSWORD, ADMIN_USERNAME, DEFAULT_BASE_URL
+
+    parser = argparse.ArgumentParser(description="Bulk import contacts DamnCRUD dari CSV")
+    parser.add_argument('path', help="File CSV (name,email,phone,title[,created])")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    auth = AuthCache(args.base_url, ADMIN_USERNAME, ADMIN_PASSWORD)
+    report = ImportClient(args.base_url, auth.cookie_header()).upload(args.path, args.batch_size)
+    print(f"✓ accepted {report.accepted}, rejected {report.rejected} "
+          f"({report.batches} batch, {report.rows_per_sec} rows/s, round trip {report.elapsed}s)")
+    for error in report.errors:
+        print(f"  line {error['line']}: {error['error']}")
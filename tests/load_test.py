@@ -0,0 +1,286 @@
+"""
+load_test.py - Load generator untuk endpoint PHP DamnCRUD
+
+Setiap virtual user (thread) login sekali lewat login.php, lalu menjalankan
+campuran operasi CRUD secara acak sesuai bobot --mix. Dua mode:
+- concurrency (default): setiap user mengirim request berikutnya segera
+  setelah response sebelumnya (closed loop)
+- --rate R: request dijadwalkan R per detik untuk semua user (open loop);
+  latency dihitung dari waktu terjadwal sehingga antrian ikut terukur
+
+Id contact yang dibuat dicari lewat contacts_data.php sebagai operasi
+tersendiri (endpoint "contacts_data.php (lookup)") yang ikut dijadwalkan dan
+diukur, jadi --rate tetap jumlah request total.
+
+Hasil: throughput, p50/p95/p99 latency dan error rate per endpoint, ditulis
+ke JSON supaya beberapa run bisa dibandingkan.
+
+Usage:
+    python tests/load_test.py --users 10 --duration 30
+    python tests/load_test.py --users 20 --rate 200 --mix index=5,data=3,create=1,update=1,delete=1
+"""
+import argparse
+import json
+import math
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+from collections import namedtuple
+from datetime import datetime
+
+from http_client import HttpClient
+from settings import ADMIN_PASSWORD, ADMIN_USERNAME, DEFAULT_BASE_URL
+
+DEFAULT_MIX = 'index=4,data=4,create=1,update=1,delete=1'
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), 'reports', 'load_test.json')
+
+# Operasi -> endpoint yang dilaporkan dan status yang dianggap sukses
+ENDPOINTS = {
+    'index': ('index.php', 200),
+    'data': ('contacts_data.php', 200),
+    'create': ('create.php', 302),
+    'update': ('update.php', 302),
+    'delete': ('delete.php', 302),
+}
+# Bukan bagian --mix: dijalankan setelah create untuk mencari id contact baru
+LOOKUP = ('contacts_data.php (lookup)', 200)
+
+Sample = namedtuple('Sample', 'endpoint latency_ms ok')
+
+
+def parse_mix(text):
+    """'index=4,create=1' -> {'index': 4, 'create': 1}"""
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"Operasi tidak dikenal: {name} (pilih dari {', '.join(ENDPOINTS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile dari list yang sudah terurut"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class VirtualUser:
+    """Satu user dengan session sendiri; contact yang dibuat dipakai untuk update/delete"""
+
+    def __init__(self, number, base_url, username, password):
+        self.number = number
+        # Redirect tidak di-follow supaya latency create/update/delete tidak termasuk index.php
+        self.client = HttpClient(base_url, follow_redirects=False)
+        if not self.client.login(username, password):
+            raise RuntimeError(f"Virtual user {number} gagal login")
+        self.contact_ids = []
+        # Email contact yang sudah dibuat tetapi id-nya belum dicari
+        self.created_emails = []
+        self._sequence = 0
+
+    def _email(self):
+        self._sequence += 1
+        return f"load.u{self.number}.{self._sequence}.{time.monotonic_ns()}@load.test"
+
+    def pending_operation(self):
+        """'lookup' jika ada contact baru yang id-nya belum dicari, selain itu None"""
+        return 'lookup' if self.created_emails else None
+
+    def _lookup(self):
+        """Cari id contact yang dibuat paling awal; return response"""
+        email = self.created_emails.pop(0)
+        query = urllib.parse.urlencode({'length': 1, 'search[value]': email})
+        response = self.client.get(f"contacts_data.php?{query}")
+        if response.status == LOOKUP[1]:
+            data = json.loads(response.text)
+            if data['data']:
+                self.contact_ids.append(int(data['data'][0][0]))
+        return response
+
+    def run(self, operation):
+        """Jalankan satu operasi; return (endpoint, sukses, waktu response selesai)"""
+        if operation == 'lookup':
+            response = self._lookup()
+            return LOOKUP[0], response.status == LOOKUP[1], time.monotonic()
+
+        path, expected = ENDPOINTS[operation]
+        if operation in ('update', 'delete') and not self.contact_ids:
+            # Belum ada contact milik user ini: buat dulu
+            operation, (path, expected) = 'create', ENDPOINTS['create']
+
+        email = None
+        if operation == 'index':
+            request = lambda: self.client.get(path)
+        elif operation == 'data':
+            request = lambda: self.client.get(f"{path}?draw=1&start=0&length=10")
+        elif operation == 'create':
+            email = self._email()
+            request = lambda: self.client.post(path, {
+                'name': f"Load User {self.number}", 'email': email,
+                'phone': '08000000000', 'title': 'Load Test',
+            })
+        elif operation == 'update':
+            contact_id = random.choice(self.contact_ids)
+            request = lambda: self.client.post(f"{path}?id={contact_id}", {
+                'name': f"Load User {self.number} Updated", 'email': self._email(),
+                'phone': '08000000001', 'title': 'Load Test',
+            })
+        else:
+            contact_id = self.contact_ids.pop()
+            request = lambda: self.client.get(f"{path}?id={contact_id}")
+
+        response = request()
+        finished = time.monotonic()
+        location = response.headers.get('Location') or ''
+        ok = response.status == expected and 'login.php' not in location
+        if ok and email:
+            self.created_emails.append(email)
+        return path, ok, finished
+
+    def cleanup(self):
+        while self.created_emails:
+            self._lookup()
+        while self.contact_ids:
+            self.client.get(f"delete.php?id={self.contact_ids.pop()}")
+
+
+class LoadRunner:
+    """Jalankan virtual users selama duration detik dan kumpulkan sample"""
+
+    def __init__(self, base_url, users, duration, mix, rate=None,
+                 username=ADMIN_USERNAME, password=ADMIN_PASSWORD, seed=None):
+        self.base_url = base_url
+        self.users = users
+        self.duration = duration
+        self.mix = mix
+        self.rate = rate
+        self.username = username
+        self.password = password
+        self.random = random.Random(seed)
+        self.samples = []
+        self._lock = threading.Lock()
+        self._next_slot = 0
+        self._start = None
+
+    def _choose(self):
+        with self._lock:
+            return self.random.choices(list(self.mix), weights=list(self.mix.values()))[0]
+
+    def _scheduled_time(self):
+        """Open loop: waktu terjadwal request berikutnya, None jika sudah lewat duration"""
+        with self._lock:
+            slot = self._next_slot
+            self._next_slot += 1
+        scheduled = self._start + slot / self.rate
+        return scheduled if scheduled < self._start + self.duration else None
+
+    def _record(self, endpoint, began, finished, ok):
+        sample = Sample(endpoint, (finished - began) * 1000, ok)
+        with self._lock:
+            self.samples.append(sample)
+
+    def _worker(self, user, ready):
+        ready.wait()
+        deadline = self._start + self.duration
+        while True:
+            if self.rate:
+                began = self._scheduled_time()
+                if began is None:
+                    break
+                time.sleep(max(0.0, began - time.monotonic()))
+            else:
+                began = time.monotonic()
+                if began >= deadline:
+                    break
+            operation = user.pending_operation() or self._choose()
+            try:
+                endpoint, ok, finished = user.run(operation)
+            except (urllib.error.URLError, OSError, ValueError, KeyError):
+                endpoint = LOOKUP[0] if operation == 'lookup' else ENDPOINTS[operation][0]
+                ok, finished = False, time.monotonic()
+            self._record(endpoint, began, finished, ok)
+
+    def run(self):
+        print(f"Login {self.users} virtual users ke {self.base_url}...")
+        users = [VirtualUser(n, self.base_url, self.username, self.password)
+                 for n in range(self.users)]
+        ready = threading.Event()
+        threads = [threading.Thread(target=self._worker, args=(user, ready), daemon=True) for user in users]
+        for thread in threads:
+            thread.start()
+
+        mode = f"rate {self.rate}/s" if self.rate else "closed loop"
+        print(f"Running {self.duration}s ({mode}, mix {self.mix})...")
+        self._start = time.monotonic()
+        ready.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - self._start
+
+        for user in users:
+            user.cleanup()
+        return self.report(elapsed)
+
+    def report(self, elapsed):
+        endpoints = {}
+        for endpoint in sorted({sample.endpoint for sample in self.samples}) + [None]:
+            samples = [s for s in self.samples if endpoint is None or s.endpoint == endpoint]
+            latencies = sorted(s.latency_ms for s in samples)
+            errors = sum(1 for s in samples if not s.ok)
+            endpoints[endpoint or 'total'] = {
+                'requests': len(samples),
+                'errors': errors,
+                'error_rate': errors / len(samples) if samples else 0.0,
+                'throughput_rps': len(samples) / elapsed if elapsed else 0.0,
+                'p50_ms': percentile(latencies, 50),
+                'p95_ms': percentile(latencies, 95),
+                'p99_ms': percentile(latencies, 99),
+                'max_ms': latencies[-1] if latencies else None,
+            }
+        return {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'base_url': self.base_url,
+            'users': self.users,
+            'duration_s': round(elapsed, 2),
+            'rate': self.rate,
+            'mix': self.mix,
+            'endpoints': endpoints,
+        }
+
+
+def print_report(report):
+    print(f"\n{'endpoint':<20}{'req':>8}{'rps':>9}{'err%':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for name, stats in report['endpoints'].items():
+        cells = [stats[key] for key in ('p50_ms', 'p95_ms', 'p99_ms', 'max_ms')]
+        print(f"{name:<20}{stats['requests']:>8}{stats['throughput_rps']:>9.1f}"
+              f"{stats['error_rate'] * 100:>6.1f}%"
+              + ''.join(f"{cell:>9.1f}" if cell is not None else f"{'-':>9}" for cell in cells))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test endpoint PHP DamnCRUD")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--users', type=int, default=10, help="Jumlah virtual user (concurrency)")
+    parser.add_argument('--duration', type=float, default=30, help="Durasi dalam detik")
+    parser.add_argument('--rate', type=float, help="Target request/detik total (open loop)")
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f"Bobot operasi (default {DEFAULT_MIX})")
+    parser.add_argument('--seed', type=int, help="Seed pemilihan operasi")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="File JSON hasil")
+    args = parser.parse_args()
+
+    runner = LoadRunner(args.base_url, args.users, args.duration, parse_mix(args.mix),
+                        rate=args.rate, seed=args.seed)
+    report = runner.run()
+    print_report(report)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Hasil disimpan di {args.output}")
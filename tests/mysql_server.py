@@ -0,0 +1,149 @@
+"""
+mysql_server.py - Instance MySQL/MariaDB sekali pakai di tmpfs
+
+Data directory dibuat di /dev/shm (fallback: temp dir), diinisialisasi
+dengan root tanpa password, lalu mysqld/mariadbd dijalankan di 127.0.0.1
+pada port bebas plus Unix socket di data directory. Durability sengaja
+dilonggarkan (tanpa doublewrite, flush log tidak per commit, tanpa binlog)
+karena datanya dibuang di akhir session.
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+import mysql.connector
+
+MYSQLD_BINARY = os.getenv('MYSQLD_BINARY', '')
+STARTUP_TIMEOUT = 60
+SHUTDOWN_TIMEOUT = 30
+TMPFS_DIR = '/dev/shm'
+
+# Opsi server yang sama untuk MySQL dan MariaDB
+RELAXED_OPTIONS = [
+    '--innodb-doublewrite=0',
+    '--innodb-flush-log-at-trx-commit=0',
+    '--sync-binlog=0',
+    '--skip-log-bin',
+    '--innodb-buffer-pool-size=128M',
+    '--innodb-log-buffer-size=16M',
+    '--performance-schema=0',
+    '--skip-name-resolve',
+]
+
+
+class MysqlStartError(Exception):
+    """mysqld gagal diinisialisasi atau tidak menerima koneksi sebelum timeout"""
+
+
+def find_mysqld():
+    """Path mysqld/mariadbd dari MYSQLD_BINARY atau PATH (termasuk sbin)"""
+    if MYSQLD_BINARY:
+        return MYSQLD_BINARY
+    search = os.pathsep.join([os.environ.get('PATH', ''), '/usr/sbin', '/usr/local/sbin', '/usr/libexec'])
+    for name in ('mariadbd', 'mysqld'):
+        path = shutil.which(name, path=search)
+        if path:
+            return path
+    raise MysqlStartError("mysqld/mariadbd tidak ditemukan (set MYSQLD_BINARY)")
+
+
+class MysqlServer:
+    """Satu mysqld dengan data directory sementara; start() -> connect -> stop()"""
+
+    def __init__(self, port, host='127.0.0.1', binary=None, base_dir=None):
+        self.host = host
+        self.port = port
+        self.binary = binary or find_mysqld()
+        self.base_dir = base_dir or (TMPFS_DIR if os.path.isdir(TMPFS_DIR) else tempfile.gettempdir())
+        self.datadir = None
+        self.process = None
+        self.is_mariadb = 'mariadb' in self._run([self.binary, '--version']).lower()
+
+    @property
+    def socket(self):
+        return os.path.join(self.datadir, 'mysqld.sock')
+
+    @property
+    def error_log(self):
+        return os.path.join(self.datadir, 'error.log')
+
+    @staticmethod
+    def _run(command):
+        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        if result.returncode != 0:
+            raise MysqlStartError(f"{' '.join(command)} gagal:\n{result.stdout[-2000:]}")
+        return result.stdout
+
+    def _user_options(self):
+        # mysqld menolak berjalan sebagai root tanpa --user=root
+        return ['--user=root'] if hasattr(os, 'geteuid') and os.geteuid() == 0 else []
+
+    def initialize(self):
+        """Buat data directory baru dengan root tanpa password"""
+        self.datadir = tempfile.mkdtemp(prefix='damncrud-mysql-', dir=self.base_dir)
+        if self.is_mariadb:
+            install_db = shutil.which('mariadb-install-db') or shutil.which('mysql_install_db')
+            if not install_db:
+                raise MysqlStartError("mariadb-install-db tidak ditemukan")
+            self._run([install_db, '--no-defaults', f"--datadir={self.datadir}",
+                       '--auth-root-authentication-method=normal', '--skip-test-db']
+                      + self._user_options())
+        else:
+            self._run([self.binary, '--no-defaults', '--initialize-insecure',
+                       f"--datadir={self.datadir}"] + self._user_options())
+        return self
+
+    def start(self):
+        if self.datadir is None:
+            self.initialize()
+        command = [
+            self.binary, '--no-defaults',
+            f"--datadir={self.datadir}",
+            f"--socket={self.socket}",
+            f"--pid-file={os.path.join(self.datadir, 'mysqld.pid')}",
+            f"--log-error={self.error_log}",
+            f"--bind-address={self.host}",
+            f"--port={self.port}",
+        ] + RELAXED_OPTIONS + self._user_options()
+        if not self.is_mariadb:
+            command.append('--mysqlx=0')
+        self.process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return self
+
+    def connect(self, **config):
+        return mysql.connector.connect(host=self.host, port=self.port, user='root', password='', **config)
+
+    def wait_ready(self, timeout=STARTUP_TIMEOUT):
+        """Poll sampai root bisa connect; MysqlStartError jika proses mati atau timeout"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise MysqlStartError(f"mysqld keluar dengan kode {self.process.returncode}:\n{self._log_tail()}")
+            try:
+                self.connect(connection_timeout=2).close()
+                return self
+            except mysql.connector.Error:
+                time.sleep(0.2)
+        raise MysqlStartError(f"mysqld tidak siap dalam {timeout}s:\n{self._log_tail()}")
+
+    def _log_tail(self, lines=20):
+        try:
+            with open(self.error_log) as f:
+                return ''.join(f.readlines()[-lines:])
+        except OSError:
+            return '(error log tidak ada)'
+
+    def stop(self):
+        """Shutdown mysqld lalu hapus data directory"""
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=SHUTDOWN_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        if self.datadir:
+            shutil.rmtree(self.datadir, ignore_errors=True)
+            self.datadir = None
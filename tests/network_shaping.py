@@ -0,0 +1,72 @@
+"""
+network_shaping.py - Blokir request dan throttling jaringan lewat CDP
+
+Dipakai fixture `browser`: pola URL diblokir dengan Network.setBlockedURLs dan
+kondisi jaringan diemulasikan dengan Network.emulateNetworkConditions.
+Konfigurasi default dari env BLOCK_URLS / NETWORK_PROFILE, bisa di-override
+per test dengan marker @pytest.mark.network(block=[...], profile='slow-3g').
+"""
+import os
+
+# Preset pola untuk BLOCK_URLS (nama preset atau pola wildcard CDP langsung)
+BLOCK_PRESETS = {
+    'cdn': ['*cdn.jsdelivr.net*', '*code.jquery.com*', '*cdn.datatables.net*'],
+    'fonts': ['*fonts.googleapis.com*', '*fonts.gstatic.com*'],
+    'images': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico', '*.webp'],
+}
+# "Tanpa trafik eksternal": semua host pihak ketiga yang pernah dipakai halaman
+BLOCK_PRESETS['external'] = BLOCK_PRESETS['cdn'] + BLOCK_PRESETS['fonts']
+
+# Profil throttling: latency (ms), download/upload (bytes per detik)
+NETWORK_PROFILES = {
+    'offline': {'offline': True, 'latency': 0, 'downloadThroughput': 0, 'uploadThroughput': 0},
+    'slow-3g': {'offline': False, 'latency': 400, 'downloadThroughput': 50 * 1024, 'uploadThroughput': 50 * 1024},
+    'fast-3g': {'offline': False, 'latency': 150, 'downloadThroughput': 200 * 1024, 'uploadThroughput': 94 * 1024},
+    'dsl': {'offline': False, 'latency': 20, 'downloadThroughput': 256 * 1024, 'uploadThroughput': 128 * 1024},
+}
+_NO_THROTTLING = {'offline': False, 'latency': 0, 'downloadThroughput': -1, 'uploadThroughput': -1}
+
+DEFAULT_BLOCK_URLS = os.getenv('BLOCK_URLS', '')
+DEFAULT_NETWORK_PROFILE = os.getenv('NETWORK_PROFILE', '') or None
+
+
+def resolve_block_patterns(spec):
+    """'cdn,*.png' atau ['cdn', '*.png'] -> daftar pola wildcard CDP"""
+    items = spec.split(',') if isinstance(spec, str) else list(spec or [])
+    patterns = []
+    for item in (item.strip() for item in items):
+        for pattern in BLOCK_PRESETS.get(item, [item] if item else []):
+            if pattern not in patterns:
+                patterns.append(pattern)
+    return patterns
+
+
+def network_options(marker=None):
+    """(pola blokir, nama profil) dari env, ditimpa argumen marker network"""
+    block = resolve_block_patterns(DEFAULT_BLOCK_URLS)
+    profile = DEFAULT_NETWORK_PROFILE
+    if marker is not None:
+        if 'block' in marker.kwargs:
+            block = resolve_block_patterns(marker.kwargs['block'])
+        profile = marker.kwargs.get('profile', profile)
+    if profile is not None and profile not in NETWORK_PROFILES:
+        raise ValueError(f"Network profile tidak dikenal: {profile} (pilih dari {', '.join(NETWORK_PROFILES)})")
+    return block, profile
+
+
+def apply_network(driver, block=(), profile=None):
+    """Aktifkan blokir URL dan throttling; return True jika ada yang diterapkan"""
+    if not block and profile is None:
+        return False
+    driver.execute_cdp_cmd('Network.enable', {})
+    if block:
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(block)})
+    if profile is not None:
+        driver.execute_cdp_cmd('Network.emulateNetworkConditions', NETWORK_PROFILES[profile])
+    return True
+
+
+def clear_network(driver):
+    """Kembalikan driver ke jaringan normal sebelum dikembalikan ke pool"""
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+    driver.execute_cdp_cmd('Network.emulateNetworkConditions', _NO_THROTTLING)
@@ -0,0 +1,210 @@
+"""
+page_metrics.py - Navigation Timing dan resource metrics dari browser
+
+Setelah setiap navigasi (driver.get, back/forward, click yang memicu redirect)
+listener membaca performance.getEntriesByType('navigation'/'resource') untuk
+dokumen yang sedang terbuka, plus mark 'datatable-init' dari index.php dan
+opsional CDP Performance.getMetrics (JS heap, layout count). Setiap dokumen
+dicatat sekali (kunci: performance.timeOrigin).
+
+Data mentah per worker ditulis ke tests/reports/page_metrics/<worker>.json,
+lalu digabung per halaman menjadi tests/reports/page_metrics.json.
+"""
+import glob
+import json
+import os
+import statistics
+import urllib.parse
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.events import AbstractEventListener
+
+REPORTS_DIR = os.path.join(os.path.dirname(__file__), 'reports')
+RAW_DIR = os.path.join(REPORTS_DIR, 'page_metrics')
+SUMMARY_PATH = os.path.join(REPORTS_DIR, 'page_metrics.json')
+
+# Metric CDP yang disimpan (Performance.getMetrics)
+CDP_METRICS = ('JSHeapUsedSize', 'LayoutCount', 'RecalcStyleCount', 'Nodes', 'ScriptDuration', 'TaskDuration')
+
+_CAPTURE_JS = """
+var seen = arguments[0];
+if (document.readyState !== 'complete' || !window.performance) { return null; }
+var origin = String(performance.timeOrigin);
+var nav = performance.getEntriesByType('navigation')[0];
+var mark = performance.getEntriesByName('datatable-init', 'mark')[0];
+var result = {origin: origin, url: location.href, datatable_init_ms: mark ? mark.startTime : null};
+if (origin === seen) { return result; }
+if (!nav || !nav.loadEventEnd) { return null; }
+var resources = performance.getEntriesByType('resource');
+var slowest = null, transfer = 0;
+for (var i = 0; i < resources.length; i++) {
+    transfer += resources[i].transferSize || 0;
+    if (!slowest || resources[i].duration > slowest.duration) { slowest = resources[i]; }
+}
+result.navigation = {
+    ttfb_ms: nav.responseStart,
+    dom_content_loaded_ms: nav.domContentLoadedEventEnd,
+    load_ms: nav.loadEventEnd,
+    transfer_bytes: nav.transferSize,
+    type: nav.type
+};
+result.resources = {
+    count: resources.length,
+    transfer_bytes: transfer,
+    slowest: slowest ? {name: slowest.name, duration_ms: slowest.duration} : null
+};
+return result;
+"""
+
+# Metric numerik per halaman yang diringkas (nama -> path di record)
+SUMMARY_FIELDS = {
+    'ttfb_ms': ('navigation', 'ttfb_ms'),
+    'dom_content_loaded_ms': ('navigation', 'dom_content_loaded_ms'),
+    'load_ms': ('navigation', 'load_ms'),
+    'datatable_init_ms': ('datatable_init_ms',),
+    'transfer_bytes': ('navigation', 'transfer_bytes'),
+    'resource_count': ('resources', 'count'),
+    'resource_transfer_bytes': ('resources', 'transfer_bytes'),
+    'js_heap_used_bytes': ('cdp', 'JSHeapUsedSize'),
+    'layout_count': ('cdp', 'LayoutCount'),
+}
+
+
+def page_name(url):
+    """'http://host/DamnCRUD/update.php?id=3' -> 'update.php'"""
+    path = urllib.parse.urlparse(url).path
+    return path.rsplit('/', 1)[-1] or path or url
+
+
+class PageMetrics:
+    """Kumpulkan satu record per dokumen yang dimuat di driver mana pun"""
+
+    def __init__(self, cdp=False):
+        self.cdp = cdp
+        # Profil throttling yang aktif (diset fixture browser); dicatat per record
+        self.network_profile = None
+        self.records = []
+        self._last = {}  # id(driver) -> record dokumen terakhir
+        self._cdp_enabled = set()
+
+    def _cdp_metrics(self, driver):
+        if id(driver) not in self._cdp_enabled:
+            driver.execute_cdp_cmd('Performance.enable', {})
+            self._cdp_enabled.add(id(driver))
+        metrics = driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+        return {m['name']: m['value'] for m in metrics if m['name'] in CDP_METRICS}
+
+    def capture(self, driver):
+        """Catat dokumen yang sedang terbuka jika sudah selesai load dan belum dicatat"""
+        last = self._last.get(id(driver))
+        try:
+            result = driver.execute_script(_CAPTURE_JS, last['origin'] if last else None)
+        except WebDriverException:
+            return None
+        if not result or result['url'].startswith(('about:', 'data:')):
+            return None
+
+        if last and result['origin'] == last['origin']:
+            # Dokumen sama: lengkapi DataTables init yang baru selesai setelah load
+            if last['datatable_init_ms'] is None and result['datatable_init_ms'] is not None:
+                last['datatable_init_ms'] = result['datatable_init_ms']
+            return last
+
+        record = dict(result, page=page_name(result['url']), network_profile=self.network_profile)
+        if self.cdp:
+            try:
+                record['cdp'] = self._cdp_metrics(driver)
+            except (WebDriverException, AttributeError, KeyError):
+                self.cdp = False
+        self.records.append(record)
+        self._last[id(driver)] = record
+        return record
+
+    def forget(self, driver):
+        """Driver dikembalikan ke pool: dokumen berikutnya dianggap baru"""
+        self._last.pop(id(driver), None)
+        self._cdp_enabled.discard(id(driver))
+
+    def save(self, worker_id):
+        """Tulis record mentah worker ini ke RAW_DIR/<worker>.json"""
+        if not self.records:
+            return None
+        os.makedirs(RAW_DIR, exist_ok=True)
+        path = os.path.join(RAW_DIR, f"{worker_id}.json")
+        with open(path, 'w') as f:
+            json.dump(self.records, f)
+        return path
+
+
+class PageMetricsListener(AbstractEventListener):
+    """Event listener untuk EventFiringWebDriver: capture setelah navigasi"""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    def after_navigate_to(self, url, driver):
+        self.metrics.capture(driver)
+
+    def after_navigate_back(self, driver):
+        self.metrics.capture(driver)
+
+    def after_navigate_forward(self, driver):
+        self.metrics.capture(driver)
+
+    def after_click(self, element, driver):
+        # Halaman hasil redirect yang belum selesai load tertangkap oleh click/navigasi
+        # berikutnya atau capture terakhir di fixture; find_element tidak di-hook supaya
+        # tidak ada execute_script tambahan per lookup
+        self.metrics.capture(driver)
+
+
+def _field(record, path):
+    for key in path:
+        record = record.get(key) if isinstance(record, dict) else None
+    return record
+
+
+def _stats(values):
+    values = sorted(values)
+    return {
+        'count': len(values),
+        'median': statistics.median(values),
+        'p95': values[max(0, -(-95 * len(values) // 100) - 1)],
+        'max': values[-1],
+    }
+
+
+def summarize(records):
+    """Ringkasan per halaman (dan profil jaringan): count, median, p95, max per metric"""
+    pages = {}
+    for record in records:
+        # Load dengan throttling diringkas terpisah, mis. 'index.php@slow-3g'
+        key = record['page'] + (f"@{record['network_profile']}" if record.get('network_profile') else '')
+        pages.setdefault(key, []).append(record)
+
+    summary = {}
+    for page, page_records in sorted(pages.items()):
+        metrics = {}
+        for name, path in SUMMARY_FIELDS.items():
+            values = [v for v in (_field(r, path) for r in page_records) if isinstance(v, (int, float))]
+            if values:
+                metrics[name] = _stats(values)
+        slowest = max((r['resources']['slowest'] for r in page_records
+                       if r.get('resources') and r['resources']['slowest']),
+                      key=lambda s: s['duration_ms'], default=None)
+        summary[page] = {'loads': len(page_records), 'metrics': metrics, 'slowest_resource': slowest}
+    return summary
+
+
+def merge_reports(raw_dir=RAW_DIR, output=SUMMARY_PATH):
+    """Gabungkan record semua worker menjadi ringkasan per halaman"""
+    records = []
+    for path in sorted(glob.glob(os.path.join(raw_dir, '*.json'))):
+        with open(path) as f:
+            records.extend(json.load(f))
+    if not records:
+        return None
+    summary = summarize(records)
+    with open(output, 'w') as f:
+        json.dump({'pages': summary, 'records': len(records)}, f, indent=2)
+    return summary
@@ -0,0 +1,98 @@
+"""
+php_server.py - PHP built-in server (php -S) per xdist worker
+
+Setiap worker menjalankan aplikasi sendiri di 127.0.0.1:<port bebas> dengan
+document root repo ini, tanpa Apache. Konfigurasi database diteruskan lewat
+environment (DAMNCRUD_DB_HOST/USER/PASS/NAME) yang dibaca pdo_connect().
+"""
+import os
+import socket
+import subprocess
+import time
+import urllib.error
+import urllib.request
+
+PHP_BINARY = os.getenv('PHP_BINARY', 'php')
+# Jumlah proses PHP per server (PHP_CLI_SERVER_WORKERS); > 1 untuk request paralel (load test)
+PHP_SERVER_WORKERS = int(os.getenv('PHP_SERVER_WORKERS', '4'))
+PHP_INI = {
+    # CLI SAPI memaksa output_buffering=0; login.php mencetak HTML sebelum
+    # session_start()/header(), jadi tanpa buffer cookie dan redirect tidak terkirim
+    'output_buffering': '4096',
+    # Batas upload untuk import.php (default PHP 2M/8M terlalu kecil untuk bulk import)
+    'upload_max_filesize': os.getenv('PHP_UPLOAD_MAX', '512M'),
+    'post_max_size': os.getenv('PHP_UPLOAD_MAX', '512M'),
+}
+STARTUP_TIMEOUT = 15
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ServerStartError(Exception):
+    """php -S berhenti atau tidak menjawab sebelum timeout"""
+
+
+def free_port(host='127.0.0.1'):
+    """Port TCP yang sedang tidak dipakai (dipilih oleh OS)"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+class PhpServer:
+    """Satu proses `php -S host:port -t APP_ROOT` dengan log ke file"""
+
+    def __init__(self, port, host='127.0.0.1', env=None, log_path=None, root=APP_ROOT):
+        self.host = host
+        self.port = port
+        self.root = root
+        self.env = env or {}
+        self.log_path = log_path
+        self.process = None
+        self._log = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        env = dict(os.environ, PHP_CLI_SERVER_WORKERS=str(PHP_SERVER_WORKERS), **self.env)
+        if self.log_path:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            self._log = open(self.log_path, 'w')
+        ini = [f"-d{name}={value}" for name, value in PHP_INI.items()]
+        self.process = subprocess.Popen(
+            [PHP_BINARY, *ini, '-S', f"{self.host}:{self.port}", '-t', self.root],
+            cwd=self.root, env=env,
+            stdout=self._log or subprocess.DEVNULL, stderr=subprocess.STDOUT,
+        )
+        return self
+
+    def wait_ready(self, path='login.php', timeout=STARTUP_TIMEOUT):
+        """Poll sampai path menjawab 200; ServerStartError jika proses mati atau timeout"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise ServerStartError(f"php -S keluar dengan kode {self.process.returncode} ({self._log_hint()})")
+            try:
+                with urllib.request.urlopen(f"{self.base_url}/{path}", timeout=2) as response:
+                    if response.status == 200:
+                        return self
+            except (urllib.error.URLError, OSError):
+                pass
+            time.sleep(0.1)
+        raise ServerStartError(f"{self.base_url}/{path} tidak siap dalam {timeout}s ({self._log_hint()})")
+
+    def _log_hint(self):
+        return f"lihat {self.log_path}" if self.log_path else "log tidak disimpan"
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        if self._log:
+            self._log.close()
+            self._log = None
@@ -0,0 +1,18 @@
+"""
+settings.py - Konfigurasi aplikasi bersama untuk conftest.py dan script CLI
+
+Hanya konstanta dari environment, tanpa side effect (tidak memilih port,
+tidak print, tidak mendaftarkan fixture), jadi aman di-import oleh
+load_test.py, export_client.py dan import_client.py di luar pytest.
+"""
+import os
+
+# Detect if running in GitHub Actions
+IS_GITHUB_ACTIONS = os.getenv('GITHUB_ACTIONS', 'false').lower() == 'true'
+
+# Apache bersama (XAMPP) di /DamnCRUD; APP_SERVER=php di pytest memakai port per worker
+APP_HOST = '127.0.0.1' if IS_GITHUB_ACTIONS else 'localhost'
+DEFAULT_BASE_URL = os.getenv('DAMNCRUD_BASE_URL', f'http://{APP_HOST}/DamnCRUD')
+
+ADMIN_USERNAME = 'admin'
+ADMIN_PASSWORD = 'nimda666!'
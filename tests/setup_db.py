@@ -3,12 +3,15 @@ setup_db.py - Script untuk setup database DamnCRUD
 Menggunakan damncrud.sql sebagai backup dan sumber data
 """
 
-import mysql.connector
 from mysql.connector import Error
-import subprocess
+import hashlib
 import os
+import re
 import sys
 
+from contact_repository import ContactRepository
+from db_pool import get_pool
+
 # Database Configuration
 DB_HOST = 'localhost'
 DB_USER = 'root'
@@ -18,76 +21,259 @@ DB_NAME = 'damncrud'  # Match with damncrud.sql
 # Path ke SQL file backup
 SQL_FILE_PATH = os.path.join(os.path.dirname(__file__), '..', 'db', 'damncrud.sql')
 
-# MySQL binary path (for Windows XAMPP)
-XAMPP_MYSQL_PATH = r'C:\xampp\mysql\bin\mysql.exe'
+# Migration schema yang dijalankan setelah dump (urut berdasarkan nama file)
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), '..', 'db', 'migrations')
+
+# Tabel metadata untuk checksum dump dan isi tabel setelah load
+META_TABLE = 'schema_meta'
+MIGRATIONS_TABLE = 'schema_migrations'
+
+# Jumlah statement yang dikirim dalam satu round trip (multi-statement)
+LOAD_BATCH_SIZE = 50
+
+# Statement dump yang mengikat ke nama database asli; diganti dengan target
+_DATABASE_STATEMENT = re.compile(r'^\s*(CREATE\s+DATABASE|USE)\b', re.IGNORECASE)
+_CREATE_TABLE = re.compile(r'^\s*CREATE\s+TABLE\b', re.IGNORECASE)
+
+
+def iter_sql_statements(sql_path):
+    """
+    Stream statement dari file dump satu per satu.
+    Komentar (--, #, /* */) dibuang; conditional comment /*!NNNNN ... */
+    dipertahankan apa adanya supaya server yang mengevaluasi versinya.
+    """
+    buffer = []
+    quote = None
+    in_comment = False
+    in_conditional = False
+
+    with open(sql_path, 'r', encoding='utf-8') as sql_file:
+        for line in sql_file:
+            i, n = 0, len(line)
+            while i < n:
+                ch = line[i]
+                if in_comment:
+                    end = line.find('*/', i)
+                    if end == -1:
+                        break
+                    in_comment = False
+                    i = end + 2
+                elif quote:
+                    buffer.append(ch)
+                    if ch == '\\' and quote != '`' and i + 1 < n:
+                        buffer.append(line[i + 1])
+                        i += 1
+                    elif ch == quote:
+                        quote = None
+                    i += 1
+                elif ch in '\'"`':
+                    quote = ch
+                    buffer.append(ch)
+                    i += 1
+                elif ch == '#' or (line.startswith('--', i) and line[i + 2:i + 3] in ('', ' ', '\t', '\r', '\n')):
+                    buffer.append('\n')
+                    break
+                elif line.startswith('/*!', i):
+                    in_conditional = True
+                    buffer.append('/*!')
+                    i += 3
+                elif line.startswith('/*', i):
+                    in_comment = True
+                    i += 2
+                elif in_conditional and line.startswith('*/', i):
+                    in_conditional = False
+                    buffer.append('*/')
+                    i += 2
+                elif ch == ';' and not in_conditional:
+                    statement = ''.join(buffer).strip()
+                    if statement:
+                        yield statement
+                    buffer = []
+                    i += 1
+                else:
+                    buffer.append(ch)
+                    i += 1
+
+    statement = ''.join(buffer).strip()
+    if statement:
+        yield statement
+
+
+def file_checksum(path):
+    """SHA-256 dari isi file (dibaca per blok)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(65536), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _table_checksums(cursor, database, tables=None):
+    """
+    CHECKSUM TABLE per tabel; tanpa tables: semua tabel hasil dump
+    (tabel metadata dikecualikan)
+    """
+    if tables is None:
+        cursor.execute(
+            "SELECT table_name FROM information_schema.tables "
+            "WHERE table_schema = %s AND table_type = 'BASE TABLE' AND table_name NOT IN (%s, %s)",
+            (database, META_TABLE, MIGRATIONS_TABLE)
+        )
+        tables = [row[0] for row in cursor.fetchall()]
+    if not tables:
+        return {}
+    cursor.execute("CHECKSUM TABLE " + ', '.join(f"`{database}`.`{t}`" for t in tables))
+    return {name.split('.', 1)[1]: str(checksum) for name, checksum in cursor.fetchall()}
+
+
+def _stored_meta(cursor, database):
+    cursor.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = %s AND table_name = %s",
+        (database, META_TABLE)
+    )
+    if cursor.fetchone()[0] == 0:
+        return {}
+    cursor.execute(f"SELECT name, checksum FROM `{database}`.`{META_TABLE}`")
+    return dict(cursor.fetchall())
+
+
+def is_database_current(cursor, database, dump_checksum):
+    """
+    True jika dump belum berubah dan isi tabel dari dump masih sama seperti saat di-load.
+    Hanya tabel yang tercatat di schema_meta yang dibandingkan: tabel milik migration
+    (mis. contacts_version) dibuat sesudah checksum dicatat.
+    """
+    meta = _stored_meta(cursor, database)
+    if meta.pop('dump', None) != dump_checksum:
+        return False
+    return meta == _table_checksums(cursor, database, list(meta))
+
+
+def _execute_batch(cursor, statements):
+    if not statements:
+        return
+    # Satu round trip untuk beberapa statement; hasil harus dikonsumsi
+    for _ in cursor.execute(';\n'.join(statements), multi=True):
+        pass
+    statements.clear()
+
+
+def load_sql_file(connection, database=DB_NAME, sql_path=SQL_FILE_PATH, batch_size=LOAD_BATCH_SIZE):
+    """
+    Load dump SQL ke database lewat satu koneksi, tanpa mysql CLI.
+    Return False jika dump dan data sudah current (load di-skip).
+    """
+    dump_checksum = file_checksum(sql_path)
+    cursor = connection.cursor()
+    try:
+        if is_database_current(cursor, database, dump_checksum):
+            return False
+
+        # Dump memakai CREATE TABLE IF NOT EXISTS + INSERT dengan id eksplisit,
+        # jadi database lama harus dibuang dulu
+        cursor.execute(f"DROP DATABASE IF EXISTS `{database}`")
+        cursor.execute(f"CREATE DATABASE `{database}`")
+        cursor.execute(f"USE `{database}`")
+
+        batch = []
+        for statement in iter_sql_statements(sql_path):
+            if _DATABASE_STATEMENT.match(statement):
+                continue
+            # DDL dieksekusi sendiri, DML/SET digabung per batch
+            if _CREATE_TABLE.match(statement):
+                _execute_batch(cursor, batch)
+                cursor.execute(statement)
+                continue
+            batch.append(statement)
+            if len(batch) >= batch_size:
+                _execute_batch(cursor, batch)
+        _execute_batch(cursor, batch)
+        connection.commit()
+
+        meta = _table_checksums(cursor, database)
+        meta['dump'] = dump_checksum
+        cursor.execute(
+            f"CREATE TABLE `{META_TABLE}` ("
+            "`name` varchar(64) NOT NULL PRIMARY KEY, "
+            "`checksum` varchar(64) NOT NULL, "
+            "`loaded_at` datetime NOT NULL DEFAULT current_timestamp()"
+            ") ENGINE=InnoDB"
+        )
+        cursor.executemany(
+            f"INSERT INTO `{META_TABLE}` (name, checksum) VALUES (%s, %s)",
+            list(meta.items())
+        )
+        connection.commit()
+        return True
+    finally:
+        cursor.close()
+
+
+def apply_migrations(connection, database=DB_NAME, migrations_dir=MIGRATIONS_DIR):
+    """
+    Jalankan file db/migrations/*.sql yang belum tercatat di schema_migrations.
+    Return daftar migration yang baru dijalankan.
+    """
+    if not os.path.isdir(migrations_dir):
+        return []
+
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS `{database}`.`{MIGRATIONS_TABLE}` ("
+            "`version` varchar(255) NOT NULL PRIMARY KEY, "
+            "`applied_at` datetime NOT NULL DEFAULT current_timestamp()"
+            ") ENGINE=InnoDB"
+        )
+        cursor.execute(f"SELECT version FROM `{database}`.`{MIGRATIONS_TABLE}`")
+        applied = {row[0] for row in cursor.fetchall()}
+
+        cursor.execute(f"USE `{database}`")
+        newly_applied = []
+        for filename in sorted(os.listdir(migrations_dir)):
+            if not filename.endswith('.sql') or filename in applied:
+                continue
+            for statement in iter_sql_statements(os.path.join(migrations_dir, filename)):
+                cursor.execute(statement)
+            cursor.execute(
+                f"INSERT INTO `{MIGRATIONS_TABLE}` (version) VALUES (%s)", (filename,)
+            )
+            connection.commit()
+            newly_applied.append(filename)
+        return newly_applied
+    finally:
+        cursor.close()
 
 
 def setup_database_from_sql():
-    """Setup database menggunakan damncrud.sql backup file dengan subprocess"""
+    """Setup database dari damncrud.sql dengan loader Python (tanpa mysql CLI)"""
+    if not os.path.exists(SQL_FILE_PATH):
+        print(f"✗ SQL file not found: {SQL_FILE_PATH}")
+        print(f"  Fallback: Creating database manually...")
+        return setup_database_manual()
+
+    print(f"Setting up database from: {SQL_FILE_PATH}")
     try:
-        # Verify SQL file exists
-        if not os.path.exists(SQL_FILE_PATH):
-            print(f"✗ SQL file not found: {SQL_FILE_PATH}")
-            print(f"  Fallback: Creating database manually...")
-            return setup_database_manual()
-        
-        print(f"Setting up database from: {SQL_FILE_PATH}")
-        print("Loading and executing SQL file...")
-        
-        # Use mysql command directly to execute SQL file
-        mysql_path = r'C:\xampp\mysql\bin\mysql.exe'
-        
-        if not os.path.exists(mysql_path):
-            # Try alternative path
-            mysql_path = 'mysql'
-        
-        # Build command
-        cmd = [mysql_path, '-u', DB_USER]
-        if DB_PASSWORD:
-            cmd.append('-p' + DB_PASSWORD)
-        cmd.extend(['-h', DB_HOST])
-        
-        # Execute SQL file
+        connection = get_pool(DB_HOST, DB_USER, DB_PASSWORD).get_connection()
         try:
-            with open(SQL_FILE_PATH, 'r', encoding='utf-8') as sql_file:
-                result = subprocess.run(
-                    cmd,
-                    stdin=sql_file,
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-            
-            if result.returncode == 0:
+            if load_sql_file(connection):
                 print(f"✓ Database setup from '{os.path.basename(SQL_FILE_PATH)}' completed!")
-                return True
             else:
-                print(f"  Warning: {result.stderr[:100]}...")
-                print(f"  Fallback: Creating database manually...")
-                return setup_database_manual()
-                
-        except FileNotFoundError:
-            print(f"  MySQL not found at {mysql_path}")
-            print(f"  Fallback: Creating database manually...")
-            return setup_database_manual()
-        except Exception as e:
-            print(f"  Error: {str(e)[:100]}...")
-            print(f"  Fallback: Creating database manually...")
-            return setup_database_manual()
-        
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        return setup_database_manual()
+                print(f"✓ Database '{DB_NAME}' already current (checksum match), load skipped")
+            for migration in apply_migrations(connection):
+                print(f"✓ Migration applied: {migration}")
+        finally:
+            connection.close()
+        return True
+    except Error as e:
+        print(f"✗ Error loading SQL file: {e}")
+        return False
 
 
 def setup_database_manual():
     """Fallback: Setup database dan tables secara manual"""
     try:
-        connection = mysql.connector.connect(
-            host=DB_HOST,
-            user=DB_USER,
-            password=DB_PASSWORD
-        )
+        connection = get_pool(DB_HOST, DB_USER, DB_PASSWORD).get_connection()
         
         cursor = connection.cursor()
         
@@ -127,18 +313,17 @@ def setup_database_manual():
         connection.commit()
         print("✓ 'users' table created")
         
+        cursor.close()
+        connection.close()
+        repository = ContactRepository(lambda: get_pool(DB_HOST, DB_USER, DB_PASSWORD, DB_NAME).get_connection())
+        
         # Insert admin user with hashed password
         print("Setting up admin user...")
-        import hashlib
         salt = "XDrBmrW9g2fb"
         password = "nimda666!"
         hashed_pw = hashlib.sha256((password + salt).encode()).hexdigest()
         
-        cursor.execute(
-            "INSERT IGNORE INTO users (username, password) VALUES (%s, %s)",
-            ("admin", hashed_pw)
-        )
-        connection.commit()
+        repository.ensure_user("admin", hashed_pw)
         print("✓ Admin user 'admin/nimda666!' setup")
         
         # Insert sample test data (fewer data untuk faster tests)
@@ -151,16 +336,10 @@ def setup_database_manual():
             ('Charlie Wilson', 'charlie.wilson@example.com', '08333333333', 'DevOps Engineer'),
         ]
         
-        for contact in test_contacts:
-            cursor.execute(
-                "INSERT INTO contacts (name, email, phone, title) VALUES (%s, %s, %s, %s)",
-                contact
-            )
-        connection.commit()
+        repository.insert_many(test_contacts)
         print(f"✓ {len(test_contacts)} sample contacts inserted")
         
-        cursor.close()
-        connection.close()
+        repository.close()
         return True
         
     except Error as e:
@@ -171,12 +350,7 @@ def setup_database_manual():
 def verify_database():
     """Verify database setup"""
     try:
-        connection = mysql.connector.connect(
-            host=DB_HOST,
-            user=DB_USER,
-            password=DB_PASSWORD,
-            database=DB_NAME
-        )
+        connection = get_pool(DB_HOST, DB_USER, DB_PASSWORD, DB_NAME).get_connection()
         
         cursor = connection.cursor()
         
@@ -216,35 +390,17 @@ def verify_database():
 def reset_database_for_tests():
     """Reset database dengan minimal data untuk testing"""
     try:
-        connection = mysql.connector.connect(
-            host=DB_HOST,
-            user=DB_USER,
-            password=DB_PASSWORD,
-            database=DB_NAME
-        )
+        repository = ContactRepository(lambda: get_pool(DB_HOST, DB_USER, DB_PASSWORD, DB_NAME).get_connection())
         
-        cursor = connection.cursor()
-        
-        # Clear existing contacts
+        # Clear existing contacts dan insert minimal test data (TRUNCATE: id mulai dari 1 lagi)
         print("Resetting database for testing...")
-        cursor.execute("TRUNCATE TABLE contacts")
-        
-        # Insert minimal test data
         test_contacts = [
             ('John Doe', 'john.doe@email.com', '08123456789', 'Software Engineer'),
             ('Jane Smith', 'jane.smith@email.com', '08987654321', 'Product Manager'),
             ('Bob Johnson', 'bob.johnson@email.com', '08111111111', 'QA Engineer'),
         ]
-        
-        for contact in test_contacts:
-            cursor.execute(
-                "INSERT INTO contacts (name, email, phone, title) VALUES (%s, %s, %s, %s)",
-                contact
-            )
-        
-        connection.commit()
-        cursor.close()
-        connection.close()
+        repository.replace_all(test_contacts, truncate=True)
+        repository.close()
         
         print(f"✓ Database reset with {len(test_contacts)} test contacts")
         return True
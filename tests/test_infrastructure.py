@@ -0,0 +1,199 @@
+"""
+test_infrastructure.py - Test untuk helper test suite DamnCRUD
+Loader damncrud.sql + migration, pool koneksi, ContactRepository, network shaping,
+duration scheduler dan load generator
+"""
+
+import pytest
+from selenium.webdriver.common.by import By
+from conftest import (
+    ADMIN_USERNAME,
+    BASE_URL,
+    DB_HOST,
+    DB_NAME,
+    DB_PASSWORD,
+    DB_PORT,
+    DB_USER,
+    TEST_CONTACTS,
+    get_db_connection,
+    get_server_connection,
+)
+from contacts_generator import make_contact
+from db_pool import ConnectionPool
+from duration_scheduler import build_units, lpt_assign
+from load_test import DEFAULT_MIX, LoadRunner, parse_mix
+from network_shaping import BLOCK_PRESETS, NETWORK_PROFILES, resolve_block_patterns
+from setup_db import apply_migrations, load_sql_file
+
+
+class TestDatabaseLoader:
+    """Load damncrud.sql + migration (tests/setup_db.py)"""
+
+    def test_second_load_after_migrations_is_noop(self):
+        """load_sql_file kedua (sesudah apply_migrations) tidak drop dan reload database"""
+        database = f"{DB_NAME}_loader"
+        connection = get_server_connection()
+        cursor = connection.cursor()
+        try:
+            assert load_sql_file(connection, database), "Load pertama harus membangun database"
+            assert apply_migrations(connection, database), "Migration belum diterapkan"
+            cursor.execute(f"SELECT loaded_at FROM `{database}`.schema_meta WHERE name = 'dump'")
+            loaded_at = cursor.fetchone()[0]
+
+            assert load_sql_file(connection, database) is False, "Load kedua tidak boleh reload"
+            assert apply_migrations(connection, database) == []
+            cursor.execute(f"SELECT loaded_at FROM `{database}`.schema_meta WHERE name = 'dump'")
+            assert cursor.fetchone()[0] == loaded_at
+        finally:
+            cursor.execute(f"DROP DATABASE IF EXISTS `{database}`")
+            cursor.close()
+            connection.close()
+
+        print(f"✓ {database}: load kedua di-skip (checksum cocok)")
+
+
+class TestConnectionPool:
+    """Pool koneksi bersama (tests/db_pool.py)"""
+
+    def test_release_restores_autocommit(self, db_pool):
+        """autocommit=True dari peminjam sebelumnya tidak bocor ke peminjam berikutnya"""
+        pool = ConnectionPool(size=1, host=DB_HOST, port=DB_PORT, user=DB_USER,
+                              password=DB_PASSWORD, database=DB_NAME)
+        try:
+            connection = pool.get_connection()
+            connection.autocommit = True
+            connection.close()
+
+            connection = pool.get_connection()
+            assert connection.autocommit is False, "autocommit bocor dari peminjam sebelumnya"
+            connection.close()
+            assert pool.stats['created'] == 1, "Koneksi yang sama harus dipakai ulang"
+        finally:
+            pool.close_all()
+
+        print("✓ Koneksi kembali ke pool dengan autocommit off")
+
+
+class TestContactRepository:
+    """Query batch dan wait_until pada tabel contacts (tests/contact_repository.py)"""
+
+    def test_batch_insert_lookup_and_count(self, contact_repository):
+        """insert_many satu round trip, lalu get/get_by_email/count membaca data yang sama"""
+        contacts = [make_contact(index, seed=21) for index in range(50)]
+        assert contact_repository.insert_many(contacts) == 50
+
+        assert contact_repository.count() == len(TEST_CONTACTS) + 50
+        assert contact_repository.count(email__in=[contact[1] for contact in contacts[:10]]) == 10
+
+        first = contact_repository.get_by_email(contacts[0][1])
+        assert first.name == contacts[0][0]
+        assert contact_repository.get(first.id) == first
+        assert contact_repository.get_user(ADMIN_USERNAME) is not None
+
+        with pytest.raises(ValueError):
+            contact_repository.count(password="x")
+
+        print("✓ ContactRepository: 50 contacts dalam satu executemany")
+
+
+    def test_wait_for_absent_after_delete(self, contact_repository):
+        """wait_for_absent selesai begitu row dihapus oleh koneksi lain"""
+        contact = contact_repository.get_by_email(TEST_CONTACTS[0][1])
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        cursor.execute("DELETE FROM contacts WHERE id = %s", (contact.id,))
+        connection.commit()
+        cursor.close()
+        connection.close()
+
+        assert contact_repository.wait_for_absent(id=contact.id, timeout=5)
+
+        print(f"✓ Kontak ID {contact.id} terdeteksi terhapus")
+
+
+class TestNetworkShaping:
+    """Test cases untuk blokir URL dan throttling lewat CDP (fixture browser)"""
+    
+    def test_block_presets_resolve_to_patterns(self):
+        """Preset dan pola langsung digabung tanpa duplikat"""
+        patterns = resolve_block_patterns("cdn,*.png,cdn")
+        assert patterns == BLOCK_PRESETS["cdn"] + ["*.png"]
+        assert set(BLOCK_PRESETS["cdn"]) <= set(resolve_block_patterns(["external"]))
+        
+        print(f"✓ Preset blokir menjadi {len(patterns)} pola")
+    
+    
+    @pytest.mark.network(block=["*asset.php*", "cdn"])
+    def test_blocked_assets_are_not_loaded(self, browser):
+        """Script yang diblokir tidak dimuat, halaman tetap tampil"""
+        browser.get(f"{BASE_URL}/login.php")
+        
+        assert browser.find_element(By.ID, "inputUsername")
+        assert browser.execute_script("return typeof window.jQuery") == "undefined", \
+            "jQuery tetap termuat walau asset diblokir"
+        
+        print("✓ Asset yang diblokir tidak dimuat")
+    
+    
+    @pytest.mark.network(profile="slow-3g")
+    def test_throttled_profile_adds_latency(self, browser):
+        """Profil slow-3g menambah latency ke TTFB halaman"""
+        browser.get(f"{BASE_URL}/login.php")
+        
+        ttfb = browser.execute_script(
+            "return performance.getEntriesByType('navigation')[0].responseStart"
+        )
+        assert ttfb >= NETWORK_PROFILES["slow-3g"]["latency"], f"TTFB {ttfb:.0f} ms tanpa throttling"
+        
+        print(f"✓ TTFB login.php dengan slow-3g: {ttfb:.0f} ms")
+
+
+class TestDurationScheduling:
+    """Test cases untuk pembagian test ke xdist worker berdasarkan history durasi"""
+    
+    def test_lpt_balances_and_groups_units(self):
+        """Test terlama dibagi dulu; test dengan fixture mahal yang sama tetap satu worker"""
+        collection = ["full_crud", "update", "delete", "tc008", "scale[a]", "scale[b]", "new"]
+        history = {
+            "full_crud": {"duration": 9.0},
+            "update": {"duration": 5.0},
+            "delete": {"duration": 4.0},
+            "tc008": {"duration": 1.0},
+            "scale[a]": {"duration": 2.0, "fixtures": ["synthetic_contacts=10000"]},
+            "scale[b]": {"duration": 2.0, "fixtures": ["synthetic_contacts=10000"]},
+        }
+        units = build_units(collection, history, group_fixtures=("synthetic_contacts",))
+        assert [4, 5] in [unit[1] for unit in units], "Test synthetic_contacts tidak digabung"
+        
+        bins = lpt_assign(units, 2)
+        loads = sorted(load for load, _ in bins)
+        assert loads == [13.0, 13.0], f"Pembagian LPT tidak seimbang: {loads}"
+        for _, assigned in bins:
+            estimates = [unit[0] for unit in assigned]
+            assert estimates == sorted(estimates, reverse=True), "Antrian worker tidak terlama dulu"
+        
+        print(f"✓ LPT: {len(units)} unit ke 2 worker dengan estimasi {loads}")
+
+
+@pytest.mark.http
+class TestLoadGenerator:
+    """Smoke test untuk load generator (tests/load_test.py)"""
+    
+    def test_short_load_run_reports_percentiles(self, contact_repository):
+        """Run singkat dengan semua operasi CRUD tanpa error dan contacts dibersihkan"""
+        runner = LoadRunner(BASE_URL, users=2, duration=2, mix=parse_mix(DEFAULT_MIX), seed=1)
+        report = runner.run()
+        
+        total = report["endpoints"]["total"]
+        assert total["requests"] > 0
+        assert total["errors"] == 0, f"Error saat load test: {report['endpoints']}"
+        assert total["p50_ms"] <= total["p95_ms"] <= total["p99_ms"] <= total["max_ms"]
+        
+        assert contact_repository.count(email__like="%@load.test") == 0, "Contacts load test tidak dibersihkan"
+        
+        print(f"✓ Load run: {total['requests']} requests, {total['throughput_rps']:.1f} rps, "
+              f"p95 {total['p95_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,136 @@
+"""
+waits.py - Library wait berbasis kondisi sebagai pengganti time.sleep
+
+Setiap wait melakukan polling dengan backoff eksponensial sampai kondisi
+terpenuhi atau timeout, dan mencatat berapa lama sebenarnya menunggu
+di WAIT_LOG (dipakai untuk laporan timing).
+"""
+import time
+from collections import namedtuple
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+DEFAULT_TIMEOUT = 10
+INITIAL_INTERVAL = 0.02
+MAX_INTERVAL = 0.5
+BACKOFF_FACTOR = 2
+
+TABLE_SELECTOR = '#employee'
+
+WaitRecord = namedtuple('WaitRecord', 'name elapsed polls success')
+
+# Semua wait yang sudah dijalankan di process (worker) ini
+WAIT_LOG = []
+
+
+def poll(condition, name, timeout=DEFAULT_TIMEOUT, ignored=(WebDriverException,)):
+    """
+    Panggil condition() sampai mengembalikan nilai truthy.
+    Interval dimulai dari INITIAL_INTERVAL dan dikali BACKOFF_FACTOR
+    sampai MAX_INTERVAL. Raise TimeoutException jika waktu habis.
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    interval = INITIAL_INTERVAL
+    polls = 0
+    last_error = None
+
+    while True:
+        polls += 1
+        try:
+            result = condition()
+            if result:
+                WAIT_LOG.append(WaitRecord(name, time.monotonic() - start, polls, True))
+                return result
+        except ignored as e:
+            last_error = e
+
+        now = time.monotonic()
+        if now >= deadline:
+            WAIT_LOG.append(WaitRecord(name, now - start, polls, False))
+            message = f"Wait '{name}' timeout setelah {timeout}s ({polls} polls)"
+            if last_error is not None:
+                message += f": {str(last_error)[:100]}"
+            raise TimeoutException(message)
+
+        time.sleep(min(interval, deadline - now))
+        interval = min(interval * BACKOFF_FACTOR, MAX_INTERVAL)
+
+
+# ===== Kondisi browser =====
+
+# Server-side processing: tunggu initComplete (data ajax pertama) dan tidak sedang processing
+_DATATABLE_READY_JS = """
+var sel = arguments[0];
+if (document.readyState !== 'complete' || !window.jQuery || !jQuery.fn.dataTable
+        || !jQuery.fn.dataTable.isDataTable(sel)) {
+    return false;
+}
+var settings = jQuery(sel).DataTable().settings()[0];
+return !!settings._bInitComplete && jQuery(sel + '_processing').css('display') === 'none';
+"""
+
+# Cari row di data DataTables (halaman yang sedang dimuat dari contacts_data.php)
+_FIND_ROW_JS = """
+var sel = arguments[0], col = arguments[1], value = arguments[2];
+var rows;
+if (window.jQuery && jQuery.fn.dataTable && jQuery.fn.dataTable.isDataTable(sel)) {
+    rows = jQuery(sel).DataTable().rows().data().toArray();
+} else {
+    rows = Array.prototype.map.call(
+        document.querySelectorAll(sel + ' tbody tr'),
+        function (tr) {
+            return Array.prototype.map.call(tr.cells, function (td) { return td.innerHTML; });
+        });
+}
+for (var i = 0; i < rows.length; i++) {
+    var cell = String(rows[i][col] || '').replace(/<[^>]*>/g, '').trim();
+    if (cell === value) { return true; }
+}
+return false;
+"""
+
+# Kolom tabel #employee: #, Name, Email, Phone, Title, Created, actions
+_ROW_COLUMNS = {'id': 0, 'name': 1, 'email': 2}
+
+
+def _row_lookup(id=None, name=None, email=None):
+    given = [(key, value) for key, value in (('id', id), ('name', name), ('email', email))
+             if value is not None]
+    if len(given) != 1:
+        raise ValueError("Berikan tepat satu dari id, name atau email")
+    key, value = given[0]
+    return key, _ROW_COLUMNS[key], str(value)
+
+
+def wait_for_datatable(driver, timeout=DEFAULT_TIMEOUT):
+    """Tunggu sampai DataTable di #employee selesai di-initialise"""
+    return poll(
+        lambda: driver.execute_script(_DATATABLE_READY_JS, TABLE_SELECTOR),
+        'datatable_ready', timeout,
+    )
+
+
+def wait_for_row(driver, id=None, name=None, email=None, present=True, timeout=DEFAULT_TIMEOUT):
+    """Tunggu sampai row dengan id/name/email tertentu ada (atau hilang) dari tabel"""
+    key, column, value = _row_lookup(id, name, email)
+    state = 'present' if present else 'absent'
+    return poll(
+        lambda: driver.execute_script(_FIND_ROW_JS, TABLE_SELECTOR, column, value) == present,
+        f'row_{state}[{key}={value}]', timeout,
+    )
+
+
+def wait_for_row_absent(driver, id=None, name=None, email=None, timeout=DEFAULT_TIMEOUT):
+    """Shortcut untuk wait_for_row(..., present=False)"""
+    return wait_for_row(driver, id=id, name=name, email=email, present=False, timeout=timeout)
+
+
+def wait_for_redirect_to_index(driver, timeout=DEFAULT_TIMEOUT):
+    """Tunggu sampai redirect ke index.php selesai dan dokumen sudah complete"""
+    return poll(
+        lambda: 'index.php' in driver.current_url
+        and driver.execute_script("return document.readyState") == 'complete',
+        'redirect_to_index', timeout,
+    )
+
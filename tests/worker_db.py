@@ -0,0 +1,116 @@
+"""
+worker_db.py - Database terisolasi per xdist worker
+
+Template database dibangun sekali dari db/damncrud.sql, lalu setiap worker
+(gw0, gw1, ...) mendapat clone sendiri, misalnya damncrud_gw0. Koordinasi
+antar worker memakai GET_LOCK() di MySQL, bukan lock file.
+"""
+import re
+import time
+
+from setup_db import SQL_FILE_PATH, apply_migrations, load_sql_file
+
+TEMPLATE_SUFFIX = 'template'
+LOCK_TIMEOUT = 60
+
+_VALID_NAME = re.compile(r'^[A-Za-z0-9_]+$')
+
+
+def worker_database_name(base_name, worker_id):
+    """Nama database untuk worker; tanpa xdist tetap memakai database asli"""
+    if not worker_id or worker_id == 'master':
+        return base_name
+    return f"{base_name}_{worker_id}"
+
+
+def template_database_name(base_name):
+    return f"{base_name}_{TEMPLATE_SUFFIX}"
+
+
+def _quote(name):
+    if not _VALID_NAME.match(name):
+        raise ValueError(f"Nama database tidak valid: {name}")
+    return f"`{name}`"
+
+
+def _table_names(cursor, database):
+    cursor.execute(
+        "SELECT table_name FROM information_schema.tables "
+        "WHERE table_schema = %s AND table_type = 'BASE TABLE'",
+        (database,)
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+class _ServerLock:
+    """Advisory lock di server MySQL (berlaku lintas process/worker)"""
+
+    def __init__(self, cursor, name):
+        self.cursor = cursor
+        self.name = name
+        # Detik yang dihabiskan menunggu worker lain melepas lock
+        self.waited = 0.0
+
+    def __enter__(self):
+        began = time.monotonic()
+        self.cursor.execute("SELECT GET_LOCK(%s, %s)", (self.name, LOCK_TIMEOUT))
+        acquired = self.cursor.fetchone()[0] == 1
+        self.waited = time.monotonic() - began
+        if not acquired:
+            raise TimeoutError(f"Tidak mendapat lock '{self.name}' dalam {LOCK_TIMEOUT}s")
+        return self
+
+    def __exit__(self, *exc):
+        self.cursor.execute("SELECT RELEASE_LOCK(%s)", (self.name,))
+        self.cursor.fetchone()
+
+
+def ensure_template(connection, template, sql_path=SQL_FILE_PATH, timings=None):
+    """
+    Bangun template database dari dump SQL (+ migration) jika belum ada atau berubah.
+    Jika timings (dict) diberikan, diisi 'lock_wait' dan 'build' dalam detik.
+    """
+    cursor = connection.cursor()
+    try:
+        with _ServerLock(cursor, f"{template}_build") as lock:
+            began = time.monotonic()
+            rebuilt = load_sql_file(connection, template, sql_path)
+            migrated = apply_migrations(connection, template)
+            if timings is not None:
+                timings.update(lock_wait=lock.waited, build=time.monotonic() - began)
+            if rebuilt:
+                print(f"[WorkerDB] Template '{template}' dibangun dari {sql_path}")
+            for migration in migrated:
+                print(f"[WorkerDB] Migration '{migration}' diterapkan ke '{template}'")
+            return rebuilt or bool(migrated)
+    finally:
+        cursor.close()
+
+
+def clone_database(connection, template, target):
+    """Buat ulang target sebagai salinan template (struktur + data)"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(f"DROP DATABASE IF EXISTS {_quote(target)}")
+        cursor.execute(f"CREATE DATABASE {_quote(target)}")
+        for table in _table_names(cursor, template):
+            cursor.execute(
+                f"CREATE TABLE {_quote(target)}.{_quote(table)} "
+                f"LIKE {_quote(template)}.{_quote(table)}"
+            )
+            cursor.execute(
+                f"INSERT INTO {_quote(target)}.{_quote(table)} "
+                f"SELECT * FROM {_quote(template)}.{_quote(table)}"
+            )
+        connection.commit()
+        print(f"[WorkerDB] Database '{target}' di-clone dari '{template}'")
+    finally:
+        cursor.close()
+
+
+def drop_database(connection, name):
+    cursor = connection.cursor()
+    try:
+        cursor.execute(f"DROP DATABASE IF EXISTS {_quote(name)}")
+    finally:
+        cursor.close()
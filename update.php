@@ -12,6 +12,7 @@ if (isset($_GET['id'])) {
         // Insert new record into the contacts table
         $stmt = $pdo->prepare('UPDATE contacts SET name = ?, email = ?, phone = ?, title = ? WHERE id = ?');
         $stmt->execute([$name, $email, $phone, $title, $_GET['id']]);
+        contacts_changed($pdo);
         header("location:index.php");
     }
 